@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
 
     'main',
@@ -142,6 +143,81 @@ REDIS_PORT = int(os.getenv('REDIS_PORT'))
 REDIS_DB = int(os.getenv('REDIS_DB'))
 
 
+# Pagination settings
+CV_PAGE_SIZE = int(os.getenv('CV_PAGE_SIZE', 20))
+CV_MAX_PAGE_SIZE = int(os.getenv('CV_MAX_PAGE_SIZE', 100))
+
+# Text search configuration used for the CV full-text index. Changing it
+# requires running `python manage.py rebuild_cv_search`.
+CV_SEARCH_CONFIG = os.getenv('CV_SEARCH_CONFIG', 'english')
+
+# Skill matching: weights of required and nice-to-have skills, and how
+# often (in seconds) the in-memory index checks for CVs changed elsewhere.
+SKILL_MATCH_REQUIRED_WEIGHT = float(
+    os.getenv('SKILL_MATCH_REQUIRED_WEIGHT', 2)
+)
+SKILL_MATCH_NICE_WEIGHT = float(os.getenv('SKILL_MATCH_NICE_WEIGHT', 1))
+SKILL_MATCH_SYNC_INTERVAL = float(os.getenv('SKILL_MATCH_SYNC_INTERVAL', 1))
+
+# Bulk CV upsert settings
+CV_BULK_MAX_ITEMS = int(os.getenv('CV_BULK_MAX_ITEMS', 1000))
+CV_BULK_BATCH_SIZE = int(os.getenv('CV_BULK_BATCH_SIZE', 500))
+
+
+# PDF rendering settings
+# Backend drawing CV PDFs: 'pisa' (HTML template) or 'reportlab' (direct).
+CV_PDF_BACKEND = os.getenv('CV_PDF_BACKEND', 'pisa')
+# Worker processes rendering PDFs; 0 renders inline in the calling process.
+# Every server process starts its own pool on its first render, so keep this
+# small when running several server workers.
+PDF_RENDERER_WORKERS = int(os.getenv('PDF_RENDERER_WORKERS', 2))
+PDF_RENDERER_QUEUE_SIZE = int(
+    os.getenv('PDF_RENDERER_QUEUE_SIZE', 4 * PDF_RENDERER_WORKERS)
+)
+PDF_RENDER_TIMEOUT = float(os.getenv('PDF_RENDER_TIMEOUT', 30))
+
+
+# Request logging settings
+REQUEST_LOG_BUFFERED = os.getenv('REQUEST_LOG_BUFFERED', 'False') == 'True'
+REQUEST_LOG_BUFFER_SIZE = int(os.getenv('REQUEST_LOG_BUFFER_SIZE', 100))
+REQUEST_LOG_FLUSH_INTERVAL = float(
+    os.getenv('REQUEST_LOG_FLUSH_INTERVAL', 5)
+)
+REQUEST_LOG_BUFFER_MAX_PENDING = int(
+    os.getenv('REQUEST_LOG_BUFFER_MAX_PENDING', 10000)
+)
+# RequestLog is partitioned by month; keep this many full months of history
+# and have partitions ready this many months ahead.
+REQUEST_LOG_RETENTION_MONTHS = int(
+    os.getenv('REQUEST_LOG_RETENTION_MONTHS', 6)
+)
+REQUEST_LOG_PARTITIONS_AHEAD = int(
+    os.getenv('REQUEST_LOG_PARTITIONS_AHEAD', 3)
+)
+
+
+# Cache settings
+PDF_CACHE_MAX_ENTRIES = int(os.getenv('PDF_CACHE_MAX_ENTRIES', 256))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Rendered CV PDFs keyed by content fingerprint. LocMemCache keeps keys
+    # in LRU order, and culling one entry at a time makes it a strict
+    # size-bounded LRU.
+    'pdf': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'cv-pdf',
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': PDF_CACHE_MAX_ENTRIES,
+            'CULL_FREQUENCY': PDF_CACHE_MAX_ENTRIES,
+        },
+    },
+}
+
+
 # Celery settings
 CELERY_BROKER_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 CELERY_RESULT_BACKEND = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
@@ -151,6 +227,32 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
+CELERY_BEAT_SCHEDULE = {
+    'maintain-request-log-partitions': {
+        'task': 'audit.tasks.maintain_request_log_partitions_task',
+        'schedule': 24 * 60 * 60,  # daily
+    },
+    'prune-translation-jobs': {
+        'task': 'main.tasks.prune_translation_jobs_task',
+        'schedule': 60 * 60,  # hourly
+    },
+}
+
+
+# Logging: messages of the main app go to the console at LOG_LEVEL.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'main': {
+            'handlers': ['console'],
+            'level': os.getenv('LOG_LEVEL', 'INFO'),
+        },
+    },
+}
 
 
 # Email settings
@@ -159,5 +261,26 @@ DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL')
 
 
 # Generative AI settings
+# Translation backend: 'gemini', or 'fake' for an offline stand-in that
+# answers after TRANSLATION_FAKE_LATENCY seconds.
+TRANSLATION_BACKEND = os.getenv('TRANSLATION_BACKEND', 'gemini')
+TRANSLATION_FAKE_LATENCY = float(os.getenv('TRANSLATION_FAKE_LATENCY', 0))
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
+GEMINI_TIMEOUT = float(os.getenv('GEMINI_TIMEOUT', 60))
+GEMINI_MAX_RETRIES = int(os.getenv('GEMINI_MAX_RETRIES', 3))
+GEMINI_RETRY_BACKOFF = float(os.getenv('GEMINI_RETRY_BACKOFF', 1))
+GEMINI_MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', 4))
+TRANSLATION_CACHE_TTL = int(
+    os.getenv('TRANSLATION_CACHE_TTL', 7 * 24 * 60 * 60)  # 7 days
+)
+# Threads translating one CV into several languages at once, and the most
+# languages a single ZIP request may ask for.
+TRANSLATION_FANOUT_WORKERS = int(os.getenv('TRANSLATION_FANOUT_WORKERS', 4))
+TRANSLATION_FANOUT_MAX_LANGUAGES = int(
+    os.getenv('TRANSLATION_FANOUT_MAX_LANGUAGES', 10)
+)
+# Finished translation jobs, with their PDFs, are deleted after this long.
+TRANSLATION_JOB_RETENTION_HOURS = float(
+    os.getenv('TRANSLATION_JOB_RETENTION_HOURS', 24)
+)
@@ -0,0 +1,150 @@
+from django.db import DataError, IntegrityError, close_old_connections
+from audit.models import RequestLog
+from django.conf import settings
+import threading
+import atexit
+import time
+
+
+class RequestLogBuffer:
+    """In-process queue of RequestLog rows written with `bulk_create`.
+
+    Records are flushed once `max_size` of them are queued or
+    `flush_interval` seconds have passed since the last flush, and once more
+    when the process exits. A daemon thread, started with the first record,
+    checks the interval so that records are written even when no further
+    requests arrive. If the database rejects a flush, the records are
+    put back and retried after `flush_interval`; only when more than
+    `max_pending` records pile up are the oldest ones dropped, and every
+    drop is reported and counted.
+    """
+
+    def __init__(self, max_size=100, flush_interval=5.0, max_pending=10000):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.flushed = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+        self._records = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._retry_after = 0.0
+        self._timer = None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._records)
+
+    def add(self, record):
+        """Queues a RequestLog instance, flushing if a threshold is hit."""
+        now = time.monotonic()
+        with self._lock:
+            self._records.append(record)
+            due = now >= self._retry_after and (
+                len(self._records) >= self.max_size
+                or now - self._last_flush >= self.flush_interval
+            )
+            if self._timer is None:
+                self._timer = threading.Thread(
+                    target=self._run_timer, name='request-log-flush',
+                    daemon=True,
+                )
+                self._timer.start()
+        if due:
+            self.flush(blocking=False)
+
+    def _run_timer(self):
+        """Flushes records that waited `flush_interval` seconds."""
+        while True:
+            time.sleep(self.flush_interval)
+            now = time.monotonic()
+            with self._lock:
+                due = self._records and now >= self._retry_after and (
+                    now - self._last_flush >= self.flush_interval
+                )
+            if due:
+                close_old_connections()
+                self.flush(blocking=False)
+                close_old_connections()
+
+    def flush(self, blocking=True):
+        """Writes queued records to the database.
+
+        Returns the number of records written. With `blocking=False` the
+        call returns immediately if another thread is already flushing.
+        """
+        if not self._flush_lock.acquire(blocking=blocking):
+            return 0
+        try:
+            with self._lock:
+                records, self._records = self._records, []
+                self._last_flush = time.monotonic()
+            if not records:
+                return 0
+            written = self._write(records)
+            self.flushed += written
+            return written
+        finally:
+            self._flush_lock.release()
+
+    def stats(self):
+        """Returns the buffer depth and lifetime counters."""
+        return {
+            'depth': len(self),
+            'max_size': self.max_size,
+            'flushed': self.flushed,
+            'dropped': self.dropped,
+            'failed_flushes': self.failed_flushes,
+        }
+
+    def _write(self, records):
+        try:
+            RequestLog.objects.bulk_create(records, batch_size=self.max_size)
+            return len(records)
+        except (DataError, IntegrityError) as e:
+            print(f"Bulk insert of {len(records)} request logs failed: {e}")
+            return self._write_one_by_one(records)
+        except Exception as e:
+            print(f"Failed to flush {len(records)} request logs: {e}")
+            self._requeue(records)
+            return 0
+
+    def _write_one_by_one(self, records):
+        """Isolates rows the database refuses so they can't block others."""
+        written = 0
+        for index, record in enumerate(records):
+            try:
+                record.save(force_insert=True)
+                written += 1
+            except (DataError, IntegrityError) as e:
+                self.dropped += 1
+                print(f"Dropped invalid request log '{record}': {e}")
+            except Exception as e:
+                print(f"Failed to flush request logs: {e}")
+                self._requeue(records[index:])
+                break
+        return written
+
+    def _requeue(self, records):
+        with self._lock:
+            self.failed_flushes += 1
+            self._retry_after = time.monotonic() + self.flush_interval
+            self._records = records + self._records
+            overflow = len(self._records) - self.max_pending
+            if overflow > 0:
+                del self._records[:overflow]
+                self.dropped += overflow
+                print(
+                    f"Request log buffer is full, dropped {overflow} oldest "
+                    f"records."
+                )
+
+
+request_log_buffer = RequestLogBuffer(
+    max_size=settings.REQUEST_LOG_BUFFER_SIZE,
+    flush_interval=settings.REQUEST_LOG_FLUSH_INTERVAL,
+    max_pending=settings.REQUEST_LOG_BUFFER_MAX_PENDING,
+)
+atexit.register(request_log_buffer.flush)
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from audit.partitions import is_partitioned, maintain_partitions
+from django.conf import settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates upcoming monthly RequestLog partitions and drops the ones "
+        "older than the retention window."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=settings.REQUEST_LOG_PARTITIONS_AHEAD,
+            help="Number of future months to create partitions for.",
+        )
+        parser.add_argument(
+            '--retention-months',
+            type=int,
+            default=settings.REQUEST_LOG_RETENTION_MONTHS,
+            help="Number of past months to keep.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            raise CommandError(
+                "The RequestLog table is not partitioned. Partitioning "
+                "requires PostgreSQL."
+            )
+
+        created, dropped = maintain_partitions(
+            months_ahead=options['months_ahead'],
+            retention_months=options['retention_months'],
+        )
+        for name in created:
+            self.stdout.write(f"Created partition {name}")
+        for name in dropped:
+            self.stdout.write(f"Dropped partition {name}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(created)} partition(s) created, "
+            f"{len(dropped)} dropped."
+        ))
@@ -1,22 +1,36 @@
+from audit.buffer import request_log_buffer
 from audit.models import RequestLog
+from django.conf import settings
 
 
 class RequestLoggingMiddleware:
+    """Records every incoming request as a RequestLog row.
+
+    With `REQUEST_LOG_BUFFERED` enabled, rows are queued in-process and
+    written in batches by `audit.buffer.request_log_buffer` instead of one
+    INSERT per request.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.buffered = settings.REQUEST_LOG_BUFFERED
 
     def __call__(self, request):
         try:
             user = request.user if request.user.is_authenticated else None
             query_params = request.GET.urlencode()
 
-            RequestLog.objects.create(
-                method=request.method,
-                path=request.path,
+            log = RequestLog(
+                method=request.method[:10],
+                path=request.path[:2048],
                 query_string=query_params if query_params else None,
                 ip_address=self.get_client_ip(request),
                 user=user
             )
+            if self.buffered:
+                request_log_buffer.add(log)
+            else:
+                log.save(force_insert=True)
         except Exception:
             pass
 
@@ -0,0 +1,195 @@
+from datetime import UTC, datetime
+
+from django.db import migrations, models, transaction
+from django.utils import timezone
+
+PARTITIONS_AHEAD = 3
+# Rows copied into the partitioned table per transaction.
+COPY_BATCH_SIZE = 10000
+
+
+def _month_index(value):
+    return value.year * 12 + value.month - 1
+
+
+def _month_bounds(index):
+    start = datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+    end = datetime((index + 1) // 12, (index + 1) % 12 + 1, 1, tzinfo=UTC)
+    return start, end
+
+
+def partition_requestlog(apps, schema_editor):
+    """Rebuilds audit_requestlog as a table range-partitioned by month.
+
+    The table is swapped for an empty partitioned one in a short
+    transaction. Existing rows are then copied over in batches of
+    COPY_BATCH_SIZE, each committed on its own, so the log is never locked
+    for the whole copy. New requests are logged into the new table
+    meanwhile; until the copy finishes, older rows are missing from reads.
+    If the copy is interrupted, finish it by hand from
+    audit_requestlog_unpartitioned before migrating again.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with transaction.atomic(using=schema_editor.connection.alias):
+        max_id = _swap_in_partitioned_table(apps, schema_editor)
+    _copy_rows(apps, schema_editor, max_id)
+
+
+def _swap_in_partitioned_table(apps, schema_editor):
+    """Renames the old table aside and creates the partitioned one.
+
+    Returns:
+        int | None: The largest id in the old table.
+    """
+    RequestLog = apps.get_model('audit', 'RequestLog')
+    User = RequestLog._meta.get_field('user').related_model
+    table = RequestLog._meta.db_table
+    old = f'{table}_unpartitioned'
+    execute = schema_editor.execute
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(timestamp), MAX(id) FROM {table}")
+        first_timestamp, max_id = cursor.fetchone()
+
+    execute(f"ALTER TABLE {table} RENAME TO {old}")
+    # Keep the old primary key index for the batched copy, under a name
+    # that does not clash with the new table's.
+    execute(
+        f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey"
+    )
+    # Left behind by unpartition_requestlog when migrating back and forth.
+    execute(f"ALTER TABLE {old} DROP CONSTRAINT IF EXISTS {table}_user_id_fk")
+    execute(f"DROP INDEX IF EXISTS {table}_user_id_idx")
+    execute(f"ALTER TABLE {old} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+    execute(
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) "
+        f"PARTITION BY RANGE (timestamp)"
+    )
+    execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    if max_id is not None:
+        execute(f"SELECT setval('{table}_id_seq', %s)", [max_id])
+    execute(
+        f"ALTER TABLE {table} "
+        f"ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')"
+    )
+    # The partition key has to be part of the primary key.
+    execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, timestamp)")
+    execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    now_index = _month_index(timezone.now())
+    first_index = (
+        _month_index(first_timestamp) if first_timestamp else now_index
+    )
+    for index in range(first_index, now_index + PARTITIONS_AHEAD + 1):
+        start, end = _month_bounds(index)
+        execute(
+            f"CREATE TABLE {table}_p{start:%Y%m} PARTITION OF {table} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start, end]
+        )
+
+    return max_id
+
+
+def _copy_rows(apps, schema_editor, max_id):
+    """Moves the old rows into the partitioned table batch by batch."""
+    RequestLog = apps.get_model('audit', 'RequestLog')
+    User = RequestLog._meta.get_field('user').related_model
+    table = RequestLog._meta.db_table
+    old = f'{table}_unpartitioned'
+    alias = schema_editor.connection.alias
+    execute = schema_editor.execute
+
+    last_id = 0
+    while max_id is not None and last_id < max_id:
+        with transaction.atomic(using=alias):
+            with schema_editor.connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT MAX(id) FROM (SELECT id FROM {old} "
+                    f"WHERE id > %s ORDER BY id LIMIT %s) AS batch",
+                    [last_id, COPY_BATCH_SIZE]
+                )
+                batch_end = cursor.fetchone()[0]
+            execute(
+                f"INSERT INTO {table} SELECT * FROM {old} "
+                f"WHERE id > %s AND id <= %s",
+                [last_id, batch_end]
+            )
+        last_id = batch_end
+    execute(f"DROP TABLE {old}")
+    # Added after the copy so existing rows are validated right away instead
+    # of queueing deferred trigger events that would block CREATE INDEX.
+    execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fk "
+        f"FOREIGN KEY (user_id) REFERENCES {User._meta.db_table} "
+        f"({User._meta.pk.column}) DEFERRABLE INITIALLY DEFERRED"
+    )
+    execute(f"CREATE INDEX {table}_user_id_idx ON {table} (user_id)")
+
+
+def unpartition_requestlog(apps, schema_editor):
+    """Turns audit_requestlog back into a regular table.
+
+    Unlike the forward migration, this copies every row in one
+    transaction and locks the log until it is done; prune old partitions
+    first or plan downtime on a large log.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with transaction.atomic(using=schema_editor.connection.alias):
+        _unpartition(apps, schema_editor)
+
+
+def _unpartition(apps, schema_editor):
+    RequestLog = apps.get_model('audit', 'RequestLog')
+    User = RequestLog._meta.get_field('user').related_model
+    table = RequestLog._meta.db_table
+    old = f'{table}_partitioned'
+    execute = schema_editor.execute
+
+    execute(f"ALTER TABLE {table} RENAME TO {old}")
+    execute(f"ALTER TABLE {old} DROP CONSTRAINT {table}_pkey")
+    execute(f"ALTER TABLE {old} DROP CONSTRAINT {table}_user_id_fk")
+    execute(f"DROP INDEX {table}_user_id_idx")
+    execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    execute(f"ALTER SEQUENCE {table}_id_seq RENAME TO {old}_id_seq")
+    execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)")
+    execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    execute(f"DROP TABLE {old}")
+    execute(f"DROP SEQUENCE {old}_id_seq")
+    execute(
+        f"ALTER TABLE {table} ALTER COLUMN id "
+        f"ADD GENERATED BY DEFAULT AS IDENTITY"
+    )
+    execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+    )
+    execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+    execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fk "
+        f"FOREIGN KEY (user_id) REFERENCES {User._meta.db_table} "
+        f"({User._meta.pk.column}) DEFERRABLE INITIALLY DEFERRED"
+    )
+    execute(f"CREATE INDEX {table}_user_id_idx ON {table} (user_id)")
+
+
+class Migration(migrations.Migration):
+    # Rows are copied in separately committed batches.
+    atomic = False
+
+    dependencies = [
+        ('audit', '0002_requestlog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            partition_requestlog, unpartition_requestlog, atomic=False
+        ),
+        migrations.AddIndex(
+            model_name='requestlog',
+            index=models.Index(fields=['-timestamp'], name='audit_reqlog_ts_idx'),
+        ),
+    ]
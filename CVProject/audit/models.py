@@ -1,9 +1,11 @@
+from django.utils import timezone
 from django.conf import settings
 from django.db import models
 
 
 class RequestLog(models.Model):
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Stamped when the request arrives, not when a buffered batch is saved.
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     method = models.CharField(max_length=10)
     path = models.CharField(max_length=2048)
     query_string = models.TextField(null=True, blank=True)
@@ -22,3 +24,8 @@ class RequestLog(models.Model):
         verbose_name = "Request Log"
         verbose_name_plural = "Request Logs"
         ordering = ['-timestamp']
+        # The table itself is range-partitioned by month on `timestamp`
+        # (see migration 0003 and audit.partitions).
+        indexes = [
+            models.Index(fields=['-timestamp'], name='audit_reqlog_ts_idx'),
+        ]
@@ -0,0 +1,162 @@
+from django.db import connection, transaction
+from audit.models import RequestLog
+from django.utils import timezone
+from django.conf import settings
+from datetime import UTC, date, datetime
+import re
+
+TABLE = RequestLog._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+PARTITION_RE = re.compile(rf'^{TABLE}_p(\d{{4}})(\d{{2}})$')
+
+
+def month_start(value):
+    """Returns the first day of the month `value` falls in."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    """Shifts a first-of-month date by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month):
+    """Returns the [start, end) UTC datetimes of a monthly partition."""
+    start = datetime(month.year, month.month, 1, tzinfo=UTC)
+    end_month = add_months(month, 1)
+    end = datetime(end_month.year, end_month.month, 1, tzinfo=UTC)
+    return start, end
+
+
+def partition_name(month):
+    return f'{TABLE}_p{month:%Y%m}'
+
+
+def is_partitioned():
+    """Tells whether the RequestLog table is a PostgreSQL partitioned table."""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s",
+            [TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions():
+    """Returns the monthly partitions as a sorted list of (month, name)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s",
+            [TABLE]
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_RE.match(name)
+        if match:
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            partitions.append((month, name))
+    return sorted(partitions)
+
+
+def create_partition(month):
+    """Creates the partition holding `month`.
+
+    Rows of that month that already landed in the default partition are
+    moved into the new partition in the same transaction.
+    """
+    name = partition_name(month)
+    start, end = month_bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+            f"WHERE timestamp >= %s AND timestamp < %s)",
+            [start, end]
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(
+                f"CREATE TABLE {name} PARTITION OF {TABLE} "
+                f"FOR VALUES FROM (%s) TO (%s)",
+                [start, end]
+            )
+            return name
+
+        cursor.execute(
+            f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE timestamp >= %s AND timestamp < %s RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+            [start, end]
+        )
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start, end]
+        )
+    return name
+
+
+def ensure_partitions(months_ahead=None, today=None):
+    """Creates missing partitions from the current month onwards.
+
+    Returns the names of the partitions that were created.
+    """
+    if months_ahead is None:
+        months_ahead = settings.REQUEST_LOG_PARTITIONS_AHEAD
+    current = month_start(today or timezone.now())
+    existing = {month for month, _ in list_partitions()}
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            created.append(create_partition(month))
+    return created
+
+
+def drop_expired_partitions(retention_months=None, today=None):
+    """Drops partitions that lie entirely outside the retention window.
+
+    Each expired month costs a single DROP TABLE regardless of its size.
+    Expired rows that ended up in the default partition are deleted too.
+    Returns the names of the dropped partitions.
+    """
+    if retention_months is None:
+        retention_months = settings.REQUEST_LOG_RETENTION_MONTHS
+    current = month_start(today or timezone.now())
+    cutoff = add_months(current, -retention_months)
+    cutoff_start, _ = month_bounds(cutoff)
+
+    dropped = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for month, name in list_partitions():
+            if month < cutoff:
+                cursor.execute(f"DROP TABLE {name}")
+                dropped.append(name)
+        cursor.execute(
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE timestamp < %s",
+            [cutoff_start]
+        )
+    return dropped
+
+
+def maintain_partitions(months_ahead=None, retention_months=None):
+    """Creates upcoming partitions and drops expired ones.
+
+    Returns a `(created, dropped)` tuple of partition names. Does nothing
+    when the table is not partitioned (e.g. on a non-PostgreSQL database).
+    """
+    if not is_partitioned():
+        return [], []
+    created = ensure_partitions(months_ahead)
+    dropped = drop_expired_partitions(retention_months)
+    return created, dropped
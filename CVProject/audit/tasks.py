@@ -0,0 +1,15 @@
+from audit.partitions import maintain_partitions
+from celery import shared_task
+
+
+@shared_task
+def maintain_request_log_partitions_task():
+    """
+    Creates upcoming RequestLog partitions and drops expired ones.
+    """
+    created, dropped = maintain_partitions()
+    print(
+        f"RequestLog partitions created: {created or 'none'}; "
+        f"dropped: {dropped or 'none'}"
+    )
+    return {'created': created, 'dropped': dropped}
@@ -1,8 +1,15 @@
 from django.contrib.auth.models import AnonymousUser
+from django.db import OperationalError, connection
+from django.core.management import call_command
+from audit.buffer import RequestLogBuffer
 from audit.models import RequestLog
 from django.utils import timezone
 from django.urls import reverse
+from datetime import timedelta
+from audit import partitions
+from io import StringIO
 import pytest
+import time
 
 pytestmark = pytest.mark.django_db
 
@@ -110,3 +117,170 @@ class TestRequestLogMiddleware:
         log = RequestLog.objects.last()
         assert 'q=test' in log.query_string
         assert 'limit=10' in log.query_string
+
+
+@pytest.fixture
+def log_buffer(monkeypatch):
+    """
+    Fixture to provide the shared request log buffer with thresholds high
+    enough that nothing is flushed unless a test asks for it.
+    """
+    from audit.buffer import request_log_buffer
+
+    monkeypatch.setattr(request_log_buffer, 'max_size', 1000)
+    monkeypatch.setattr(request_log_buffer, 'flush_interval', 3600)
+    monkeypatch.setattr(request_log_buffer, '_last_flush', time.monotonic())
+    yield request_log_buffer
+    request_log_buffer._records.clear()
+
+
+class TestBufferedRequestLogging:
+    def test_requests_are_queued_until_flush(
+        self, client, settings, log_buffer
+    ):
+        settings.REQUEST_LOG_BUFFERED = True
+        client.get('/example-a/')
+        client.get('/example-b/')
+
+        assert RequestLog.objects.count() == 0
+        assert log_buffer.stats()['depth'] == 2
+
+        assert log_buffer.flush() == 2
+        assert RequestLog.objects.count() == 2
+        assert log_buffer.stats()['depth'] == 0
+
+    def test_timestamp_is_taken_at_request_time(
+        self, client, settings, log_buffer
+    ):
+        settings.REQUEST_LOG_BUFFERED = True
+        before = timezone.now()
+        client.get('/example/')
+        log_buffer.flush()
+
+        assert RequestLog.objects.get().timestamp >= before
+
+    def test_recent_logs_view_flushes_buffer(
+        self, client, settings, log_buffer
+    ):
+        settings.REQUEST_LOG_BUFFERED = True
+        url = reverse('audit:recent_logs')
+        response = client.get(url)
+
+        assert [log.path for log in response.context['logs']] == [url]
+
+    def test_flushes_when_size_threshold_is_reached(self):
+        buffer = RequestLogBuffer(max_size=3, flush_interval=3600)
+        for i in range(3):
+            buffer.add(RequestLog(method='GET', path=f'/p-{i}/'))
+
+        assert RequestLog.objects.count() == 3
+        assert len(buffer) == 0
+
+    def test_timer_flushes_when_requests_stop(self, monkeypatch):
+        buffer = RequestLogBuffer(max_size=100, flush_interval=0.1)
+        written = []
+
+        def write(records):
+            # The timer thread has its own connection, outside the test's
+            # transaction, so record the writes instead of inserting rows.
+            written.extend(records)
+            return len(records)
+
+        monkeypatch.setattr(buffer, '_write', write)
+        buffer.add(RequestLog(method='GET', path='/quiet/'))
+
+        deadline = time.monotonic() + 5
+        while len(buffer) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert [record.path for record in written] == ['/quiet/']
+
+    def test_failed_flush_keeps_records(self, monkeypatch):
+        buffer = RequestLogBuffer(max_size=10, flush_interval=3600)
+        buffer.add(RequestLog(method='GET', path='/kept/'))
+
+        def fail(*args, **kwargs):
+            raise OperationalError("database is down")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(RequestLog.objects, 'bulk_create', fail)
+            assert buffer.flush() == 0
+
+        assert buffer.stats()['depth'] == 1
+        assert buffer.stats()['failed_flushes'] == 1
+        assert buffer.flush() == 1
+        assert RequestLog.objects.filter(path='/kept/').exists()
+
+    def test_overflow_drops_oldest_and_counts(self, monkeypatch):
+        buffer = RequestLogBuffer(
+            max_size=10, flush_interval=3600, max_pending=2
+        )
+        for i in range(3):
+            buffer._records.append(RequestLog(method='GET', path=f'/p-{i}/'))
+
+        def fail(*args, **kwargs):
+            raise OperationalError("database is down")
+
+        monkeypatch.setattr(RequestLog.objects, 'bulk_create', fail)
+        buffer.flush()
+
+        assert buffer.dropped == 1
+        assert [r.path for r in buffer._records] == ['/p-1/', '/p-2/']
+
+    def test_buffer_stats_view(self, client):
+        response = client.get(reverse('audit:log_buffer_stats'))
+        assert response.status_code == 200
+        assert 'depth' in response.json()
+
+
+class TestRequestLogPartitions:
+    def test_table_is_partitioned(self):
+        assert partitions.is_partitioned()
+
+    def test_ensure_creates_upcoming_partitions(self):
+        today = timezone.now()
+        partitions.ensure_partitions(months_ahead=5, today=today)
+
+        months = [month for month, _ in partitions.list_partitions()]
+        current = partitions.month_start(today)
+        for offset in range(6):
+            assert partitions.add_months(current, offset) in months
+
+    def test_rows_in_default_partition_are_moved(self):
+        old = timezone.now() - timedelta(days=3 * 365)
+        log = RequestLog.objects.create(
+            timestamp=old, method='GET', path='/old/'
+        )
+        name = partitions.create_partition(partitions.month_start(old))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT id FROM {name}")
+            assert cursor.fetchall() == [(log.id,)]
+
+    def test_drop_expired_partitions(self):
+        today = timezone.now()
+        expired = partitions.add_months(partitions.month_start(today), -12)
+        partitions.create_partition(expired)
+        RequestLog.objects.create(
+            timestamp=partitions.month_bounds(expired)[0],
+            method='GET',
+            path='/expired/'
+        )
+        RequestLog.objects.create(method='GET', path='/recent/')
+        # Fire the deferred FK checks of the rows inserted by this test's
+        # transaction; a pending trigger would block the DROP TABLE.
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+        dropped = partitions.drop_expired_partitions(
+            retention_months=6, today=today
+        )
+
+        assert partitions.partition_name(expired) in dropped
+        assert list(RequestLog.objects.values_list('path', flat=True)) == [
+            '/recent/'
+        ]
+
+    def test_management_command(self):
+        out = StringIO()
+        call_command('maintain_request_log_partitions', stdout=out)
+        assert "partition(s) created" in out.getvalue()
@@ -5,5 +5,10 @@ app_name = 'audit'
 
 urlpatterns = [
     path('logs/', views.recent_logs_view, name='recent_logs'),
+    path(
+        'logs/buffer/',
+        views.log_buffer_stats_view,
+        name='log_buffer_stats'
+    ),
     path('settings/', views.display_settings_view, name='display_settings'),
 ]
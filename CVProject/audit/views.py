@@ -1,4 +1,6 @@
+from audit.buffer import request_log_buffer
 from django.shortcuts import render
+from django.http import JsonResponse
 from audit.models import RequestLog
 
 
@@ -15,6 +17,8 @@ def recent_logs_view(request):
     Returns:
         HttpResponse: The HTTP response rendered with the recent logs.
     """
+    # Make buffered entries, including this request's, visible first.
+    request_log_buffer.flush()
     logs = RequestLog.objects.order_by('-timestamp')[:10]
     context = {
         'logs': logs
@@ -35,3 +39,18 @@ def display_settings_view(request):
         HttpResponse: The HTTP response rendered with the site settings.
     """
     return render(request, 'audit/display_settings.html')
+
+
+def log_buffer_stats_view(request):
+    """
+    Handles reporting the state of the buffered request log writer.
+    Returns the current buffer depth together with flushed, dropped and
+    failed flush counters of this process as JSON.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        JsonResponse: The buffer statistics.
+    """
+    return JsonResponse(request_log_buffer.stats())
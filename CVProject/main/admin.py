@@ -1,6 +1,16 @@
-from main.models import CV, Project, Skill
+from main.models import (
+    CV,
+    CVTranslation,
+    Project,
+    Skill,
+    TranslationJob,
+    TranslationSegment,
+)
 from django.contrib import admin
 
 admin.site.register(Project)
 admin.site.register(Skill)
 admin.site.register(CV)
+admin.site.register(CVTranslation)
+admin.site.register(TranslationJob)
+admin.site.register(TranslationSegment)
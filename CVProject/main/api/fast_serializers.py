@@ -0,0 +1,50 @@
+# Response fields of a CV, in CVSerializer order.
+CV_API_FIELDS = (
+    'id', 'firstname', 'lastname', 'skills', 'bio', 'contacts', 'projects'
+)
+# Columns the response is built from; `document` holds skills and projects.
+CV_VALUE_FIELDS = (
+    'id', 'firstname', 'lastname', 'bio', 'contacts', 'document'
+)
+DOCUMENT_FIELDS = ('skills', 'projects')
+PROJECT_VALUE_FIELDS = ('id', 'name', 'description', 'link')
+
+
+def serialize_cv_rows(rows, fields=CV_API_FIELDS):
+    """Builds CV API representations straight from `values()` rows.
+
+    Produces the same dicts as `CVSerializer(many=True).data` for CVs
+    whose skills and projects are ordered by id, without the serializer
+    field machinery. Skills and projects come from the `document` column,
+    so no related rows are queried.
+
+    Args:
+        rows (Iterable[dict]): CV rows with the requested
+            `CV_VALUE_FIELDS`, plus `document` when skills or projects
+            are requested.
+        fields (Collection[str]): The `CV_API_FIELDS` to include.
+
+    Returns:
+        list[dict]: One representation per row, in the same order.
+    """
+    fields = [field for field in CV_API_FIELDS if field in fields]
+    return [
+        {
+            field: (
+                _document_field(row['document'], field)
+                if field in DOCUMENT_FIELDS else row[field]
+            )
+            for field in fields
+        }
+        for row in rows
+    ]
+
+
+def _document_field(document, field):
+    if field == 'skills':
+        return [skill['id'] for skill in document.get('skills', [])]
+    # jsonb does not keep key order; restore the serializer's.
+    return [
+        {key: project[key] for key in PROJECT_VALUE_FIELDS}
+        for project in document.get('projects', [])
+    ]
@@ -0,0 +1,93 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from main.services.search import search_cvs
+from main.models import Skill
+
+
+# Largest id the `integer[]` skill_ids column can hold.
+MAX_SKILL_ID = 2 ** 31 - 1
+
+
+def skill_param_values(request, param):
+    """Returns the comma-separated values of a skill query parameter."""
+    return [
+        value.strip()
+        for value in request.query_params.get(param, '').split(',')
+        if value.strip()
+    ]
+
+
+def resolve_skill_values(values):
+    """Splits skill ids from names and looks the names up in one query.
+
+    Values made of digits are ids; everything else is a name.
+
+    Returns:
+        tuple: The set of skill ids and the set of unknown names.
+
+    Raises:
+        ValueError: If an id is not an ASCII number up to MAX_SKILL_ID.
+    """
+    numbers = [value for value in values if value.isdigit()]
+    invalid = [
+        value for value in numbers
+        if not value.isascii() or int(value) > MAX_SKILL_ID
+    ]
+    if invalid:
+        raise ValueError(f"Invalid skill ids: {', '.join(invalid)}.")
+    ids = {int(value) for value in numbers}
+    names = {value for value in values if not value.isdigit()}
+    if not names:
+        return ids, set()
+    found = dict(
+        Skill.objects.filter(name__in=names).values_list('name', 'id')
+    )
+    return ids | set(found.values()), names - set(found)
+
+
+class CVSearchFilter(BaseFilterBackend):
+    """
+    Narrows CVs to those matching the `?q=` full-text query.
+
+    The query uses web-search syntax (quoted phrases, `or`, `-word`) over
+    names, bio, skills and projects. Matches are annotated with their
+    `rank`; ordering is left to the view.
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, '').strip()
+        if not text:
+            return queryset
+        return search_cvs(queryset, text)
+
+
+class CVSkillFilter(BaseFilterBackend):
+    """
+    Filters CVs by skills: `?skills_all=` keeps CVs having every listed
+    skill, `?skills_any=` those having at least one.
+
+    Both take comma-separated skill ids or names and query the GIN-indexed
+    `CV.skill_ids` array (`@>` and `&&`) instead of joining the m2m table.
+    """
+    all_param = 'skills_all'
+    any_param = 'skills_any'
+
+    def filter_queryset(self, request, queryset, view):
+        for param, lookup in (
+            (self.all_param, 'skill_ids__contains'),
+            (self.any_param, 'skill_ids__overlap'),
+        ):
+            values = skill_param_values(request, param)
+            if not values:
+                continue
+
+            try:
+                skill_ids, unknown_names = resolve_skill_values(values)
+            except ValueError as e:
+                raise ValidationError({param: [str(e)]})
+            if param == self.all_param and unknown_names:
+                # A skill that does not exist cannot be had by any CV.
+                return queryset.none()
+            queryset = queryset.filter(**{lookup: sorted(skill_ids)})
+        return queryset
@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from django.conf import settings
+
+
+class CVCursorPagination(CursorPagination):
+    """
+    Keyset pagination over CVs ordered by id.
+
+    Each page is a `WHERE id > cursor ORDER BY id LIMIT n` query, so the
+    cost of a page does not depend on how far into the table it is.
+    """
+    ordering = 'id'
+    page_size = settings.CV_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.CV_MAX_PAGE_SIZE
+
+
+class CVSearchPagination(PageNumberPagination):
+    """
+    Page-number pagination for ranked search results, which are not in id
+    order and so cannot use a cursor.
+    """
+    page_size = settings.CV_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.CV_MAX_PAGE_SIZE
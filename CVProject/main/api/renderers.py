@@ -0,0 +1,38 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes compact responses with orjson.
+
+    The output matches `JSONRenderer` byte for byte, except that floats
+    written in exponent form drop the '+' sign (1e16 instead of 1e+16).
+    Indented output, non-compact settings, data orjson cannot encode and
+    installs without orjson all fall back to the standard renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028 and U+2029 like JSONRenderer does.
+        return ret.replace(
+            b'\xe2\x80\xa8', b'\\u2028'
+        ).replace(b'\xe2\x80\xa9', b'\\u2029')
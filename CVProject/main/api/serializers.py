@@ -1,5 +1,8 @@
-from rest_framework import serializers
+from main.services.project_sync import apply_project_diffs, diff_projects
 from ..models import Skill, CV, Project
+from rest_framework import serializers
+from rest_framework.utils import html
+from django.db import transaction
 
 
 class SkillSerializer(serializers.ModelSerializer):
@@ -9,18 +12,107 @@ class SkillSerializer(serializers.ModelSerializer):
 
 
 class ProjectSerializer(serializers.ModelSerializer):
+    # Writable so nested updates can match projects by id.
+    id = serializers.IntegerField(required=False)
+
     class Meta:
         model = Project
         fields = ['id', 'name', 'description', 'link']
         read_only_fields = ('cv',)
 
 
+class SkillListField(serializers.Field):
+    """A CV's skills, written as skill ids or names and read as ids.
+
+    All submitted ids are checked with a single `id__in` query, unless
+    `check_existence` is False and the caller checks them itself. Names are
+    kept as strings until `resolve_skills` runs on save, so validation
+    itself never writes.
+    """
+    default_error_messages = {
+        'not_a_list': (
+            'Expected a list of skill ids or names but got type '
+            '"{input_type}".'
+        ),
+        'invalid': 'Each skill must be an id or a non-empty name.',
+        'does_not_exist': 'Invalid pk "{pk_value}" - object does not exist.',
+        'max_length': (
+            'Ensure skill names have no more than {max_length} characters.'
+        ),
+    }
+
+    def __init__(self, check_existence=True, **kwargs):
+        self.check_existence = check_existence
+        super().__init__(**kwargs)
+
+    def get_value(self, dictionary):
+        # Form input carries ids as strings, one value per skill.
+        if html.is_html_input(dictionary) and self.field_name in dictionary:
+            return [
+                int(value) if value.isdigit() else value
+                for value in dictionary.getlist(self.field_name)
+            ]
+        return super().get_value(dictionary)
+
+    def to_representation(self, value):
+        return [skill.pk for skill in value.all()]
+
+    def to_internal_value(self, data):
+        if isinstance(data, (str, dict)) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+
+        max_length = Skill._meta.get_field('name').max_length
+        values = []
+        for item in data:
+            if isinstance(item, int) and not isinstance(item, bool):
+                values.append(item)
+            elif isinstance(item, str) and item.strip():
+                if len(item.strip()) > max_length:
+                    self.fail('max_length', max_length=max_length)
+                values.append(item.strip())
+            else:
+                self.fail('invalid')
+        if not self.check_existence:
+            return values
+
+        ids = [value for value in values if isinstance(value, int)]
+        found = Skill.objects.in_bulk(ids) if ids else {}
+        missing = [pk for pk in dict.fromkeys(ids) if pk not in found]
+        if missing:
+            raise serializers.ValidationError([
+                self.error_messages['does_not_exist'].format(pk_value=pk)
+                for pk in missing
+            ])
+        return [
+            found[value] if isinstance(value, int) else value
+            for value in values
+        ]
+
+
+def resolve_skills(values):
+    """Turns validated `SkillListField` values into Skill objects.
+
+    Names are matched exactly; the missing ones are created in one
+    `bulk_create` and all of them are then fetched in one query.
+    """
+    names = list(dict.fromkeys(v for v in values if isinstance(v, str)))
+    by_name = {}
+    if names:
+        Skill.objects.bulk_create(
+            [Skill(name=name) for name in names], ignore_conflicts=True
+        )
+        by_name = {
+            skill.name: skill
+            for skill in Skill.objects.filter(name__in=names)
+        }
+    return [
+        by_name[value] if isinstance(value, str) else value
+        for value in values
+    ]
+
+
 class CVSerializer(serializers.ModelSerializer):
-    skills = serializers.PrimaryKeyRelatedField(
-        queryset=Skill.objects.all(),
-        many=True,
-        required=False
-    )
+    skills = SkillListField(required=False)
     projects = ProjectSerializer(many=True, required=False)
 
     class Meta:
@@ -30,21 +122,36 @@ class CVSerializer(serializers.ModelSerializer):
             'skills', 'bio', 'contacts', 'projects'
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         skills_data = validated_data.pop('skills', [])
         projects_data = validated_data.pop('projects', [])
 
         cv = CV.objects.create(**validated_data)
-        cv.skills.set(skills_data)
+        cv.skills.set(resolve_skills(skills_data))
 
-        for project_data in projects_data:
-            Project.objects.create(cv=cv, **project_data)
+        apply_project_diffs([([], [
+            Project(cv=cv, **{
+                field: value for field, value in project_data.items()
+                if field != 'id'
+            })
+            for project_data in projects_data
+        ], [])])
         return cv
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         skills_data = validated_data.pop('skills', None)
         projects_data = validated_data.pop('projects', None)
 
+        if projects_data is not None:
+            try:
+                project_diff = diff_projects(
+                    instance.pk, instance.projects.all(), projects_data
+                )
+            except ValueError as e:
+                raise serializers.ValidationError({'projects': [str(e)]})
+
         instance.firstname = validated_data.get(
             'firstname', instance.firstname
         )
@@ -54,11 +161,23 @@ class CVSerializer(serializers.ModelSerializer):
         instance.save()
 
         if skills_data is not None:
-            instance.skills.set(skills_data)
+            instance.skills.set(resolve_skills(skills_data))
 
         if projects_data is not None:
-            instance.projects.all().delete()
-            for project_data in projects_data:
-                Project.objects.create(cv=instance, **project_data)
+            apply_project_diffs([project_diff])
 
         return instance
+
+
+class CVBulkItemSerializer(CVSerializer):
+    """Validates one item of a bulk upsert.
+
+    Items carrying an `id` update that CV, the rest are created. Skill ids
+    are only type-checked here; `bulk_upsert_cvs` checks that they exist
+    with a single query for the whole batch.
+    """
+    id = serializers.IntegerField(required=False, min_value=1)
+    skills = SkillListField(required=False, check_existence=False)
+
+    class Meta(CVSerializer.Meta):
+        pass
@@ -0,0 +1,75 @@
+from main.services.search import update_search_vectors, update_skill_ids
+from main.services.cv_document import update_cv_documents
+from main.models import CV, Skill, Project
+import random
+
+FIRSTNAMES = (
+    'Olena', 'Taras', 'Iryna', 'Andrii', 'Maria', 'John', 'Anna', 'Petro'
+)
+LASTNAMES = (
+    'Shevchenko', 'Kovalenko', 'Bondarenko', 'Tkachenko', 'Doe', 'Melnyk'
+)
+WORDS = (
+    'backend', 'developer', 'django', 'python', 'scalable', 'services',
+    'experience', 'teams', 'delivering', 'reliable', 'systems', 'data',
+    'pipelines', 'cloud', 'infrastructure', 'testing', 'automation',
+)
+
+
+def _sentence(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def seed_dataset(cvs=100, skills=50, skills_per_cv=5, projects_per_cv=3,
+                 seed=0):
+    """Creates a synthetic set of CVs, skills and projects.
+
+    Rows are written with `bulk_create` and the denormalized skill ids,
+    documents and search vectors with one UPDATE each, so seeding
+    thousands of CVs stays fast. The same `seed` always produces the same
+    data.
+
+    Returns:
+        list[int]: The ids of the created CVs.
+    """
+    rng = random.Random(seed)
+    prefix = f"bench-{seed}"
+
+    skill_objs = Skill.objects.bulk_create([
+        Skill(name=f"{prefix}-skill-{i}") for i in range(skills)
+    ])
+    cv_objs = CV.objects.bulk_create([
+        CV(
+            firstname=rng.choice(FIRSTNAMES),
+            lastname=rng.choice(LASTNAMES),
+            bio=_sentence(rng, 40),
+            contacts={
+                'email': f"{prefix}-cv-{i}@example.com",
+                'phone': f"+380{rng.randrange(10 ** 9):09d}",
+                'github': f"https://github.com/{prefix}-cv-{i}",
+            },
+        )
+        for i in range(cvs)
+    ])
+
+    through = CV.skills.through
+    through.objects.bulk_create([
+        through(cv_id=cv.id, skill_id=skill.id)
+        for cv in cv_objs
+        for skill in rng.sample(skill_objs, min(skills_per_cv, skills))
+    ])
+    Project.objects.bulk_create([
+        Project(
+            cv=cv,
+            name=_sentence(rng, 3),
+            description=_sentence(rng, 25),
+            link=f"https://example.com/{prefix}/{cv.id}/{i}",
+        )
+        for cv in cv_objs
+        for i in range(projects_per_cv)
+    ])
+    cv_ids = [cv.id for cv in cv_objs]
+    update_skill_ids(cv_ids)
+    update_cv_documents(cv_ids)
+    update_search_vectors(cv_ids)
+    return cv_ids
@@ -0,0 +1,58 @@
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+import tracemalloc
+import statistics
+import time
+
+
+def percentile(samples, percent):
+    """Returns the nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = round(percent / 100 * (len(ordered) - 1))
+    return ordered[index]
+
+
+def summarize(timings_ms):
+    """Summarizes call latencies given in milliseconds."""
+    return {
+        'p50_ms': round(percentile(timings_ms, 50), 3),
+        'p95_ms': round(percentile(timings_ms, 95), 3),
+        'p99_ms': round(percentile(timings_ms, 99), 3),
+        'mean_ms': round(statistics.fmean(timings_ms), 3),
+        'min_ms': round(min(timings_ms), 3),
+        'max_ms': round(max(timings_ms), 3),
+    }
+
+
+def measure(func, iterations=20, warmup=1):
+    """Times `func` and records its query count and peak memory.
+
+    Latencies come from `iterations` plain calls. Queries and memory are
+    measured on one extra call each, so neither the query capture nor
+    tracemalloc skews the timings.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    with CaptureQueriesContext(connection) as queries:
+        func()
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'iterations': iterations,
+        **summarize(timings),
+        'queries': len(queries),
+        'peak_memory_kib': round(peak / 1024, 1),
+    }
@@ -0,0 +1,262 @@
+from main.services.cv_utils import (
+    generate_cv_pdf_content,
+    serialize_cv_instance,
+)
+from main.services.translation_memory import (
+    extract_segments,
+    translate_cv_data,
+)
+from main.services.translation_backends import (
+    FakeBackend,
+    use_translation_backend,
+)
+from main.api.fast_serializers import CV_VALUE_FIELDS, serialize_cv_rows
+from main.services.skill_match import match_cvs, skill_match_index
+from main.services.gemini_translate import build_segment_prompt
+from django.test import RequestFactory, override_settings
+from audit.middleware import RequestLoggingMiddleware
+from django.contrib.auth.models import AnonymousUser
+from main.services.cv_document import cv_documents
+from rest_framework.test import APIRequestFactory
+from rest_framework.renderers import JSONRenderer
+from main.benchmarks.dataset import seed_dataset
+from main.api.renderers import FastJSONRenderer
+from main.views import CVViewSet, cv_list_view
+from main.api.serializers import CVSerializer
+from audit.buffer import request_log_buffer
+from main.benchmarks.runner import measure
+from django.http import HttpResponse
+from django.core.cache import caches
+from django.db import transaction
+from main.models import CV, Skill
+import itertools
+import platform
+import random
+import django
+
+
+def _cv_list_page(ctx):
+    factory = RequestFactory()
+    return lambda: cv_list_view(factory.get('/')).content
+
+
+def _api_list(ctx):
+    factory = APIRequestFactory()
+    view = CVViewSet.as_view({'get': 'list'})
+    return lambda: view(factory.get('/api/cvs/')).render()
+
+
+def _api_list_narrow(ctx):
+    factory = APIRequestFactory()
+    view = CVViewSet.as_view({'get': 'list'})
+    return lambda: view(
+        factory.get('/api/cvs/', {'fields': 'id,firstname,lastname'})
+    ).render()
+
+
+def _api_skill_filter(ctx):
+    factory = APIRequestFactory()
+    view = CVViewSet.as_view({'get': 'list'})
+    skill_ids = ','.join(
+        str(pk) for pk in Skill.objects.order_by('id').values_list(
+            'id', flat=True
+        )[:2]
+    )
+    return lambda: view(
+        factory.get('/api/cvs/', {'skills_any': skill_ids})
+    ).render()
+
+
+def _skill_match(ctx):
+    skill_ids = list(Skill.objects.values_list('id', flat=True))
+    rng = random.Random(0)
+    skill_match_index.reset()
+    match_cvs(skill_ids[:1])
+
+    def call():
+        return match_cvs(
+            rng.sample(skill_ids, 3), rng.sample(skill_ids, 3), limit=20
+        )
+    return call
+
+
+def _api_retrieve(ctx):
+    factory = APIRequestFactory()
+    view = CVViewSet.as_view({'get': 'retrieve'})
+    ids = itertools.cycle(ctx['cv_ids'])
+
+    def call():
+        cv_id = next(ids)
+        return view(factory.get(f'/api/cvs/{cv_id}/'), pk=cv_id).render()
+    return call
+
+
+def _api_create(ctx):
+    factory = APIRequestFactory()
+    view = CVViewSet.as_view({'post': 'create'})
+    cv = CV.objects.prefetch_related('skills', 'projects').get(
+        pk=ctx['cv_ids'][0]
+    )
+    payload = {
+        'firstname': cv.firstname,
+        'lastname': cv.lastname,
+        'bio': cv.bio,
+        'contacts': cv.contacts,
+        'skills': [skill.id for skill in cv.skills.all()],
+        'projects': [
+            {'name': p.name, 'description': p.description, 'link': p.link}
+            for p in cv.projects.all()
+        ],
+    }
+    return lambda: view(
+        factory.post('/api/cvs/', payload, format='json')
+    ).render()
+
+
+def _page_ids(ctx):
+    return ctx['cv_ids'][:100]
+
+
+def _cv_serializer_page(ctx):
+    renderer = JSONRenderer()
+    ids = _page_ids(ctx)
+
+    def call():
+        queryset = CVViewSet.queryset.filter(pk__in=ids)
+        return renderer.render(CVSerializer(queryset, many=True).data)
+    return call
+
+
+def _fast_cv_page(ctx):
+    renderer = FastJSONRenderer()
+    ids = _page_ids(ctx)
+
+    def call():
+        rows = CV.objects.filter(pk__in=ids).order_by('id').values(
+            *CV_VALUE_FIELDS
+        )
+        return renderer.render(serialize_cv_rows(rows))
+    return call
+
+
+def _cv_objects(ctx):
+    return list(cv_documents().filter(pk__in=ctx['cv_ids'][:50]))
+
+
+def _pdf_uncached(ctx):
+    cvs = itertools.cycle(_cv_objects(ctx))
+
+    def call():
+        caches['pdf'].clear()
+        return generate_cv_pdf_content(next(cvs))
+    return call
+
+
+def _pdf_cached(ctx):
+    cv_objects = _cv_objects(ctx)
+    for cv in cv_objects:
+        generate_cv_pdf_content(cv)
+    cvs = itertools.cycle(cv_objects)
+    return lambda: generate_cv_pdf_content(next(cvs))
+
+
+def _serialize_cv(ctx):
+    cvs = itertools.cycle(_cv_objects(ctx))
+    return lambda: serialize_cv_instance(next(cvs))
+
+
+def _translation_prompt(ctx):
+    data = serialize_cv_instance(CV.objects.get(pk=ctx['cv_ids'][0]))
+    return lambda: build_segment_prompt(extract_segments(data), 'Ukrainian')
+
+
+def _translate_cv(ctx):
+    # The offline backend answers instantly, so this times the pipeline
+    # around the model: segmenting, memory lookups and stores. Every call
+    # uses a new language, so nothing is served from memory.
+    cvs = itertools.cycle(_cv_objects(ctx))
+    languages = (f"Language {index}" for index in itertools.count())
+    backend = FakeBackend()
+
+    def call():
+        with use_translation_backend(backend):
+            return translate_cv_data(
+                serialize_cv_instance(next(cvs)), next(languages)
+            )
+    return call
+
+
+def _request_logging(ctx):
+    factory = RequestFactory()
+    middleware = RequestLoggingMiddleware(lambda request: HttpResponse())
+
+    def call():
+        request = factory.get('/cv/1/', {'page': '2'})
+        request.user = AnonymousUser()
+        return middleware(request)
+    return call
+
+
+# Each entry builds, from the seeded context, the callable being timed.
+BENCHMARKS = {
+    'cv_list_view': _cv_list_page,
+    'api_list': _api_list,
+    'api_list_narrow': _api_list_narrow,
+    'api_skill_filter': _api_skill_filter,
+    'skill_match': _skill_match,
+    'api_retrieve': _api_retrieve,
+    'api_create': _api_create,
+    'cv_serializer_page': _cv_serializer_page,
+    'fast_cv_page': _fast_cv_page,
+    'pdf_uncached': _pdf_uncached,
+    'pdf_cached': _pdf_cached,
+    'serialize_cv_instance': _serialize_cv,
+    'translation_prompt': _translation_prompt,
+    'translate_cv_fake': _translate_cv,
+    'request_logging_middleware': _request_logging,
+}
+
+
+def run_benchmarks(names=None, iterations=20, dataset=None):
+    """Seeds a synthetic dataset and times the selected benchmarks.
+
+    Everything runs inside a transaction that is rolled back afterwards,
+    so the database is left untouched.
+
+    Args:
+        names: Benchmark names to run; all of `BENCHMARKS` when omitted.
+        iterations (int): Timed calls per benchmark.
+        dataset (dict): Keyword arguments for `seed_dataset`.
+
+    Returns:
+        dict: Environment details, the dataset size and one result per
+            benchmark, ready to be dumped as JSON.
+    """
+    names = list(names or BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmark(s): {', '.join(sorted(unknown))}."
+        )
+    dataset = dataset or {}
+
+    results = {}
+    with transaction.atomic(), override_settings(ALLOWED_HOSTS=['*']):
+        ctx = {'cv_ids': seed_dataset(**dataset)}
+        for name in names:
+            results[name] = measure(BENCHMARKS[name](ctx), iterations)
+        # Buffered request logs belong to the rolled back data.
+        request_log_buffer.flush()
+        transaction.set_rollback(True)
+    caches['pdf'].clear()
+    skill_match_index.reset()
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': transaction.get_connection().vendor,
+        },
+        'dataset': {'cvs': len(ctx['cv_ids']), **dataset},
+        'results': results,
+    }
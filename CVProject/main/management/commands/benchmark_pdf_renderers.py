@@ -0,0 +1,103 @@
+from main.services.cv_utils import PDF_BACKENDS, serialize_cv_instance
+from main.services.reportlab_renderer import render_cv_data_to_pdf
+from django.core.management.base import BaseCommand, CommandError
+from main.services.pdf_renderer import render_html_to_pdf
+from django.template.loader import render_to_string
+from main.services.pdf_cache import CV_PDF_TEMPLATE
+from main.services.cv_document import cv_documents
+from main.benchmarks.runner import summarize
+import statistics
+import time
+import json
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the latency and output size of the PDF backends. Renders "
+        "run in this process and bypass the PDF cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=10,
+            help="Number of renders per CV and backend.",
+        )
+        parser.add_argument(
+            '--cv',
+            type=int,
+            action='append',
+            dest='cv_ids',
+            help="CV id to render; may be repeated. Defaults to all CVs.",
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help="Print the results as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("--iterations must be at least 1.")
+
+        cvs = cv_documents()
+        if options['cv_ids']:
+            cvs = cvs.filter(pk__in=options['cv_ids'])
+        cvs = list(cvs.order_by('id'))
+        if not cvs:
+            raise CommandError("No CVs to render.")
+
+        renders = {
+            'pisa': lambda cv: render_html_to_pdf(
+                render_to_string(CV_PDF_TEMPLATE, {'cv': cv})
+            ),
+            'reportlab': lambda cv: render_cv_data_to_pdf(
+                serialize_cv_instance(cv)
+            ),
+        }
+        results = {
+            backend: self._benchmark(
+                renders[backend], cvs, options['iterations']
+            )
+            for backend in PDF_BACKENDS
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(
+            f"{len(cvs)} CV(s), {options['iterations']} iteration(s) each"
+        )
+        for backend, result in results.items():
+            self.stdout.write(
+                f"{backend:<10} p50 {result['p50_ms']:8.1f} ms  "
+                f"p95 {result['p95_ms']:8.1f} ms  "
+                f"avg size {result['avg_bytes']:8d} B  "
+                f"failures {result['failures']}"
+            )
+        pisa, reportlab = results['pisa'], results['reportlab']
+        if reportlab['p50_ms']:
+            self.stdout.write(self.style.SUCCESS(
+                f"reportlab is {pisa['p50_ms'] / reportlab['p50_ms']:.1f}x "
+                f"the speed of pisa at p50."
+            ))
+
+    def _benchmark(self, render, cvs, iterations):
+        timings, sizes, failures = [], [], 0
+        for cv in cvs:
+            for _ in range(iterations):
+                started = time.perf_counter()
+                pdf_content, error_code, _ = render(cv)
+                timings.append((time.perf_counter() - started) * 1000)
+                if error_code:
+                    failures += 1
+                else:
+                    sizes.append(len(pdf_content))
+        return {
+            'renders': len(timings),
+            'failures': failures,
+            **summarize(timings),
+            'avg_bytes': round(statistics.fmean(sizes)) if sizes else 0,
+        }
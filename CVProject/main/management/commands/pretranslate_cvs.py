@@ -0,0 +1,121 @@
+from main.services.translation_batch import Pretranslator, iter_cv_chunks
+from django.core.management.base import BaseCommand, CommandError
+from pathlib import Path
+import json
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-translates every CV into the given languages, packing the "
+        "text of several CVs into each model request. Progress is saved "
+        "to a checkpoint file so an interrupted run can be resumed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'languages', nargs='+',
+            help="Target languages, e.g. French German.",
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=100,
+            help="CVs read and translated together.",
+        )
+        parser.add_argument(
+            '--max-tokens', type=int, default=2000,
+            help="Estimated input tokens per model request.",
+        )
+        parser.add_argument(
+            '--concurrency', type=int, default=4,
+            help="Model requests in flight at once.",
+        )
+        parser.add_argument(
+            '--rate-limit', type=int, default=60,
+            help="Model requests started per minute; 0 for no limit.",
+        )
+        parser.add_argument(
+            '--checkpoint', default='pretranslate_checkpoint.json',
+            help="File recording the last fully translated CV id.",
+        )
+        parser.add_argument(
+            '--restart', action='store_true',
+            help="Ignore an existing checkpoint and start from the first CV.",
+        )
+
+    def handle(self, *args, **options):
+        for option in ('chunk_size', 'max_tokens', 'concurrency'):
+            if options[option] < 1:
+                raise CommandError(
+                    f"--{option.replace('_', '-')} must be at least 1."
+                )
+        if options['rate_limit'] < 0:
+            raise CommandError("--rate-limit must not be negative.")
+
+        languages = list(dict.fromkeys(options['languages']))
+        checkpoint = Path(options['checkpoint'])
+        after = 0 if options['restart'] else self._resume(
+            checkpoint, languages
+        )
+        if after:
+            self.stdout.write(f"Resuming after CV {after}.")
+
+        progress = {'after': after, 'complete': True}
+
+        def save_checkpoint(cvs, complete):
+            # Only advance past chunks whose CVs are all translated, so a
+            # resumed run retries the failed ones.
+            progress['complete'] = progress['complete'] and complete
+            if progress['complete']:
+                progress['after'] = cvs[-1].pk
+                checkpoint.write_text(json.dumps({
+                    'languages': languages, 'after': progress['after'],
+                }))
+            self.stdout.write(
+                f"Translated CVs up to {cvs[-1].pk}"
+                f"{'' if complete else ' (with failures)'}."
+            )
+
+        stats = Pretranslator(
+            languages,
+            max_tokens=options['max_tokens'],
+            concurrency=options['concurrency'],
+            rate_limit=options['rate_limit'],
+        ).run(
+            iter_cv_chunks(options['chunk_size'], after=after),
+            on_chunk=save_checkpoint,
+        )
+
+        summary = (
+            f"{stats['cvs']} CV(s) into {', '.join(languages)}: "
+            f"{stats['segments_from_memory']} segment(s) from memory, "
+            f"{stats['segments_translated']} translated in "
+            f"{stats['requests']} request(s), "
+            f"{stats['failed_requests']} failed. "
+            f"Prompts took an estimated ~{stats['estimated_prompt_tokens']} "
+            f"token(s), ~{stats['estimated_saved_tokens']} fewer than the "
+            f"previous whole-CV prompts."
+        )
+        if stats['failed_requests']:
+            self.stdout.write(self.style.WARNING(
+                f"{summary} Run again to retry from CV {progress['after']}."
+            ))
+            return
+        checkpoint.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(f"Pre-translated {summary}"))
+
+    def _resume(self, checkpoint, languages):
+        """Returns the CV id to resume after, or 0 to start over."""
+        try:
+            state = json.loads(checkpoint.read_text())
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            raise CommandError(
+                f"Checkpoint {checkpoint} is not valid JSON; use --restart."
+            )
+        if state.get('languages') != languages:
+            raise CommandError(
+                f"Checkpoint {checkpoint} is for "
+                f"{', '.join(state.get('languages') or [])}; use --restart "
+                f"or another --checkpoint."
+            )
+        return state.get('after', 0)
@@ -0,0 +1,31 @@
+from main.services.search import update_search_vectors, update_skill_ids
+from main.services.cv_document import update_cv_documents
+from django.core.management.base import BaseCommand
+from main.models import CV
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the skill ids, documents and search vectors of all CVs, "
+        "e.g. after `loaddata`, which sends no m2m signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help="Number of CVs updated per statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(CV.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            update_skill_ids(batch)
+            update_cv_documents(batch)
+            update_search_vectors(batch)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt documents for {len(ids)} CV(s)."
+        ))
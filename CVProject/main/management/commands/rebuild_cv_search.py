@@ -0,0 +1,27 @@
+from main.services.search import update_search_vectors
+from django.core.management.base import BaseCommand
+from main.models import CV
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the full-text search vectors of all CVs, e.g. after "
+        "changing CV_SEARCH_CONFIG."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help="Number of CVs updated per statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(CV.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(ids), batch_size):
+            update_search_vectors(ids[start:start + batch_size])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt search vectors for {len(ids)} CV(s)."
+        ))
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand, CommandError
+from main.benchmarks.suite import BENCHMARKS, run_benchmarks
+import json
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the CV hot paths against a synthetic dataset and reports "
+        "latency percentiles, query counts and peak memory as JSON. The "
+        "dataset is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cvs', type=int, default=200,
+            help="Number of synthetic CVs to seed.",
+        )
+        parser.add_argument(
+            '--skills', type=int, default=50,
+            help="Number of synthetic skills to seed.",
+        )
+        parser.add_argument(
+            '--skills-per-cv', type=int, default=5,
+            help="Skills attached to every CV.",
+        )
+        parser.add_argument(
+            '--projects-per-cv', type=int, default=3,
+            help="Projects attached to every CV.",
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help="Random seed for the synthetic dataset.",
+        )
+        parser.add_argument(
+            '--iterations', type=int, default=20,
+            help="Timed calls per benchmark.",
+        )
+        parser.add_argument(
+            '--only', action='append', choices=sorted(BENCHMARKS),
+            help="Benchmark to run; may be repeated. Defaults to all.",
+        )
+        parser.add_argument(
+            '--output',
+            help="Write the JSON report to this file instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        if options['cvs'] < 1:
+            raise CommandError("--cvs must be at least 1.")
+
+        report = run_benchmarks(
+            names=options['only'],
+            iterations=options['iterations'],
+            dataset={
+                'cvs': options['cvs'],
+                'skills': options['skills'],
+                'skills_per_cv': options['skills_per_cv'],
+                'projects_per_cv': options['projects_per_cv'],
+                'seed': options['seed'],
+            },
+        )
+        output = json.dumps(report, indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+            self.stdout.write(self.style.SUCCESS(
+                f"Benchmark report written to {options['output']}."
+            ))
+        else:
+            self.stdout.write(output)
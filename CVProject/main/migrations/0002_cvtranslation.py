@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CVTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('language', models.CharField(max_length=100)),
+                ('model_name', models.CharField(max_length=100)),
+                ('prompt_version', models.PositiveSmallIntegerField()),
+                ('data', models.JSONField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cv', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='main.cv')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('content_hash', 'language', 'model_name', 'prompt_version'), name='unique_cv_translation_key')],
+            },
+        ),
+    ]
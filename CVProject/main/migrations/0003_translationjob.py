@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:17
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0002_cvtranslation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('language', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('error', models.TextField(blank=True)),
+                ('filename', models.CharField(blank=True, max_length=255)),
+                ('pdf', models.BinaryField(null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('cv', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='translation_jobs', to='main.cv')),
+            ],
+        ),
+    ]
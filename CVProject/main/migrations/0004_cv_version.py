@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:33
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_translationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cv',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AddField(
+            model_name='cv',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:36
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+POPULATE_SQL = """
+UPDATE main_cv SET search_vector =
+    setweight(to_tsvector(%(config)s::regconfig,
+        coalesce(firstname, '') || ' ' || coalesce(lastname, '')), 'A')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce((
+        SELECT string_agg(s.name, ' ') FROM main_cv_skills cs
+        JOIN main_skill s ON s.id = cs.skill_id
+        WHERE cs.cv_id = main_cv.id), '')), 'B')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce((
+        SELECT string_agg(p.name, ' ') FROM main_project p
+        WHERE p.cv_id = main_cv.id), '')), 'B')
+    || setweight(to_tsvector(%(config)s::regconfig,
+        coalesce(bio, '')), 'C')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce((
+        SELECT string_agg(p.description, ' ') FROM main_project p
+        WHERE p.cv_id = main_cv.id), '')), 'D')
+"""
+
+
+def populate_search_vectors(apps, schema_editor):
+    schema_editor.execute(
+        POPULATE_SQL, params={'config': settings.CV_SEARCH_CONFIG}
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_cv_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cv',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='cv',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='main_cv_search_idx'),
+        ),
+        migrations.RunPython(
+            populate_search_vectors, migrations.RunPython.noop
+        ),
+    ]
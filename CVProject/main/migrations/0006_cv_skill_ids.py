@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:39
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+POPULATE_SQL = """
+UPDATE main_cv SET skill_ids = ARRAY(
+    SELECT skill_id FROM main_cv_skills
+    WHERE cv_id = main_cv.id ORDER BY skill_id
+)
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_cv_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cv',
+            name='skill_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='cv',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skill_ids'], name='main_cv_skill_ids_idx'),
+        ),
+        migrations.RunSQL(POPULATE_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:45
+
+from django.db import migrations, models
+
+POPULATE_SQL = """
+UPDATE main_cv SET document = jsonb_build_object(
+    'skills', COALESCE((
+        SELECT jsonb_agg(
+            jsonb_build_object('id', s.id, 'name', s.name) ORDER BY s.id
+        )
+        FROM main_cv_skills cs JOIN main_skill s ON s.id = cs.skill_id
+        WHERE cs.cv_id = main_cv.id
+    ), '[]'::jsonb),
+    'projects', COALESCE((
+        SELECT jsonb_agg(
+            jsonb_build_object(
+                'id', p.id, 'name', p.name,
+                'description', p.description, 'link', p.link
+            ) ORDER BY p.id
+        )
+        FROM main_project p
+        WHERE p.cv_id = main_cv.id
+    ), '[]'::jsonb)
+)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_cv_skill_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cv',
+            name='document',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.RunSQL(POPULATE_SQL, migrations.RunSQL.noop),
+    ]
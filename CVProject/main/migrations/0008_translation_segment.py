@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_cv_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_hash', models.CharField(max_length=64)),
+                ('source', models.TextField()),
+                ('language', models.CharField(max_length=100)),
+                ('model_name', models.CharField(max_length=100)),
+                ('prompt_version', models.PositiveSmallIntegerField()),
+                ('translation', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('source_hash', 'language', 'model_name', 'prompt_version'), name='unique_translation_segment_key')],
+            },
+        ),
+    ]
@@ -1,4 +1,9 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.fields import ArrayField
+from django.utils import timezone
 from django.db import models
+import uuid
 
 
 class Skill(models.Model):
@@ -15,12 +20,47 @@ class CV(models.Model):
     bio = models.TextField(blank=True)
     # Stores contact information like email, phone, LinkedIn, etc.
     contacts = models.JSONField(blank=True, null=True)
+    # Bumped on every change to the CV, its projects or its skills; used
+    # for ETag/Last-Modified validation.
+    version = models.PositiveIntegerField(default=1, editable=False)
+    updated_at = models.DateTimeField(default=timezone.now, editable=False)
+    # Full-text index over names, bio, skills and projects, kept up to date
+    # by `main.services.search.update_search_vectors`.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Sorted copy of the skill ids for indexed all-of / any-of filters,
+    # kept in sync by `main.services.search.update_skill_ids`.
+    skill_ids = ArrayField(
+        models.IntegerField(), default=list, blank=True, editable=False
+    )
+    # Snapshot of the skills and projects, each ordered by id, so a CV can
+    # be shown, rendered or translated from its own row. Kept in sync by
+    # `main.services.cv_document.update_cv_documents`.
+    document = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self):
         return f"{self.firstname} {self.lastname}"
 
+    def save(self, *args, **kwargs):
+        """Saves the CV, bumping its version and updated_at on updates."""
+        bump = not self._state.adding
+        if bump:
+            self.version = models.F('version') + 1
+            self.updated_at = timezone.now()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields, 'version', 'updated_at'
+                }
+        super().save(*args, **kwargs)
+        if bump:
+            self.refresh_from_db(fields=['version'])
+
     class Meta:
         verbose_name_plural = "CVs"
+        indexes = [
+            GinIndex(fields=['search_vector'], name='main_cv_search_idx'),
+            GinIndex(fields=['skill_ids'], name='main_cv_skill_ids_idx'),
+        ]
 
 
 class Project(models.Model):
@@ -33,3 +73,91 @@ class Project(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class CVTranslation(models.Model):
+    """A cached machine translation of a CV's serialized data.
+
+    Entries are looked up by the hash of the source data, the target
+    language, the model and the prompt version; `cv` only records which CV
+    the entry belongs to so it can be dropped when that CV changes.
+    """
+    cv = models.ForeignKey(
+        CV, on_delete=models.CASCADE, related_name='translations'
+    )
+    content_hash = models.CharField(max_length=64)
+    language = models.CharField(max_length=100)
+    model_name = models.CharField(max_length=100)
+    prompt_version = models.PositiveSmallIntegerField()
+    data = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.cv} ({self.language})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'content_hash', 'language', 'model_name',
+                    'prompt_version'
+                ],
+                name='unique_cv_translation_key'
+            ),
+        ]
+
+
+class TranslationSegment(models.Model):
+    """A translated piece of CV text, shared by every CV containing it.
+
+    Segments are skill names and the sentences of bios, project names and
+    project descriptions, looked up by the hash of their source text.
+    """
+    source_hash = models.CharField(max_length=64)
+    source = models.TextField()
+    language = models.CharField(max_length=100)
+    model_name = models.CharField(max_length=100)
+    prompt_version = models.PositiveSmallIntegerField()
+    translation = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.source[:50]} ({self.language})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'source_hash', 'language', 'model_name',
+                    'prompt_version'
+                ],
+                name='unique_translation_segment_key'
+            ),
+        ]
+
+
+class TranslationJob(models.Model):
+    """A queued request to translate a CV and render it as a PDF."""
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        SUCCEEDED = 'succeeded', 'Succeeded'
+        FAILED = 'failed', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    cv = models.ForeignKey(
+        CV, on_delete=models.CASCADE, related_name='translation_jobs'
+    )
+    language = models.CharField(max_length=100)
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.PENDING
+    )
+    error = models.TextField(blank=True)
+    filename = models.CharField(max_length=255, blank=True)
+    pdf = models.BinaryField(null=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.cv} ({self.language}) - {self.status}"
@@ -0,0 +1,55 @@
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from main.models import CV
+import hashlib
+import json
+
+
+def get_cv_version(request, cv_id):
+    """Returns `(version, updated_at)` of a CV, or None if it is missing.
+
+    The lookup is memoized on the request, so the ETag and Last-Modified
+    callbacks of one request share a single query.
+    """
+    versions = request.__dict__.setdefault('_cv_versions', {})
+    if cv_id not in versions:
+        versions[cv_id] = CV.objects.filter(pk=cv_id).values_list(
+            'version', 'updated_at'
+        ).first()
+    return versions[cv_id]
+
+
+def make_etag(*parts):
+    """Builds an opaque ETag value from everything a response depends on."""
+    encoded = json.dumps(parts, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:32]
+
+
+def conditional_response(request, build, etag, last_modified=None):
+    """Answers a conditional request, building the body only when needed.
+
+    Works like Django's `condition` decorator for views, such as DRF
+    actions, that only know their validators after some work: when
+    `If-None-Match` / `If-Modified-Since` match, a 304 is returned without
+    calling `build`.
+
+    Args:
+        request: The HttpRequest object.
+        build (Callable[[], HttpResponse]): Produces the full response.
+        etag (str): Unquoted ETag value, e.g. from `make_etag`.
+        last_modified (datetime): Optional last modification time.
+    """
+    etag = quote_etag(etag)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(
+        request, etag=etag, last_modified=timestamp
+    )
+    if response is None:
+        response = build()
+
+    if request.method in ('GET', 'HEAD'):
+        if timestamp and not response.has_header('Last-Modified'):
+            response['Last-Modified'] = http_date(timestamp)
+        if not response.has_header('ETag'):
+            response['ETag'] = etag
+    return response
@@ -0,0 +1,184 @@
+from main.services.project_sync import apply_project_diffs, diff_projects
+from main.services.search import update_search_vectors, update_skill_ids
+from main.api.serializers import CVBulkItemSerializer, resolve_skills
+from main.services.cv_document import update_cv_documents
+from main.signals import invalidate_cv_caches, touch_cvs
+from main.services.skill_match import skill_match_index
+from main.models import CV, Skill, Project
+from django.db import transaction
+from django.conf import settings
+import itertools
+
+CV_FIELDS = ('firstname', 'lastname', 'bio', 'contacts')
+
+
+def _error(index, errors):
+    return {'index': index, 'status': 'error', 'errors': errors}
+
+
+def _validate(items):
+    """Validates every item, checking ids against the database in bulk.
+
+    Returns:
+        tuple: The per-item results, with errors filled in, and a list of
+            `(index, validated_data, project_diff)` triples for the valid
+            items; `project_diff` is None when no projects were sent.
+    """
+    results = [None] * len(items)
+    valid = []
+    for index, item in enumerate(items):
+        serializer = CVBulkItemSerializer(data=item)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            results[index] = _error(index, serializer.errors)
+
+    skill_ids = {
+        value for _, data in valid for value in data.get('skills', [])
+        if isinstance(value, int)
+    }
+    cv_ids = [data['id'] for _, data in valid if 'id' in data]
+    known_skills = set(
+        Skill.objects.filter(pk__in=skill_ids).values_list('pk', flat=True)
+    ) if skill_ids else set()
+    known_cvs = set(
+        CV.objects.filter(pk__in=cv_ids).values_list('pk', flat=True)
+    ) if cv_ids else set()
+    current_projects = {}
+    for project in Project.objects.filter(cv_id__in=known_cvs):
+        current_projects.setdefault(project.cv_id, []).append(project)
+
+    checked, seen_cvs = [], set()
+    for index, data in valid:
+        errors = {}
+        cv_id = data.get('id')
+        if cv_id is not None and cv_id not in known_cvs:
+            errors['id'] = [f'CV with id {cv_id} does not exist.']
+        elif cv_id is not None and cv_id in seen_cvs:
+            errors['id'] = [f'CV with id {cv_id} appears more than once.']
+        missing = [
+            value for value in data.get('skills', [])
+            if isinstance(value, int) and value not in known_skills
+        ]
+        if missing:
+            errors['skills'] = [
+                f'Invalid pk "{pk}" - object does not exist.'
+                for pk in dict.fromkeys(missing)
+            ]
+        project_diff = None
+        if 'projects' in data and 'id' not in errors:
+            try:
+                project_diff = diff_projects(
+                    cv_id, current_projects.get(cv_id, []), data['projects']
+                )
+            except ValueError as e:
+                errors['projects'] = [str(e)]
+
+        if errors:
+            results[index] = _error(index, errors)
+        else:
+            seen_cvs.add(cv_id)
+            checked.append((index, data, project_diff))
+    return results, checked
+
+
+def bulk_upsert_cvs(items):
+    """Creates or updates many CVs in a bounded number of queries.
+
+    Every item is validated first; invalid ones are reported and skipped.
+    Valid items are written in one transaction: new CVs with `bulk_create`,
+    existing ones with an upserting `bulk_create`, skills as bulk inserted
+    through rows and projects as batched diffs. Like a full update, the
+    skills given for an existing CV replace its current ones, and its
+    projects are matched by id as in `CVSerializer.update`.
+
+    Args:
+        items (list[dict]): CV payloads in the `CVSerializer` format, with
+            an optional `id` for CVs to update.
+
+    Returns:
+        list[dict]: One result per item, in input order, with the `index`,
+            a `status` of 'created', 'updated' or 'error', and the CV `id`
+            or the validation `errors`.
+    """
+    results, valid = _validate(items)
+    if not valid:
+        return results
+
+    batch_size = settings.CV_BULK_BATCH_SIZE
+    cvs = [
+        CV(**{
+            field: data[field] for field in ('id',) + CV_FIELDS
+            if field in data
+        })
+        for _, data, _ in valid
+    ]
+    new_cvs = [cv for cv in cvs if cv.pk is None]
+    existing_cvs = [cv for cv in cvs if cv.pk is not None]
+    existing_ids = {cv.pk for cv in existing_cvs}
+
+    with transaction.atomic():
+        CV.objects.bulk_create(new_cvs, batch_size=batch_size)
+        CV.objects.bulk_create(
+            existing_cvs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=list(CV_FIELDS),
+        )
+
+        with_skills = [
+            (cv, data['skills']) for cv, (_, data, _) in zip(cvs, valid)
+            if 'skills' in data
+        ]
+        # Resolve the skill names of every item in one go.
+        resolved = iter(resolve_skills(
+            [value for _, values in with_skills for value in values]
+        ))
+        with_skills = [
+            (cv, [
+                getattr(skill, 'pk', skill)
+                for skill in itertools.islice(resolved, len(values))
+            ])
+            for cv, values in with_skills
+        ]
+        through = CV.skills.through
+        through.objects.filter(cv_id__in=[
+            cv.pk for cv, _ in with_skills if cv.pk in existing_ids
+        ]).delete()
+        through.objects.bulk_create(
+            [
+                through(cv_id=cv.pk, skill_id=skill_id)
+                for cv, skill_ids in with_skills
+                for skill_id in dict.fromkeys(skill_ids)
+            ],
+            batch_size=batch_size,
+        )
+
+        # New CVs only got their ids above; hand them to their projects.
+        project_diffs = []
+        for cv, (_, _, diff) in zip(cvs, valid):
+            if diff is not None:
+                for project in diff[1]:
+                    project.cv_id = cv.pk
+                project_diffs.append(diff)
+        apply_project_diffs(
+            project_diffs, batch_size=batch_size, refresh=False
+        )
+
+        # bulk_create sends no signals, so bump versions and drop the
+        # stale caches here.
+        touch_cvs(existing_ids)
+        update_skill_ids([cv.pk for cv, _ in with_skills])
+        update_cv_documents([cv.pk for cv in cvs])
+        update_search_vectors([cv.pk for cv in cvs])
+    invalidate_cv_caches(existing_ids)
+    skill_match_index.mark_stale([cv.pk for cv in cvs])
+
+    for cv, (index, data, _) in zip(cvs, valid):
+        results[index] = {
+            'index': index,
+            'status': 'updated' if 'id' in data else 'created',
+            'id': cv.pk,
+        }
+    return results
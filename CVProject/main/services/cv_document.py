@@ -0,0 +1,76 @@
+from django.db.models.functions import Coalesce, JSONObject
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db.models import JSONField, OuterRef, Subquery, Value
+from main.models import CV, Project
+
+# Columns a CV is shown, rendered and translated from.
+DOCUMENT_COLUMNS = ('id', 'firstname', 'lastname', 'bio', 'contacts',
+                    'document')
+
+
+def _aggregated(queryset, order_by, **fields):
+    """Returns a subquery collecting a CV's related rows as a JSON list."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(cv_id=OuterRef('pk')).values('cv_id').annotate(
+                items=JSONBAgg(JSONObject(**fields), order_by=order_by)
+            ).values('items')
+        ),
+        Value([], output_field=JSONField()),
+    )
+
+
+def cv_document_expression():
+    """Builds the `CV.document` of a CV from its skills and projects."""
+    return JSONObject(
+        skills=_aggregated(
+            CV.skills.through.objects.all(), 'skill_id',
+            id='skill_id', name='skill__name',
+        ),
+        projects=_aggregated(
+            Project.objects.all(), 'id',
+            id='id', name='name', description='description', link='link',
+        ),
+    )
+
+
+def update_cv_documents(cv_ids=None):
+    """Rebuilds the documents of the given CVs in one UPDATE.
+
+    Without `cv_ids` every CV is rebuilt.
+    """
+    queryset = CV.objects.all()
+    if cv_ids is not None:
+        if not cv_ids:
+            return 0
+        queryset = queryset.filter(pk__in=cv_ids)
+    return queryset.update(document=cv_document_expression())
+
+
+def cv_documents():
+    """Returns CVs loading only the columns their document is built from."""
+    return CV.objects.only(*DOCUMENT_COLUMNS)
+
+
+def cv_document_data(cv):
+    """Returns a CV's data in the shape used for PDFs and translations.
+
+    Reads the CV's fields and its `document` only, so no related rows are
+    queried.
+    """
+    document = cv.document
+    return {
+        'firstname': cv.firstname,
+        'lastname': cv.lastname,
+        'bio': cv.bio,
+        'contacts': cv.contacts,
+        'skills': [skill['name'] for skill in document.get('skills', [])],
+        'projects': [
+            {
+                'name': project['name'],
+                'description': project['description'],
+                'link': project['link'],
+            }
+            for project in document.get('projects', [])
+        ],
+    }
@@ -1,53 +1,144 @@
+from main.services.pdf_renderer import (
+    RendererError,
+    render_cv_data_pdf,
+    render_pdf,
+)
+from main.services.pdf_cache import (
+    CV_PDF_TEMPLATE,
+    cv_pdf_fingerprint,
+    data_fingerprint,
+    get_cached_pdf,
+    html_fingerprint,
+    store_pdf,
+)
+from main.services.cv_document import cv_document_data
 from django.template.loader import render_to_string
-from django.forms.models import model_to_dict
+from django.utils.text import get_valid_filename
+from django.conf import settings
 from main.models import CV
-from xhtml2pdf import pisa
-from io import BytesIO
 
+PDF_BACKENDS = ('pisa', 'reportlab')
 
-def generate_cv_pdf_content(cv_instance=None, html_string=None):
+
+def resolve_pdf_backend(backend=None):
+    """Returns the PDF backend to use, defaulting to CV_PDF_BACKEND.
+
+    Raises:
+        ValueError: If the backend is not one of PDF_BACKENDS.
+    """
+    backend = backend or settings.CV_PDF_BACKEND
+    if backend not in PDF_BACKENDS:
+        raise ValueError(
+            f"Unknown PDF backend '{backend}'. "
+            f"Choose one of: {', '.join(PDF_BACKENDS)}."
+        )
+    return backend
+
+
+def generate_cv_pdf_content(cv_instance=None, html_string=None, backend=None):
     """
     Generates PDF content from a CV instance or from a provided HTML string.
+    Returns PDF content as bytes, or None if generation fails.
+
+    CV instances are rendered with `backend` ('pisa' or 'reportlab', see
+    `resolve_pdf_backend`); HTML strings always go through pisa. Results
+    are cached by a fingerprint of the rendered content, so only the first
+    request for an unchanged CV pays for the render.
+    """
+    if html_string is not None:
+        return _cached_render(
+            html_fingerprint(html_string),
+            lambda: _render_pdf(html_string)
+        )
+    if not cv_instance:
+        return None
+
+    backend = resolve_pdf_backend(backend)
+    cv_id = cv_instance.pk
+    if backend == 'reportlab':
+        render = lambda: _render_reportlab_pdf(  # noqa: E731
+            serialize_cv_instance(cv_instance), cv_id
+        )
+    else:
+        render = lambda: _render_pdf(  # noqa: E731
+            render_to_string(CV_PDF_TEMPLATE, {'cv': cv_instance}), cv_id
+        )
+    return _cached_render(
+        cv_pdf_fingerprint(cv_instance, backend), render, cv_id
+    )
+
+
+def generate_translated_cv_pdf_content(translated_data, backend=None):
+    """Renders translated CV data (as returned by `translate_cv`) to PDF.
+
     Returns PDF content as bytes, or None if generation fails.
     """
-    if html_string is None:
-        if not cv_instance:
-            return None
-        context = {'cv': cv_instance}
-        html_string = render_to_string('main/cv_detail_pdf.html', context)
-
-    result_file = BytesIO()
-
-    pdf_status = pisa.CreatePDF(
-        src=html_string.encode('utf-8'),
-        dest=result_file,
-        encoding='utf-8'
+    backend = resolve_pdf_backend(backend)
+    if backend == 'reportlab':
+        return _cached_render(
+            data_fingerprint(translated_data, backend),
+            lambda: _render_reportlab_pdf(translated_data)
+        )
+
+    html_string = render_to_string(
+        'main/cv_translated_pdf.html', {'cv': translated_data}
     )
+    return generate_cv_pdf_content(html_string=html_string)
+
 
-    if not pdf_status.err:
-        pdf_content = result_file.getvalue()
-        result_file.close()
+def _cached_render(fingerprint, render, cv_id=None):
+    """Returns the cached PDF for a fingerprint, rendering it on a miss."""
+    pdf_content = get_cached_pdf(fingerprint)
+    if pdf_content is not None:
         return pdf_content
-    else:
+
+    pdf_content = render()
+    if pdf_content:
+        store_pdf(fingerprint, pdf_content, cv_id=cv_id)
+    return pdf_content
+
+
+def translated_cv_pdf_filename(translated_data, target_language):
+    """Returns the download filename of a translated CV PDF.
+
+    The name and language come from user input, so anything that is not
+    safe in a file or ZIP entry name (slashes, quotes) is dropped.
+    """
+    return get_valid_filename(
+        f"{translated_data['firstname']}_{translated_data['lastname']}"
+        f"_{target_language}_CV.pdf"
+    )
+
+
+def _render_pdf(html_string, cv_id=None):
+    """Converts an HTML document to PDF bytes with pisa."""
+    return _checked_render(render_pdf, html_string, cv_id, "Pisa")
+
+
+def _render_reportlab_pdf(cv_data, cv_id=None):
+    """Draws serialized CV data to PDF bytes with ReportLab."""
+    return _checked_render(render_cv_data_pdf, cv_data, cv_id, "ReportLab")
+
+
+def _checked_render(render, source, cv_id, engine):
+    """Runs a render on the shared renderer and reports failures."""
+    try:
+        pdf_content, error_code, log_lines = render(source)
+    except RendererError as e:
+        print(f"Error generating PDF for CV ID {cv_id}: {e}")
+        return None
+
+    if error_code:
         print(
-            f"Error generating PDF for CV ID {cv_instance.id}. "
-            f"Pisa Error Code: {pdf_status.err}"
+            f"Error generating PDF for CV ID {cv_id}. "
+            f"{engine} Error Code: {error_code}"
         )
-        for message in pdf_status.log:
-            print(
-                f"Pisa Log: Type={message.type}, Level={message.level}, "
-                f"Msg='{message.msg}', File='{message.filename}', Line="
-                f"{message.line}, Col={message.col}"
-            )
-        result_file.close()
+        for line in log_lines:
+            print(f"{engine} Log: {line}")
         return None
+    return pdf_content
 
 
 def serialize_cv_instance(cv: CV):
-    """Returns JSON from a CV instance."""
-    data = model_to_dict(
-        cv, fields=['firstname', 'lastname', 'bio', 'contacts']
-    )
-    data['skills'] = list(cv.skills.values_list('name', flat=True))
-    data['projects'] = list(cv.projects.values('name', 'description', 'link'))
-    return data
+    """Returns JSON from a CV instance, read from its `document`."""
+    return cv_document_data(cv)
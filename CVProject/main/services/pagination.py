@@ -0,0 +1,66 @@
+from django.conf import settings
+
+
+def _positive_int(value, default=None):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _page_url(request, **params):
+    query = request.GET.copy()
+    for key in ('after', 'before'):
+        query.pop(key, None)
+    query.update(params)
+    return f"?{query.urlencode()}"
+
+
+def keyset_paginate(queryset, request):
+    """Returns one page of `queryset` using id-based keyset pagination.
+
+    The page is selected by the `after` or `before` query parameter holding
+    a CV id, and its size by `page_size` (capped by `CV_MAX_PAGE_SIZE`).
+    Only `page_size + 1` rows are fetched, so related objects prefetched on
+    `queryset` are loaded for the current page only.
+
+    Returns:
+        dict: `items` on the page plus `next_url` and `previous_url`, which
+            are None at either end of the list.
+    """
+    page_size = min(
+        _positive_int(request.GET.get('page_size'), settings.CV_PAGE_SIZE),
+        settings.CV_MAX_PAGE_SIZE
+    )
+    after = _positive_int(request.GET.get('after'))
+    before = _positive_int(request.GET.get('before'))
+
+    if before is not None:
+        rows = list(
+            queryset.filter(id__lt=before).order_by('-id')[:page_size + 1]
+        )
+        has_previous = len(rows) > page_size
+        items = rows[:page_size][::-1]
+        has_next = True
+    else:
+        if after is not None:
+            queryset = queryset.filter(id__gt=after)
+        rows = list(queryset.order_by('id')[:page_size + 1])
+        has_next = len(rows) > page_size
+        items = rows[:page_size]
+        has_previous = after is not None
+
+    next_url = previous_url = None
+    if has_next:
+        last_id = items[-1].id if items else before - 1
+        next_url = _page_url(request, after=last_id)
+    if has_previous:
+        first_id = items[0].id if items else after + 1
+        previous_url = _page_url(request, before=first_id)
+
+    return {
+        'items': items,
+        'next_url': next_url,
+        'previous_url': previous_url,
+    }
@@ -0,0 +1,101 @@
+from main.services.reportlab_renderer import LAYOUT_VERSION
+from main.services.cv_document import cv_document_data
+from django.template.loader import get_template
+from django.core.cache import caches
+from functools import lru_cache
+import threading
+import hashlib
+import json
+
+CV_PDF_TEMPLATE = 'main/cv_detail_pdf.html'
+
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def _pdf_cache():
+    return caches['pdf']
+
+
+@lru_cache(maxsize=None)
+def template_version(template_name=CV_PDF_TEMPLATE):
+    """Returns a short hash of a template's source.
+
+    Editing the PDF template changes the version and therefore every
+    fingerprint built from it, so stale renders are never served after a
+    deploy.
+    """
+    source = get_template(template_name).template.source
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]
+
+
+def renderer_version(backend):
+    """Returns the version of the layout a PDF backend produces."""
+    if backend == 'reportlab':
+        return f'reportlab-{LAYOUT_VERSION}'
+    return f'pisa-{template_version()}'
+
+
+def _digest(payload):
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def cv_pdf_fingerprint(cv, backend='pisa'):
+    """Builds a content fingerprint for a CV's PDF.
+
+    The fingerprint covers every value rendered into the PDF: the CV
+    fields, skill names and projects, read from the CV's `document`, and
+    the backend's template or layout version.
+    """
+    return data_fingerprint(cv_document_data(cv), backend)
+
+
+def data_fingerprint(cv_data, backend):
+    """Builds a content fingerprint for a PDF drawn from serialized data."""
+    return _digest({'data': cv_data, 'renderer': renderer_version(backend)})
+
+
+def html_fingerprint(html_string):
+    """Builds a content fingerprint for an already rendered HTML document."""
+    return hashlib.sha256(html_string.encode('utf-8')).hexdigest()
+
+
+def get_cached_pdf(fingerprint):
+    """Returns cached PDF bytes for a fingerprint, or None on a miss."""
+    pdf_content = _pdf_cache().get(f'pdf:{fingerprint}')
+    with _stats_lock:
+        _stats['hits' if pdf_content is not None else 'misses'] += 1
+    return pdf_content
+
+
+def store_pdf(fingerprint, pdf_content, cv_id=None):
+    """Stores PDF bytes under a fingerprint.
+
+    When `cv_id` is given, the fingerprint is also remembered for that CV
+    so the entry can be dropped as soon as the CV changes.
+    """
+    cache = _pdf_cache()
+    cache.set(f'pdf:{fingerprint}', pdf_content)
+    if cv_id is not None:
+        cache.set(f'cv:{cv_id}', fingerprint)
+
+
+def invalidate_cv_pdf(cv_id):
+    """Drops the cached PDF of a CV, if any."""
+    cache = _pdf_cache()
+    fingerprint = cache.get(f'cv:{cv_id}')
+    if fingerprint is not None:
+        cache.delete_many([f'pdf:{fingerprint}', f'cv:{cv_id}'])
+
+
+def pdf_cache_stats():
+    """Returns hit/miss counters of the PDF cache for this process."""
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+    }
@@ -0,0 +1,246 @@
+from main.services.reportlab_renderer import render_cv_data_to_pdf
+from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError
+from django.conf import settings
+from xhtml2pdf import pisa
+import multiprocessing
+import threading
+import atexit
+import time
+import io
+
+WARM_UP_HTML = "<html><body><p>Warm-up</p></body></html>"
+
+
+class RendererError(Exception):
+    """Raised when the renderer cannot produce a PDF in time."""
+
+
+class RendererBusy(RendererError):
+    """Raised when every worker is busy and the queue is full."""
+
+
+class RenderTimeout(RendererError):
+    """Raised when a render takes longer than the configured timeout."""
+
+
+class RendererUnavailable(RendererError):
+    """Raised when the worker pool broke or the render was cancelled."""
+
+
+def render_html_to_pdf(html_string):
+    """Converts an HTML document to PDF with pisa.
+
+    Runs both in pool workers and inline, so it only deals in picklable
+    values.
+
+    Returns:
+        tuple: `(pdf_content, error_code, log_lines)`. `pdf_content` is None
+            and `log_lines` holds pisa's messages when rendering failed.
+    """
+    result_file = io.BytesIO()
+    pdf_status = pisa.CreatePDF(
+        src=html_string.encode('utf-8'),
+        dest=result_file,
+        encoding='utf-8'
+    )
+    if not pdf_status.err:
+        return result_file.getvalue(), 0, []
+
+    log_lines = [
+        f"Type={message.type}, Level={message.level}, Msg='{message.msg}', "
+        f"File='{message.filename}', Line={message.line}, Col={message.col}"
+        for message in pdf_status.log
+    ]
+    return None, pdf_status.err, log_lines
+
+
+def _warm_up_worker():
+    # Imports pisa/ReportLab and registers fonts once per worker process,
+    # not once per render.
+    render_html_to_pdf(WARM_UP_HTML)
+
+
+def _release_once(semaphore):
+    """Returns a callable releasing `semaphore` on its first call only."""
+    lock = threading.Lock()
+    released = []
+
+    def release():
+        with lock:
+            if released:
+                return
+            released.append(True)
+        semaphore.release()
+    return release
+
+
+class PDFRenderer:
+    """Renders PDFs on a pool of pre-warmed worker processes.
+
+    pisa is pure Python and CPU-bound, so rendering in threads serializes
+    on the GIL; a process pool lets PDF throughput scale with cores. At most
+    `workers + max_queue` renders are accepted at once; callers beyond that
+    wait for a slot and get `RendererBusy` if none frees up. Waiting for a
+    slot and for the result together take at most `timeout` seconds. A
+    render that runs past it has its pool killed, and a pool whose worker
+    died is replaced on the next render.
+
+    With `workers=0`, or when running inside a daemonic process that may
+    not start children, renders happen inline in the calling process.
+    """
+
+    def __init__(self, workers, max_queue, timeout):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(workers + max_queue, 1))
+
+    @property
+    def inline(self):
+        return (
+            self.workers <= 0
+            or multiprocessing.current_process().daemon
+        )
+
+    def render(self, html_string):
+        """Renders HTML to PDF with pisa. See `run`."""
+        return self.run(render_html_to_pdf, html_string)
+
+    def run(self, render_func, *args):
+        """Runs a render function on a worker.
+
+        `render_func` must be a picklable module-level function returning a
+        `(pdf_content, error_code, log_lines)` tuple, such as
+        `render_html_to_pdf`.
+
+        Raises:
+            RendererBusy: No slot became free within the timeout.
+            RenderTimeout: The render did not finish within the timeout.
+            RendererUnavailable: A worker died or the pool was shut down.
+        """
+        if self.inline:
+            return render_func(*args)
+
+        deadline = time.monotonic() + self.timeout
+        if not self._slots.acquire(timeout=self.timeout):
+            raise RendererBusy(
+                f"All {self.workers} PDF workers are busy and the queue "
+                f"is full."
+            )
+        executor = self._get_executor()
+        try:
+            future = executor.submit(render_func, *args)
+        except BaseException as e:
+            self._slots.release()
+            if isinstance(e, BrokenProcessPool):
+                # A worker died since the last render.
+                self._reset(executor)
+            if isinstance(e, (BrokenProcessPool, RuntimeError)):
+                raise RendererUnavailable(f"PDF workers unavailable: {e}")
+            raise
+        # The slot is held until the worker is really done, or until a
+        # timed out render's worker is killed.
+        release = _release_once(self._slots)
+        future.add_done_callback(lambda _: release())
+
+        try:
+            return future.result(
+                timeout=max(deadline - time.monotonic(), 0)
+            )
+        except TimeoutError:
+            if not future.cancel():
+                # Already running: a hung render would keep its worker and
+                # slot forever, so kill the pool and start a fresh one.
+                self._kill(executor)
+            release()
+            raise RenderTimeout(
+                f"PDF rendering took longer than {self.timeout} seconds."
+            )
+        except BrokenProcessPool as e:
+            # Start over with a fresh pool on the next render.
+            self._reset(executor)
+            raise RendererUnavailable(f"PDF workers unavailable: {e}")
+        except CancelledError:
+            raise RendererUnavailable("PDF rendering was cancelled.")
+
+    def start(self):
+        """Starts all worker processes ahead of the first render."""
+        if self.inline:
+            return
+        executor = self._get_executor()
+        for future in [
+            executor.submit(_warm_up_worker) for _ in range(self.workers)
+        ]:
+            future.result()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _kill(self, executor):
+        """Terminates a pool's workers and drops the pool.
+
+        Other renders running on it fail with `RendererUnavailable`.
+        """
+        self._reset(executor)
+        # ProcessPoolExecutor has no public way to stop running tasks.
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+
+    def _reset(self, executor):
+        """Drops a broken pool unless another thread already replaced it."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # Spawned rather than forked: the parent may be a threaded
+                # server holding locks and database connections.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_up_worker,
+                )
+            return self._executor
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_pdf_renderer():
+    """Returns the process-wide renderer configured from settings."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = PDFRenderer(
+                workers=settings.PDF_RENDERER_WORKERS,
+                max_queue=settings.PDF_RENDERER_QUEUE_SIZE,
+                timeout=settings.PDF_RENDER_TIMEOUT,
+            )
+            atexit.register(_renderer.shutdown)
+        return _renderer
+
+
+def render_pdf(html_string):
+    """Renders HTML to PDF with pisa on the shared renderer.
+
+    This is the entry point for both web views and Celery tasks.
+    """
+    return get_pdf_renderer().render(html_string)
+
+
+def render_cv_data_pdf(cv_data):
+    """Draws CV data to PDF with ReportLab on the shared renderer."""
+    return get_pdf_renderer().run(render_cv_data_to_pdf, cv_data)
@@ -0,0 +1,102 @@
+from main.services.cv_document import update_cv_documents
+from main.services.search import update_search_vectors
+from main.models import Project
+
+PROJECT_FIELDS = ('name', 'description', 'link')
+
+
+def diff_projects(cv_id, existing, projects_data):
+    """Matches submitted projects to a CV's current ones by id.
+
+    Submitted projects with an `id` update that project, the ones without
+    are new, and current projects missing from the submission are removed.
+    Projects whose values did not change are left out entirely.
+
+    Args:
+        cv_id (int): The CV the projects belong to.
+        existing (Iterable[Project]): The CV's current projects.
+        projects_data (list[dict]): Validated project data.
+
+    Returns:
+        tuple: Changed `Project` instances, unsaved new ones, and the ids
+            of the projects to delete.
+
+    Raises:
+        ValueError: If an id is not one of the CV's projects or repeats.
+    """
+    current = {project.pk: project for project in existing}
+    changed, new, kept = [], [], set()
+
+    for data in projects_data:
+        data = dict(data)
+        project_id = data.pop('id', None)
+        if project_id is None:
+            new.append(Project(cv_id=cv_id, **data))
+            continue
+        if project_id not in current:
+            raise ValueError(
+                f'Project with id {project_id} does not belong to this CV.'
+            )
+        if project_id in kept:
+            raise ValueError(
+                f'Project with id {project_id} appears more than once.'
+            )
+        kept.add(project_id)
+
+        project = current[project_id]
+        updated = False
+        for field in PROJECT_FIELDS:
+            if field in data and getattr(project, field) != data[field]:
+                setattr(project, field, data[field])
+                updated = True
+        if updated:
+            changed.append(project)
+
+    removed = [pk for pk in current if pk not in kept]
+    return changed, new, removed
+
+
+def cv_projects_updated(cv_ids):
+    """Rebuilds the documents and search vectors of CVs whose projects
+    were written in bulk, which sends no signals."""
+    cv_ids = list(cv_ids)
+    update_cv_documents(cv_ids)
+    update_search_vectors(cv_ids)
+
+
+def apply_project_diffs(diffs, batch_size=None, refresh=True):
+    """Writes project diffs with one query per kind of change.
+
+    Args:
+        diffs (Iterable[tuple]): Results of `diff_projects`, possibly for
+            several CVs.
+        batch_size (int): Optional batch size for the bulk writes.
+        refresh (bool): Whether to rebuild the documents and search
+            vectors of the CVs touched; callers refreshing every CV they
+            wrote anyway can skip it.
+    """
+    changed, new, removed = [], [], []
+    for diff_changed, diff_new, diff_removed in diffs:
+        changed.extend(diff_changed)
+        new.extend(diff_new)
+        removed.extend(diff_removed)
+
+    cv_ids = {project.cv_id for project in changed + new}
+    if removed and refresh:
+        cv_ids.update(Project.objects.filter(pk__in=removed).values_list(
+            'cv_id', flat=True
+        ))
+
+    if removed:
+        # A plain DELETE: Project has no dependent rows, and the per-row
+        # post_delete signals would redo the refresh below for each one.
+        removed_projects = Project.objects.filter(pk__in=removed)
+        removed_projects._raw_delete(removed_projects.db)
+    if changed:
+        Project.objects.bulk_update(
+            changed, PROJECT_FIELDS, batch_size=batch_size
+        )
+    if new:
+        Project.objects.bulk_create(new, batch_size=batch_size)
+    if refresh and cv_ids:
+        cv_projects_updated(cv_ids)
@@ -0,0 +1,137 @@
+from reportlab.platypus import HRFlowable, Paragraph, SimpleDocTemplate, Spacer
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.units import mm
+from xml.sax.saxutils import escape
+import io
+
+# Bump whenever the layout changes so cached PDFs are not reused.
+LAYOUT_VERSION = 1
+
+LINK_CONTACTS = ('linkedin', 'github')
+
+
+def _styles():
+    base = getSampleStyleSheet()
+    body = ParagraphStyle(
+        'CVBody', parent=base['BodyText'], fontName='Helvetica',
+        fontSize=10, leading=14
+    )
+    return {
+        'title': ParagraphStyle(
+            'CVTitle', parent=base['Title'], fontName='Helvetica-Bold',
+            fontSize=24, leading=28, alignment=TA_CENTER, spaceAfter=12
+        ),
+        'heading': ParagraphStyle(
+            'CVHeading', parent=base['Heading2'],
+            fontName='Helvetica-Bold', fontSize=16, leading=20,
+            textColor=colors.HexColor('#111111'), spaceBefore=12,
+            spaceAfter=2
+        ),
+        'body': body,
+        'project_name': ParagraphStyle(
+            'CVProjectName', parent=body, fontName='Helvetica-Bold',
+            fontSize=11, spaceBefore=6
+        ),
+    }
+
+
+def _text(value):
+    """Escapes text for Paragraph markup, keeping line breaks."""
+    return escape(str(value)).replace('\n', '<br/>')
+
+
+def _link(url, label):
+    href = escape(str(url), {'"': '&quot;'})
+    return f'<a href="{href}" color="#0066cc">{_text(label)}</a>'
+
+
+def _section(story, title, styles):
+    story.append(Paragraph(_text(title), styles['heading']))
+    story.append(HRFlowable(
+        width='100%', thickness=0.5, color=colors.HexColor('#cccccc'),
+        spaceAfter=6
+    ))
+
+
+def build_cv_story(cv_data, styles=None):
+    """Builds the platypus flowables of a CV.
+
+    `cv_data` has the shape produced by `serialize_cv_instance` (and by
+    `translate_cv`): names, bio, contacts dict, skill names and project
+    dicts. The layout follows `cv_translated_pdf.html`.
+    """
+    styles = styles or _styles()
+    full_name = f"{cv_data.get('firstname', '')} {cv_data.get('lastname', '')}"
+    story = [Paragraph(_text(full_name), styles['title'])]
+
+    if cv_data.get('bio'):
+        _section(story, "Bio", styles)
+        story.append(Paragraph(_text(cv_data['bio']), styles['body']))
+
+    if cv_data.get('skills'):
+        _section(story, "Skills", styles)
+        story.append(Paragraph(
+            ' &nbsp;&middot;&nbsp; '.join(
+                _text(skill) for skill in cv_data['skills']
+            ),
+            styles['body']
+        ))
+
+    if cv_data.get('projects'):
+        _section(story, "Projects", styles)
+        for project in cv_data['projects']:
+            story.append(Paragraph(
+                _text(project.get('name', '')), styles['project_name']
+            ))
+            if project.get('description'):
+                story.append(
+                    Paragraph(_text(project['description']), styles['body'])
+                )
+            if project.get('link'):
+                story.append(Paragraph(
+                    _link(project['link'], "View Project"), styles['body']
+                ))
+
+    if cv_data.get('contacts'):
+        _section(story, "Contacts", styles)
+        for key, value in cv_data['contacts'].items():
+            label = str(key).capitalize()
+            if key in LINK_CONTACTS:
+                line = _link(value, label)
+            elif key == 'email':
+                line = f"<b>{_text(label)}:</b> " + _link(
+                    f"mailto:{value}", value
+                )
+            else:
+                line = f"<b>{_text(label)}:</b> {_text(value)}"
+            story.append(Paragraph(line, styles['body']))
+
+    story.append(Spacer(1, 6 * mm))
+    return story
+
+
+def render_cv_data_to_pdf(cv_data):
+    """Draws a CV straight to PDF with ReportLab, skipping HTML and CSS.
+
+    Returns:
+        tuple: `(pdf_content, error_code, log_lines)`, the same contract as
+            `pdf_renderer.render_html_to_pdf`.
+    """
+    result_file = io.BytesIO()
+    try:
+        document = SimpleDocTemplate(
+            result_file, pagesize=A4,
+            leftMargin=20 * mm, rightMargin=20 * mm,
+            topMargin=20 * mm, bottomMargin=20 * mm,
+            title=(
+                f"{cv_data.get('firstname', '')} "
+                f"{cv_data.get('lastname', '')} - CV"
+            ),
+        )
+        document.build(build_cv_story(cv_data))
+    except Exception as e:
+        return None, 1, [f"ReportLab error: {e}"]
+    return result_file.getvalue(), 0, []
@@ -0,0 +1,85 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import F, OuterRef, Subquery
+from main.models import CV, Project
+from django.conf import settings
+
+
+def _joined(queryset, field):
+    """Returns a subquery joining `field` of a CV's related rows."""
+    return Subquery(
+        queryset.filter(cv_id=OuterRef('pk')).values('cv_id').annotate(
+            text=StringAgg(field, ' ')
+        ).values('text')
+    )
+
+
+def cv_search_vector():
+    """Builds the weighted tsvector expression of a CV.
+
+    Names weigh most, then skills and project names, then the bio and
+    finally project descriptions.
+    """
+    config = settings.CV_SEARCH_CONFIG
+    through = CV.skills.through.objects.all()
+    projects = Project.objects.all()
+    return (
+        SearchVector('firstname', 'lastname', weight='A', config=config)
+        + SearchVector(
+            _joined(through, 'skill__name'), weight='B', config=config
+        )
+        + SearchVector(_joined(projects, 'name'), weight='B', config=config)
+        + SearchVector('bio', weight='C', config=config)
+        + SearchVector(
+            _joined(projects, 'description'), weight='D', config=config
+        )
+    )
+
+
+def update_search_vectors(cv_ids=None):
+    """Recomputes the search vectors of the given CVs in one UPDATE.
+
+    Without `cv_ids` every CV is reindexed.
+    """
+    queryset = CV.objects.all()
+    if cv_ids is not None:
+        if not cv_ids:
+            return 0
+        queryset = queryset.filter(pk__in=cv_ids)
+    return queryset.update(search_vector=cv_search_vector())
+
+
+def update_skill_ids(cv_ids):
+    """Copies the skill ids of the given CVs into `CV.skill_ids`."""
+    if not cv_ids:
+        return 0
+    return CV.objects.filter(pk__in=cv_ids).update(
+        skill_ids=ArraySubquery(
+            CV.skills.through.objects.filter(
+                cv_id=OuterRef('pk')
+            ).order_by('skill_id').values('skill_id')
+        )
+    )
+
+
+def search_cvs(queryset, text):
+    """Filters CVs matching a web-search style query and ranks them.
+
+    Args:
+        queryset (QuerySet): The CVs to search.
+        text (str): The query, e.g. `python -java "data pipelines"`.
+
+    Returns:
+        QuerySet: Matching CVs annotated with their `rank`.
+    """
+    query = SearchQuery(
+        text, search_type='websearch', config=settings.CV_SEARCH_CONFIG
+    )
+    return queryset.filter(search_vector=query).annotate(
+        rank=SearchRank(F('search_vector'), query)
+    )
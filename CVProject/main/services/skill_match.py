@@ -0,0 +1,232 @@
+from django.db.models import Count, Sum
+from django.utils import timezone
+from django.conf import settings
+from main.models import CV
+import threading
+import datetime
+import heapq
+import time
+
+
+class SkillMatchIndex:
+    """In-memory inverted index from skills to the CVs having them.
+
+    Scoring a job's skills walks only the posting lists of those skills,
+    so the cost grows with the number of matching CVs rather than with
+    every CV's skill set, and no query runs while scoring.
+
+    The index is loaded from `CV.skill_ids` on first use and then kept up
+    to date incrementally. CVs changed in this process are reloaded on the
+    next match (see `mark_stale`); changes made by other processes are
+    picked up through `CV.updated_at`, checked at most every
+    `sync_interval` seconds. A CV count or id sum that no longer adds up,
+    e.g. after a delete elsewhere, triggers a full reload.
+
+    Queries run outside the lock that scoring takes: one thread syncs at a
+    time while the others keep scoring against the current index, and a
+    reload is built aside and swapped in.
+    """
+
+    # Re-read CVs updated slightly before the last sync, so rows committed
+    # late by a concurrent transaction are not missed.
+    sync_overlap = datetime.timedelta(seconds=5)
+
+    def __init__(self, sync_interval=1.0):
+        self.sync_interval = sync_interval
+        self._postings = {}
+        self._cv_skills = None
+        self._id_sum = 0
+        self._stale = set()
+        self._synced_at = None
+        self._checked_at = 0.0
+        # Guards the index data; held only while reading or applying it.
+        self._lock = threading.Lock()
+        # Lets one thread at a time query the database to sync.
+        self._sync_lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cv_skills or ())
+
+    def mark_stale(self, cv_ids):
+        """Schedules CVs to be reloaded before the next match."""
+        with self._lock:
+            self._stale.update(cv_ids)
+
+    def reset(self):
+        """Drops the index; it is rebuilt on the next match."""
+        with self._lock:
+            self._postings = {}
+            self._cv_skills = None
+            self._id_sum = 0
+            self._stale = set()
+            self._synced_at = None
+
+    def match(self, weights, limit):
+        """Ranks CVs by the summed weight of the skills they have.
+
+        Args:
+            weights (dict): Weight of each skill id.
+            limit (int): Number of CVs to return.
+
+        Returns:
+            list: `(cv_id, score, matched_skill_ids)` tuples, best first.
+                Ties are broken by the lower CV id. CVs having none of
+                the skills are left out.
+        """
+        while True:
+            self._sync()
+            with self._lock:
+                # Reset by another thread since the sync: sync again.
+                if self._cv_skills is not None:
+                    return self._score(weights, limit)
+
+    def _score(self, weights, limit):
+        scores = {}
+        for skill_id, weight in weights.items():
+            for cv_id in self._postings.get(skill_id, ()):
+                scores[cv_id] = scores.get(cv_id, 0.0) + weight
+        best = heapq.nlargest(
+            limit, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        return [
+            (
+                cv_id,
+                score,
+                sorted(self._cv_skills[cv_id].intersection(weights)),
+            )
+            for cv_id, score in best
+        ]
+
+    def _sync(self):
+        with self._lock:
+            # Without an index, or with this process's own changes pending,
+            # wait for the sync; otherwise score against the current index
+            # while another thread syncs.
+            wait = self._cv_skills is None or bool(self._stale)
+        if not self._sync_lock.acquire(blocking=wait):
+            return
+        try:
+            self._sync_locked()
+        finally:
+            self._sync_lock.release()
+
+    def _sync_locked(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._cv_skills is None:
+                loaded = False
+            else:
+                loaded = True
+                stale, self._stale = self._stale, set()
+                synced_at = self._synced_at
+                check = now - self._checked_at >= self.sync_interval
+        if not loaded:
+            self._load()
+            return
+
+        changed = {}
+        if check:
+            started = timezone.now()
+            changed = dict(CV.objects.filter(
+                updated_at__gte=synced_at - self.sync_overlap
+            ).values_list('id', 'skill_ids'))
+            totals = CV.objects.aggregate(count=Count('id'), ids=Sum('id'))
+        stale.difference_update(changed)
+        if stale:
+            found = dict(
+                CV.objects.filter(pk__in=stale).values_list('id', 'skill_ids')
+            )
+            changed.update((cv_id, found.get(cv_id)) for cv_id in stale)
+
+        with self._lock:
+            if self._cv_skills is None:
+                return
+            for cv_id, skill_ids in changed.items():
+                self._set(cv_id, skill_ids)
+            if not check:
+                return
+            self._synced_at = started
+            self._checked_at = now
+            # A delete elsewhere changes the count; one hidden by a create
+            # still changes the sum, as new ids are always larger.
+            consistent = (
+                totals['count'] == len(self._cv_skills)
+                and (totals['ids'] or 0) == self._id_sum
+            )
+        if not consistent:
+            self._load()
+
+    def _load(self):
+        checked_at = time.monotonic()
+        synced_at = timezone.now()
+        with self._lock:
+            # Changes marked so far are read by the load itself.
+            self._stale = set()
+        postings = {}
+        cv_skills = {}
+        for cv_id, skill_ids in CV.objects.values_list('id', 'skill_ids'):
+            cv_skills[cv_id] = frozenset(skill_ids or ())
+            for skill_id in cv_skills[cv_id]:
+                postings.setdefault(skill_id, set()).add(cv_id)
+        with self._lock:
+            self._postings = postings
+            self._cv_skills = cv_skills
+            self._id_sum = sum(cv_skills)
+            self._checked_at = checked_at
+            self._synced_at = synced_at
+
+    def _set(self, cv_id, skill_ids):
+        """Replaces a CV's skills; None removes the CV."""
+        old = self._cv_skills.pop(cv_id, None)
+        if old is None:
+            old = frozenset()
+        else:
+            self._id_sum -= cv_id
+        new = frozenset(skill_ids) if skill_ids is not None else None
+        for skill_id in old - (new or frozenset()):
+            posting = self._postings[skill_id]
+            posting.discard(cv_id)
+            if not posting:
+                del self._postings[skill_id]
+        if new is None:
+            return
+        for skill_id in new - old:
+            self._postings.setdefault(skill_id, set()).add(cv_id)
+        self._cv_skills[cv_id] = new
+        self._id_sum += cv_id
+
+
+skill_match_index = SkillMatchIndex(
+    sync_interval=settings.SKILL_MATCH_SYNC_INTERVAL
+)
+
+
+def match_cvs(required, nice=(), limit=10):
+    """Ranks CVs against a job's required and nice-to-have skills.
+
+    Required skills weigh `SKILL_MATCH_REQUIRED_WEIGHT`, nice-to-have ones
+    `SKILL_MATCH_NICE_WEIGHT`. A CV's score is the weight of the skills it
+    has divided by the weight of all requested skills, so 1.0 is a perfect
+    match.
+
+    Args:
+        required (Iterable[int]): Required skill ids.
+        nice (Iterable[int]): Nice-to-have skill ids.
+        limit (int): Number of CVs to return.
+
+    Returns:
+        list: `(cv_id, score, matched_skill_ids)` tuples, best first.
+    """
+    weights = {skill_id: settings.SKILL_MATCH_NICE_WEIGHT for skill_id in nice}
+    weights.update(
+        (skill_id, settings.SKILL_MATCH_REQUIRED_WEIGHT)
+        for skill_id in required
+    )
+    total = sum(weights.values())
+    if not total:
+        return []
+    return [
+        (cv_id, round(score / total, 4), matched)
+        for cv_id, score, matched in skill_match_index.match(weights, limit)
+    ]
@@ -0,0 +1,107 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from contextlib import contextmanager
+from django.conf import settings
+import threading
+import time
+
+# Backends selectable with TRANSLATION_BACKEND.
+BACKENDS = {
+    'gemini': 'main.services.gemini_translate.GeminiBackend',
+    'fake': 'main.services.translation_backends.FakeBackend',
+}
+
+
+class TranslationBackend:
+    """Translates CV text segments.
+
+    `model_name` is part of every cache and translation memory key, so
+    translations made by different backends or models are never mixed.
+    """
+    model_name = None
+
+    def translate_segments(self, segments, target_language):
+        """Translates text segments.
+
+        Returns:
+            list | dict: The translations in the order of `segments`, or
+                a dict with an `error` key if translating failed.
+        """
+        raise NotImplementedError
+
+
+class FakeBackend(TranslationBackend):
+    """Deterministic offline stand-in for a translation model.
+
+    Each segment comes back prefixed with the target language, after
+    `latency` seconds per request, so the pipeline can be tested and
+    load-tested without network access.
+    """
+    model_name = 'fake'
+
+    def __init__(self, latency=0.0, sleep=time.sleep):
+        self.latency = latency
+        self._sleep = sleep
+
+    def translate_segments(self, segments, target_language):
+        if self.latency:
+            self._sleep(self.latency)
+        return [f"[{target_language}] {segment}" for segment in segments]
+
+
+def build_translation_backend(name=None):
+    """Creates the backend called `name`, configured from settings.
+
+    Raises:
+        ImproperlyConfigured: If `name` is not one of BACKENDS.
+    """
+    name = name or settings.TRANSLATION_BACKEND
+    if name not in BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unknown translation backend '{name}'. "
+            f"Choose one of: {', '.join(BACKENDS)}."
+        )
+    backend_class = import_string(BACKENDS[name])
+    if name == 'fake':
+        return backend_class(latency=settings.TRANSLATION_FAKE_LATENCY)
+    return backend_class(
+        api_key=settings.GEMINI_API_KEY,
+        model_name=settings.GEMINI_MODEL,
+        timeout=settings.GEMINI_TIMEOUT,
+        max_retries=settings.GEMINI_MAX_RETRIES,
+        retry_backoff=settings.GEMINI_RETRY_BACKOFF,
+        max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+    )
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_translation_backend():
+    """Returns the process-wide backend selected by TRANSLATION_BACKEND."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = build_translation_backend()
+        return _backend
+
+
+@contextmanager
+def use_translation_backend(backend):
+    """Makes `backend` the process-wide backend inside the block."""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    try:
+        yield backend
+    finally:
+        with _backend_lock:
+            _backend = previous
+
+
+def translate_segments(segments, target_language):
+    """Translates text segments with the configured backend."""
+    return get_translation_backend().translate_segments(
+        segments, target_language
+    )
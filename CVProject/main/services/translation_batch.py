@@ -0,0 +1,199 @@
+from main.services.translation_memory import (
+    apply_segments,
+    extract_segments,
+    lookup_segments,
+    report_prompt_savings,
+    store_segments,
+)
+from main.services.gemini_translate import (
+    estimate_tokens,
+    segment_prompt_tokens,
+    whole_cv_prompt_tokens,
+)
+from main.services.translation_backends import translate_segments
+from main.services.translation_cache import store_translations
+from main.services.cv_utils import serialize_cv_instance
+from main.services.cv_document import cv_documents
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+# Rough cost of a segment's key, quotes and separators in the compact
+# prompt JSON.
+SEGMENT_OVERHEAD_TOKENS = 3
+
+
+def segment_tokens(segment):
+    """Estimates the prompt tokens a segment adds to a request."""
+    return estimate_tokens(segment) + SEGMENT_OVERHEAD_TOKENS
+
+
+def pack_segments(segments, max_tokens):
+    """Groups segments into batches of at most `max_tokens` each.
+
+    A segment larger than the budget is sent on its own.
+
+    Returns:
+        list[list[str]]: The batches, keeping the order of `segments`.
+    """
+    batches = []
+    batch, size = [], 0
+    for segment in segments:
+        tokens = segment_tokens(segment)
+        if batch and size + tokens > max_tokens:
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(segment)
+        size += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class RateLimiter:
+    """Spaces out calls so at most `per_minute` start in any minute.
+
+    Thread-safe; a `per_minute` of 0 disables the limit.
+    """
+
+    def __init__(self, per_minute, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until the caller may start its call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            self._sleep(start - now)
+
+
+def iter_cv_chunks(chunk_size, after=0):
+    """Yields lists of CVs ordered by id, read one chunk per query."""
+    while True:
+        chunk = list(
+            cv_documents().filter(pk__gt=after).order_by('id')[:chunk_size]
+        )
+        if not chunk:
+            return
+        yield chunk
+        after = chunk[-1].pk
+
+
+class Pretranslator:
+    """Translates CVs in bulk through the translation memory.
+
+    The segments of a chunk of CVs are deduplicated, looked up in memory,
+    and the unknown ones packed into requests of at most `max_tokens`.
+    Requests run on `concurrency` threads, started no faster than
+    `rate_limit` per minute. Translated segments are stored in memory and
+    every fully translated CV gets its `CVTranslation`, so later translate
+    requests are served without a model call.
+    """
+
+    def __init__(self, languages, max_tokens=2000, concurrency=4,
+                 rate_limit=60):
+        self.languages = list(languages)
+        self.max_tokens = max_tokens
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate_limit)
+        self.stats = {
+            'cvs': 0, 'requests': 0, 'failed_requests': 0,
+            'segments_from_memory': 0, 'segments_translated': 0,
+            'estimated_prompt_tokens': 0, 'estimated_saved_tokens': 0,
+        }
+
+    def _call(self, segments, language):
+        self.limiter.acquire()
+        return translate_segments(segments, language)
+
+    def translate_chunk(self, cvs, executor):
+        """Translates a chunk of CVs into every language.
+
+        Returns:
+            bool: Whether every CV of the chunk was fully translated.
+        """
+        cv_data = {cv.pk: serialize_cv_instance(cv) for cv in cvs}
+        segments = list(dict.fromkeys(
+            segment
+            for data in cv_data.values()
+            for segment in extract_segments(data)
+        ))
+
+        known = {}
+        requests = []
+        whole_cv_tokens = prompt_tokens = 0
+        for language in self.languages:
+            known[language] = lookup_segments(segments, language)
+            self.stats['segments_from_memory'] += len(known[language])
+            missing = [s for s in segments if s not in known[language]]
+            batches = pack_segments(missing, self.max_tokens)
+            requests += [
+                (language, batch, executor.submit(self._call, batch, language))
+                for batch in batches
+            ]
+            # Only CVs with unseen text would have needed a whole-CV prompt.
+            unseen = set(missing)
+            whole_cv_tokens += sum(
+                whole_cv_prompt_tokens(data, language)
+                for data in cv_data.values()
+                if unseen.intersection(extract_segments(data))
+            )
+            prompt_tokens += sum(
+                segment_prompt_tokens(batch, language) for batch in batches
+            )
+        report_prompt_savings(
+            whole_cv_tokens, prompt_tokens,
+            f"Chunk of {len(cvs)} CV(s) in {len(requests)} request(s)",
+        )
+        self.stats['estimated_prompt_tokens'] += prompt_tokens
+        self.stats['estimated_saved_tokens'] += whole_cv_tokens - prompt_tokens
+
+        complete = True
+        for language, batch, future in requests:
+            self.stats['requests'] += 1
+            translated = future.result()
+            if isinstance(translated, dict):
+                print(
+                    f"Failed to translate {len(batch)} segment(s) into "
+                    f"{language}: {translated['error']}"
+                )
+                self.stats['failed_requests'] += 1
+                complete = False
+                continue
+            new = dict(zip(batch, translated))
+            store_segments(new, language)
+            known[language].update(new)
+            self.stats['segments_translated'] += len(new)
+
+        store_translations(
+            (cv_id, data, language, apply_segments(data, known[language]))
+            for cv_id, data in cv_data.items()
+            for language in self.languages
+            if all(s in known[language] for s in extract_segments(data))
+        )
+        self.stats['cvs'] += len(cvs)
+        return complete
+
+    def run(self, chunks, on_chunk=None):
+        """Translates every chunk of CVs.
+
+        `on_chunk(cvs, complete)` is called after each chunk, e.g. to
+        save a checkpoint.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max(self.concurrency, 1),
+            thread_name_prefix='cv-pretranslate',
+        ) as executor:
+            for cvs in chunks:
+                complete = self.translate_chunk(cvs, executor)
+                if on_chunk is not None:
+                    on_chunk(cvs, complete)
+        return self.stats
@@ -0,0 +1,92 @@
+from main.services.translation_backends import get_translation_backend
+from main.services.translation_memory import translate_cv_data
+from main.services.gemini_translate import PROMPT_VERSION
+from main.services.cv_utils import serialize_cv_instance
+from main.models import CVTranslation
+from django.utils import timezone
+from django.conf import settings
+from datetime import timedelta
+import hashlib
+import json
+
+
+def content_hash(cv_data):
+    """Returns a stable SHA-256 of serialized CV data."""
+    encoded = json.dumps(cv_data, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def translation_key(cv_data, target_language):
+    """Returns the lookup fields identifying a cached translation."""
+    return {
+        'content_hash': content_hash(cv_data),
+        'language': target_language,
+        'model_name': get_translation_backend().model_name,
+        'prompt_version': PROMPT_VERSION,
+    }
+
+
+def get_cached_translation(cv_data, target_language):
+    """Returns a cached, unexpired translation of `cv_data`, or None."""
+    cutoff = timezone.now() - timedelta(
+        seconds=settings.TRANSLATION_CACHE_TTL
+    )
+    return CVTranslation.objects.filter(
+        updated_at__gte=cutoff,
+        **translation_key(cv_data, target_language)
+    ).values_list('data', flat=True).first()
+
+
+def store_translation(cv_id, cv_data, target_language, translated_data):
+    """Saves (or refreshes) the cached translation of `cv_data`."""
+    CVTranslation.objects.update_or_create(
+        defaults={'cv_id': cv_id, 'data': translated_data},
+        **translation_key(cv_data, target_language)
+    )
+
+
+def store_translations(entries):
+    """Saves many translations at once, refreshing existing entries.
+
+    Args:
+        entries (Iterable[tuple]): `(cv_id, cv_data, target_language,
+            translated_data)` tuples. CVs with identical data share one
+            entry.
+    """
+    translations = {}
+    for cv_id, cv_data, target_language, translated_data in entries:
+        key = translation_key(cv_data, target_language)
+        translations[tuple(key.values())] = CVTranslation(
+            cv_id=cv_id, data=translated_data, **key
+        )
+    CVTranslation.objects.bulk_create(
+        list(translations.values()),
+        update_conflicts=True,
+        unique_fields=[
+            'content_hash', 'language', 'model_name', 'prompt_version'
+        ],
+        update_fields=['cv', 'data', 'updated_at'],
+    )
+
+
+def invalidate_cv_translations(cv_id):
+    """Drops every cached translation of a CV."""
+    CVTranslation.objects.filter(cv_id=cv_id).delete()
+
+
+def translate_cv(cv, target_language):
+    """Translates a CV, reusing a cached result when one is available.
+
+    On a miss the CV is translated segment by segment through the
+    translation memory. Returns the translated data, or a dict with an
+    `error` key if the model failed; errors are never cached.
+    """
+    cv_data = serialize_cv_instance(cv)
+    cached = get_cached_translation(cv_data, target_language)
+    if cached is not None:
+        return cached
+
+    translated_data = translate_cv_data(cv_data, target_language)
+    if "error" not in translated_data:
+        store_translation(cv.pk, cv_data, target_language, translated_data)
+    return translated_data
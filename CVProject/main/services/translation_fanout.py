@@ -0,0 +1,117 @@
+from main.services.cv_utils import (
+    generate_translated_cv_pdf_content,
+    translated_cv_pdf_filename,
+)
+from main.services.translation_cache import translate_cv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.db import connections
+import zipfile
+
+# Lists the languages that could not be translated.
+ERRORS_FILENAME = 'errors.txt'
+
+
+def _translate_pdf(cv, language, backend):
+    """Translates a CV into one language and renders its PDF.
+
+    Runs on a pool thread, which gets its own database connection; it is
+    closed before the thread is reused.
+
+    Returns:
+        tuple: The language, the PDF filename and content, and an error
+            message; either the content or the error is None.
+    """
+    try:
+        translated_data = translate_cv(cv, language)
+        if "error" in translated_data:
+            return language, None, None, translated_data["error"]
+        pdf_content = generate_translated_cv_pdf_content(
+            translated_data, backend=backend
+        )
+        if not pdf_content:
+            return language, None, None, "Failed to generate PDF."
+        filename = translated_cv_pdf_filename(translated_data, language)
+        return language, filename, pdf_content, None
+    except Exception as e:
+        print(f"Error translating CV ID {cv.pk} into {language}: {e}")
+        return language, None, None, str(e)
+    finally:
+        connections.close_all()
+
+
+def translate_cv_pdfs(cv, languages, backend=None, workers=4):
+    """Translates a CV into several languages at once.
+
+    Each language is translated and rendered on a bounded thread pool.
+    Model calls wait on the network and renders on the PDF worker
+    processes, so the wall-clock time is close to the slowest language
+    rather than the sum.
+
+    Yields:
+        tuple: `(language, filename, pdf_content, error)` for each
+            language, as soon as it is done.
+    """
+    with ThreadPoolExecutor(
+        max_workers=max(min(workers, len(languages)), 1),
+        thread_name_prefix='cv-translate',
+    ) as executor:
+        futures = [
+            executor.submit(_translate_pdf, cv, language, backend)
+            for language in languages
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def translated_zip_files(results):
+    """Yields the ZIP entries for `translate_cv_pdfs` results.
+
+    Each translated PDF is one entry. Failed languages are listed last in
+    `ERRORS_FILENAME`; so are languages whose file name, once made safe,
+    clashes with an earlier one (e.g. `pt/BR` and `ptBR`).
+    """
+    seen = set()
+    errors = []
+    for language, filename, pdf_content, error in results:
+        if error is None and filename in seen:
+            error = f"Same file name as another language: {filename}."
+        if error is not None:
+            errors.append(f"{language}: {error}")
+            continue
+        seen.add(filename)
+        yield filename, pdf_content
+    if errors:
+        yield ERRORS_FILENAME, "\n".join(errors) + "\n"
+
+
+class _ChunkWriter:
+    """Write-only file object collecting what `zipfile` writes."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(files):
+    """Yields a ZIP archive of `(filename, content)` pairs chunk by chunk.
+
+    Each file is yielded as soon as it is compressed, so with a lazy
+    `files` iterable only one file at a time is held in memory.
+    """
+    writer = _ChunkWriter()
+    with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for filename, content in files:
+            archive.writestr(filename, content)
+            yield writer.drain()
+    yield writer.drain()
@@ -0,0 +1,171 @@
+from main.services.translation_backends import (
+    get_translation_backend,
+    translate_segments,
+)
+from main.services.gemini_translate import (
+    PROMPT_VERSION,
+    segment_prompt_tokens,
+    whole_cv_prompt_tokens,
+)
+from main.models import TranslationSegment
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Splits after sentence punctuation and at line breaks, keeping the
+# separators so translated text can be put back together.
+SENTENCE_SPLIT = re.compile(r'((?<=[.!?])\s+|\s*\n\s*)')
+
+
+def segment_hash(text):
+    """Returns the SHA-256 of a segment's source text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _map_sentences(text, translate):
+    parts = SENTENCE_SPLIT.split(text or '')
+    for index in range(0, len(parts), 2):
+        sentence = parts[index].strip()
+        if sentence:
+            parts[index] = parts[index].replace(
+                sentence, translate(sentence), 1
+            )
+    return ''.join(parts)
+
+
+def _map_name(name, translate):
+    stripped = (name or '').strip()
+    if not stripped:
+        return name
+    return name.replace(stripped, translate(stripped), 1)
+
+
+def _map_segments(cv_data, translate):
+    """Returns a copy of CV data with `translate` applied to each segment.
+
+    Skills and project names are one segment each; bios and project
+    descriptions are split into sentences. Names, contacts and links are
+    left as they are.
+    """
+    return {
+        **cv_data,
+        'bio': _map_sentences(cv_data.get('bio'), translate),
+        'skills': [
+            translate(skill) if skill.strip() else skill
+            for skill in cv_data.get('skills', [])
+        ],
+        'projects': [
+            {
+                **project,
+                'name': _map_name(project.get('name'), translate),
+                'description': _map_sentences(
+                    project.get('description'), translate
+                ),
+            }
+            for project in cv_data.get('projects', [])
+        ],
+    }
+
+
+def extract_segments(cv_data):
+    """Returns the distinct translatable segments of CV data, in order."""
+    segments = {}
+    _map_segments(
+        cv_data, lambda segment: segments.setdefault(segment, segment)
+    )
+    return list(segments)
+
+
+def apply_segments(cv_data, translations):
+    """Returns CV data with every segment replaced by its translation."""
+    return _map_segments(cv_data, translations.__getitem__)
+
+
+def _memory_key(target_language):
+    return {
+        'language': target_language,
+        'model_name': get_translation_backend().model_name,
+        'prompt_version': PROMPT_VERSION,
+    }
+
+
+def lookup_segments(segments, target_language):
+    """Returns the known translations of `segments`, read in one query.
+
+    Returns:
+        dict: Translation of each segment found in memory.
+    """
+    if not segments:
+        return {}
+    by_hash = {segment_hash(segment): segment for segment in segments}
+    return {
+        by_hash[source_hash]: translation
+        for source_hash, translation in TranslationSegment.objects.filter(
+            source_hash__in=by_hash, **_memory_key(target_language)
+        ).values_list('source_hash', 'translation')
+    }
+
+
+def store_segments(translations, target_language):
+    """Adds translated segments to memory, keeping existing entries."""
+    key = _memory_key(target_language)
+    TranslationSegment.objects.bulk_create(
+        [
+            TranslationSegment(
+                source_hash=segment_hash(source), source=source,
+                translation=translation, **key
+            )
+            for source, translation in translations.items()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def report_prompt_savings(whole_cv_tokens, prompt_tokens, label):
+    """Logs the estimated prompt tokens of a translation.
+
+    They are compared with the whole-CV prompt the same CVs would have
+    needed before segment prompts. Both figures are estimates.
+    """
+    if not prompt_tokens:
+        logger.info(
+            "%s: served from translation memory, no model call.", label
+        )
+        return
+    logger.info(
+        "%s: an estimated ~%d prompt tokens, against ~%d for the previous "
+        "whole-CV prompt (~%d fewer).",
+        label, prompt_tokens, whole_cv_tokens,
+        whole_cv_tokens - prompt_tokens,
+    )
+
+
+def translate_cv_data(cv_data, target_language):
+    """Translates CV data, sending only unseen segments to the model.
+
+    Segments already translated for this language, in any CV, come from
+    memory; a CV made only of known text needs no model call at all. The
+    estimated prompt tokens of the call are logged.
+
+    Returns:
+        dict: The translated data, or a dict with an `error` key if the
+            model failed.
+    """
+    segments = extract_segments(cv_data)
+    translations = lookup_segments(segments, target_language)
+    missing = [segment for segment in segments if segment not in translations]
+    report_prompt_savings(
+        whole_cv_prompt_tokens(cv_data, target_language) if missing else 0,
+        segment_prompt_tokens(missing, target_language),
+        f"CV translation into {target_language}",
+    )
+    if missing:
+        translated = translate_segments(missing, target_language)
+        if isinstance(translated, dict):
+            return translated
+        new = dict(zip(missing, translated))
+        store_segments(new, target_language)
+        translations.update(new)
+    return apply_segments(cv_data, translations)
@@ -0,0 +1,127 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from main.services.search import update_search_vectors, update_skill_ids
+from main.services.translation_cache import invalidate_cv_translations
+from main.services.cv_document import update_cv_documents
+from main.services.skill_match import skill_match_index
+from main.services.pdf_cache import invalidate_cv_pdf
+from main.models import CV, Skill, Project
+from django.dispatch import receiver
+from django.utils import timezone
+from django.db.models import F
+
+
+def invalidate_cv_caches(cv_ids):
+    """Drops cached PDFs and translations of the given CVs."""
+    for cv_id in cv_ids:
+        invalidate_cv_pdf(cv_id)
+        invalidate_cv_translations(cv_id)
+
+
+def touch_cvs(cv_ids):
+    """Bumps the version of CVs whose projects or skills changed.
+
+    `CV.save` bumps the version itself; this covers changes made through
+    related rows, in a single UPDATE.
+    """
+    if cv_ids:
+        CV.objects.filter(pk__in=cv_ids).update(
+            version=F('version') + 1, updated_at=timezone.now()
+        )
+
+
+def reload_document(cv):
+    """Refreshes the `document` of an in-memory CV after it was rebuilt.
+
+    Documents are rebuilt with a queryset update, which leaves loaded
+    instances untouched; this keeps the instance that triggered the change
+    consistent with the database.
+    """
+    if 'document' in cv.get_deferred_fields():
+        return
+    document = CV.objects.filter(pk=cv.pk).values_list(
+        'document', flat=True
+    ).first()
+    if document is not None:
+        cv.document = document
+
+
+@receiver(post_save, sender=CV)
+@receiver(post_delete, sender=CV)
+def cv_saved_or_deleted(sender, instance, **kwargs):
+    if kwargs['signal'] is post_save:
+        if kwargs['created']:
+            # The document holds only skills and projects, which a new CV
+            # gets afterwards; build it so it is never left empty.
+            update_cv_documents([instance.pk])
+            reload_document(instance)
+        update_search_vectors([instance.pk])
+    invalidate_cv_caches([instance.pk])
+    skill_match_index.mark_stale([instance.pk])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_saved_or_deleted(sender, instance, **kwargs):
+    touch_cvs([instance.cv_id])
+    update_cv_documents([instance.cv_id])
+    update_search_vectors([instance.cv_id])
+    invalidate_cv_caches([instance.cv_id])
+    if Project.cv.is_cached(instance):
+        reload_document(instance.cv)
+
+
+def cv_skills_updated(cv_ids):
+    """Brings CVs up to date after their skills changed."""
+    touch_cvs(cv_ids)
+    update_skill_ids(cv_ids)
+    update_cv_documents(cv_ids)
+    update_search_vectors(cv_ids)
+    invalidate_cv_caches(cv_ids)
+    skill_match_index.mark_stale(cv_ids)
+
+
+@receiver(m2m_changed, sender=CV.skills.through)
+def cv_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Updates CVs whose skill set changed from either side."""
+    if reverse and action == 'pre_clear':
+        # pk_set is not provided on clear, so collect CVs before removal.
+        instance._cleared_cv_ids = list(
+            instance.cv_set.values_list('pk', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        cv_skills_updated([instance.pk])
+        reload_document(instance)
+        return
+    if action == 'post_clear':
+        cv_ids = instance.__dict__.pop('_cleared_cv_ids', [])
+    else:
+        cv_ids = list(pk_set or [])
+    cv_skills_updated(cv_ids)
+
+
+@receiver(pre_delete, sender=Skill)
+def skill_deleting(sender, instance, **kwargs):
+    # The cascade removes through rows without sending m2m_changed.
+    instance._deleted_cv_ids = list(
+        instance.cv_set.values_list('pk', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Skill)
+def skill_deleted(sender, instance, **kwargs):
+    cv_skills_updated(instance.__dict__.pop('_deleted_cv_ids', []))
+
+
+@receiver(post_save, sender=Skill)
+def skill_saved(sender, instance, created, **kwargs):
+    if not created:
+        cv_skills_updated(list(instance.cv_set.values_list('pk', flat=True)))
@@ -1,33 +1,47 @@
-from django.shortcuts import get_object_or_404
+from main.services.cv_utils import (
+    generate_cv_pdf_content,
+    generate_translated_cv_pdf_content,
+    translated_cv_pdf_filename,
+)
+from main.services.translation_cache import translate_cv
+from main.services.cv_document import cv_documents
+from main.models import CV, TranslationJob
 from django.core.mail import EmailMessage
+from django.utils import timezone
 from django.conf import settings
 from celery import shared_task
-from main.models import CV
+import datetime
 
 
 @shared_task(bind=True)
-def send_cv_pdf_email_task(self, cv_id, recipient_email, pdf_content):
+def send_cv_pdf_email_task(self, cv_id, recipient_emails):
     """
-    Emails a pre-generated PDF for a CV.
+    Renders (or fetches from cache) the PDF for a CV and emails it.
+
+    Only the CV id and recipient address(es) travel through the broker; the
+    PDF itself is produced here, in the worker.
     """
+    if isinstance(recipient_emails, str):
+        recipient_emails = [recipient_emails]
+    recipients = ", ".join(recipient_emails)
+
     try:
-        cv_instance = get_object_or_404(CV, pk=cv_id)
+        cv_instance = cv_documents().get(pk=cv_id)
 
         cv_name = f"{cv_instance.firstname} {cv_instance.lastname}"
         print(
             f"Preparing to email PDF for CV: {cv_name} (ID: {cv_id}) to "
-            f"{recipient_email}"
+            f"{recipients}"
         )
 
+        pdf_content = generate_cv_pdf_content(cv_instance)
         if not pdf_content:
             error_message = (
-                f"No PDF content provided for CV ID {cv_id}. Email not sent."
+                f"Failed to generate PDF for CV ID {cv_id}. Email not sent."
             )
             print(error_message)
             return f"Failed to send email: {error_message}"
 
-        print(f"Using pre-generated PDF for CV: {cv_name}")
-
         subject = f"CV: {cv_name}"
         body = (
             f"Dear user,\n\nHere's requested CV ({cv_name}) in PDF.\n\nBest"
@@ -39,7 +53,7 @@ def send_cv_pdf_email_task(self, cv_id, recipient_email, pdf_content):
             subject,
             body,
             from_email,
-            [recipient_email]
+            recipient_emails
         )
         filename = (
             f"{cv_instance.firstname}_{cv_instance.lastname}_CV.pdf".replace(
@@ -50,10 +64,10 @@ def send_cv_pdf_email_task(self, cv_id, recipient_email, pdf_content):
         email.send()
 
         print(
-            f"Email sent successfully to {recipient_email} for CV: {cv_name}"
+            f"Email sent successfully to {recipients} for CV: {cv_name}"
         )
         return (
-            f"Email for CV '{cv_name}' (ID: {cv_id}) sent to {recipient_email}"
+            f"Email for CV '{cv_name}' (ID: {cv_id}) sent to {recipients}"
         )
 
     except CV.DoesNotExist:
@@ -62,6 +76,70 @@ def send_cv_pdf_email_task(self, cv_id, recipient_email, pdf_content):
     except Exception as e:
         print(
             f"Error in send_cv_pdf_email_task for CV ID {cv_id} to "
-            f"{recipient_email}: {e}"
+            f"{recipients}: {e}"
         )
         return f"Failed to send email for CV ID {cv_id}: {e}"
+
+
+@shared_task(bind=True)
+def translate_cv_pdf_task(self, job_id):
+    """
+    Translates a CV and renders the translated PDF for a TranslationJob.
+
+    The result (or the error) is stored on the job, where the status and
+    download views pick it up.
+    """
+    try:
+        job = TranslationJob.objects.defer('pdf').get(pk=job_id)
+    except TranslationJob.DoesNotExist:
+        print(f"Translation job {job_id} not found.")
+        return f"Translation job {job_id} not found."
+
+    job.status = TranslationJob.Status.RUNNING
+    job.save(update_fields=['status'])
+
+    try:
+        cv_instance = cv_documents().get(pk=job.cv_id)
+        translated_data = translate_cv(cv_instance, job.language)
+        if "error" in translated_data:
+            raise ValueError(translated_data["error"])
+
+        pdf_content = generate_translated_cv_pdf_content(translated_data)
+        if not pdf_content:
+            raise ValueError("Failed to generate PDF.")
+
+        job.pdf = pdf_content
+        job.filename = translated_cv_pdf_filename(
+            translated_data, job.language
+        )
+        job.status = TranslationJob.Status.SUCCEEDED
+    except Exception as e:
+        print(f"Error in translate_cv_pdf_task for job {job_id}: {e}")
+        job.status = TranslationJob.Status.FAILED
+        job.error = str(e)
+        job.pdf = None
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=[
+        'status', 'error', 'pdf', 'filename', 'finished_at'
+    ])
+    return f"Translation job {job_id} {job.status}."
+
+
+@shared_task
+def prune_translation_jobs_task():
+    """
+    Deletes finished translation jobs, and the PDFs stored on them, once
+    they are older than TRANSLATION_JOB_RETENTION_HOURS.
+    """
+    cutoff = timezone.now() - datetime.timedelta(
+        hours=settings.TRANSLATION_JOB_RETENTION_HOURS
+    )
+    deleted, _ = TranslationJob.objects.filter(
+        status__in=[
+            TranslationJob.Status.SUCCEEDED, TranslationJob.Status.FAILED
+        ],
+        finished_at__lt=cutoff,
+    ).delete()
+    print(f"Pruned {deleted} finished translation job(s).")
+    return deleted
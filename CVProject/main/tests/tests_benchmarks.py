@@ -0,0 +1,56 @@
+from main.benchmarks.suite import BENCHMARKS, run_benchmarks
+from main.benchmarks.dataset import seed_dataset
+from django.core.management import call_command
+from main.models import CV, Skill, Project
+from audit.models import RequestLog
+from io import StringIO
+import pytest
+import json
+
+pytestmark = [pytest.mark.django_db, pytest.mark.benchmark]
+
+
+def test_seed_dataset_creates_requested_rows():
+    """Test that the synthetic dataset has the requested shape."""
+    cv_ids = seed_dataset(cvs=4, skills=6, skills_per_cv=3, projects_per_cv=2)
+
+    assert len(cv_ids) == 4
+    assert Skill.objects.count() == 6
+    assert Project.objects.count() == 8
+    assert CV.skills.through.objects.count() == 12
+
+
+def test_run_benchmarks_reports_every_benchmark_and_rolls_back():
+    """Test that a run covers all benchmarks and leaves no rows behind."""
+    logs_before = RequestLog.objects.count()
+
+    report = run_benchmarks(iterations=2, dataset={'cvs': 3})
+
+    assert set(report['results']) == set(BENCHMARKS)
+    for result in report['results'].values():
+        assert result['iterations'] == 2
+        assert result['p50_ms'] <= result['p95_ms'] <= result['max_ms']
+        assert result['queries'] >= 0
+        assert result['peak_memory_kib'] > 0
+    assert report['results']['api_list']['queries'] == 1
+    assert report['results']['serialize_cv_instance']['queries'] == 0
+    assert report['dataset']['cvs'] == 3
+    assert not CV.objects.exists()
+    assert RequestLog.objects.count() == logs_before
+
+
+def test_unknown_benchmark_raises():
+    """Test that unknown benchmark names are rejected."""
+    with pytest.raises(ValueError):
+        run_benchmarks(names=['nope'])
+
+
+def test_run_benchmarks_command_prints_json():
+    """Test that the management command prints a JSON report."""
+    out = StringIO()
+    call_command(
+        'run_benchmarks', '--cvs', '2', '--iterations', '1',
+        '--only', 'serialize_cv_instance', stdout=out
+    )
+    report = json.loads(out.getvalue())
+    assert list(report['results']) == ['serialize_cv_instance']
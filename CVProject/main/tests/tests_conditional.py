@@ -0,0 +1,161 @@
+from main.models import CV, Skill, Project
+from rest_framework.test import APIClient
+from django.core.cache import caches
+from django.urls import reverse
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_pdf_cache():
+    """Fixture to start every test with an empty PDF cache."""
+    caches['pdf'].clear()
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project."
+    )
+    return cv
+
+
+def current_version(cv):
+    return CV.objects.values_list('version', flat=True).get(pk=cv.pk)
+
+
+def test_cv_save_bumps_version(cv):
+    """Test that saving a CV bumps its version and updated_at."""
+    version = current_version(cv)
+    updated_at = CV.objects.get(pk=cv.pk).updated_at
+
+    cv.bio = "Changed."
+    cv.save(update_fields=['bio'])
+
+    assert cv.version == version + 1
+    assert current_version(cv) == version + 1
+    assert CV.objects.get(pk=cv.pk).updated_at > updated_at
+
+
+def test_related_changes_bump_version(cv):
+    """Test that project and skill changes bump the CV's version."""
+    version = current_version(cv)
+
+    project = cv.projects.get()
+    project.name = "Renamed"
+    project.save()
+    assert current_version(cv) == version + 1
+
+    cv.skills.add(Skill.objects.create(name="Django"))
+    assert current_version(cv) == version + 2
+
+    Skill.objects.get(name="Python").cv_set.clear()
+    assert current_version(cv) == version + 3
+
+
+@pytest.mark.parametrize('url_name', ['main:cv_detail', 'main:cv_pdf'])
+def test_html_and_pdf_answer_if_none_match(client, cv, url_name):
+    """Test that unchanged pages and PDFs are answered with a 304."""
+    url = reverse(url_name, kwargs={'cv_id': cv.id})
+    # The detail page sets the CSRF cookie its ETag depends on.
+    client.get(url)
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.has_header('Last-Modified')
+
+    second = client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert second.status_code == 304
+    assert second.content == b''
+
+    Project.objects.create(cv=cv, name="Project Beta", description="New.")
+    third = client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert third.status_code == 200
+    assert third['ETag'] != first['ETag']
+
+
+def test_pdf_not_modified_skips_rendering(client, cv, monkeypatch):
+    """Test that a 304 for the PDF does not generate the PDF."""
+    from main import views
+
+    url = reverse('main:cv_pdf', kwargs={'cv_id': cv.id})
+    etag = client.get(url)['ETag']
+
+    calls = []
+    monkeypatch.setattr(
+        views, 'generate_cv_pdf_content',
+        lambda *args, **kwargs: calls.append(args)
+    )
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert calls == []
+
+
+def test_pdf_etag_depends_on_renderer(client, cv):
+    """Test that each PDF backend has its own ETag."""
+    url = reverse('main:cv_pdf', kwargs={'cv_id': cv.id})
+    pisa = client.get(url, {'renderer': 'pisa'})
+    reportlab = client.get(url, {'renderer': 'reportlab'})
+    assert pisa['ETag'] != reportlab['ETag']
+
+
+def test_detail_with_pending_message_is_not_validated(client, cv):
+    """Test that flash messages are not swallowed by a 304."""
+    url = reverse('main:cv_detail', kwargs={'cv_id': cv.id})
+    client.get(url)
+    etag = client.get(url)['ETag']
+
+    client.post(
+        reverse('main:send_cv_email', kwargs={'cv_id': cv.id}),
+        {'recipient_email': ''}
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert b"Please enter recipient email." in response.content
+
+
+def test_api_retrieve_answers_if_none_match(api_client, cv):
+    """Test that the API detail honours ETags and sparse fieldsets."""
+    url = reverse('main:cv-api-detail', kwargs={'pk': cv.pk})
+    first = api_client.get(url)
+    assert first.status_code == 200
+
+    assert api_client.get(
+        url, HTTP_IF_NONE_MATCH=first['ETag']
+    ).status_code == 304
+    assert api_client.get(
+        url, {'fields': 'id'}, HTTP_IF_NONE_MATCH=first['ETag']
+    ).status_code == 200
+
+    cv.bio = "Changed."
+    cv.save()
+    assert api_client.get(
+        url, HTTP_IF_NONE_MATCH=first['ETag']
+    ).status_code == 200
+
+
+def test_api_list_answers_if_none_match(api_client, cv):
+    """Test that an unchanged list page is answered with a 304."""
+    url = reverse('main:cv-api-list')
+    first = api_client.get(url)
+    assert api_client.get(
+        url, HTTP_IF_NONE_MATCH=first['ETag']
+    ).status_code == 304
+
+    cv.skills.clear()
+    assert api_client.get(
+        url, HTTP_IF_NONE_MATCH=first['ETag']
+    ).status_code == 200
@@ -1,6 +1,8 @@
+from django.test.utils import CaptureQueriesContext
 from main.models import CV, Skill, Project
 from rest_framework.test import APIClient
 from rest_framework import status
+from django.db import connection
 from django.urls import reverse
 import pytest
 
@@ -134,17 +136,50 @@ class TestCVAPI:
         response = api_client.get(url, format='json')
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        results = response.data['results']
+        assert len(results) == 2
         response_cv_firstnames = sorted(
-            [item['firstname'] for item in response.data]
+            [item['firstname'] for item in results]
         )
         expected_firstnames = sorted(
             [cv1_fixture.firstname, cv2_fixture.firstname]
         )
         assert response_cv_firstnames == expected_firstnames
-        if len(response.data) > 0:
-            assert 'projects' in response.data[0]
-            assert 'skills' in response.data[0]
+        if len(results) > 0:
+            assert 'projects' in results[0]
+            assert 'skills' in results[0]
+
+    def test_api_list_cvs_cursor_pagination(
+        self, api_client, cv1_fixture, cv2_fixture
+    ):
+        """Test that the list is paginated by cursor in id order."""
+        url = reverse('main:cv-api-list')
+        response = api_client.get(url, {'page_size': 1}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [cv['id'] for cv in response.data['results']] == [
+            cv1_fixture.pk
+        ]
+        assert response.data['previous'] is None
+
+        response = api_client.get(response.data['next'], format='json')
+        assert [cv['id'] for cv in response.data['results']] == [
+            cv2_fixture.pk
+        ]
+        assert response.data['next'] is None
+
+    def test_api_list_page_size_is_capped(
+        self, api_client, cv1_fixture, cv2_fixture, monkeypatch
+    ):
+        """Test that page_size cannot exceed the configured maximum."""
+        from main.api.pagination import CVCursorPagination
+
+        monkeypatch.setattr(CVCursorPagination, 'max_page_size', 1)
+        url = reverse('main:cv-api-list')
+        response = api_client.get(url, {'page_size': 500}, format='json')
+
+        assert len(response.data['results']) == 1
+        assert response.data['next'] is not None
 
     def test_api_retrieve_cv(
         self, api_client, cv1_fixture, skill_python, skill_django
@@ -206,6 +241,169 @@ class TestCVAPI:
         assert cv1_fixture.skills.count() == 1
         assert cv1_fixture.projects.first().name == "Project Alpha"
 
+    def test_api_update_projects_by_id(self, api_client, cv1_fixture):
+        """Test that projects sent with an id are updated in place."""
+        project = cv1_fixture.projects.get()
+        url = reverse('main:cv-api-detail', kwargs={'pk': cv1_fixture.pk})
+        patch_data = {
+            "projects": [
+                {
+                    "id": project.id,
+                    "name": "Project Alpha v2",
+                    "description": project.description
+                },
+                {"name": "Project Delta", "description": "Added."}
+            ]
+        }
+        response = api_client.patch(url, patch_data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        project.refresh_from_db()
+        assert project.name == "Project Alpha v2"
+        assert sorted(
+            cv1_fixture.projects.values_list('name', flat=True)
+        ) == ["Project Alpha v2", "Project Delta"]
+        assert {p['name'] for p in response.data['projects']} == {
+            "Project Alpha v2", "Project Delta"
+        }
+
+    def test_api_update_unchanged_projects_are_not_written(
+        self, api_client, cv1_fixture
+    ):
+        """Test that resubmitting the same projects writes no project rows."""
+        project = cv1_fixture.projects.get()
+        url = reverse('main:cv-api-detail', kwargs={'pk': cv1_fixture.pk})
+        patch_data = {
+            "projects": [
+                {
+                    "id": project.id,
+                    "name": project.name,
+                    "description": project.description
+                }
+            ]
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.patch(url, patch_data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        project_writes = [
+            q['sql'] for q in queries.captured_queries
+            if q['sql'].startswith((
+                'INSERT INTO "main_project"', 'UPDATE "main_project"',
+                'DELETE FROM "main_project"'
+            ))
+        ]
+        assert project_writes == []
+        assert cv1_fixture.projects.get().id == project.id
+
+    def test_api_update_removes_missing_projects(
+        self, api_client, cv1_fixture
+    ):
+        """Test that projects left out of the update are deleted."""
+        url = reverse('main:cv-api-detail', kwargs={'pk': cv1_fixture.pk})
+        response = api_client.patch(url, {"projects": []}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not cv1_fixture.projects.exists()
+
+    def test_api_update_removal_queries_do_not_grow(
+        self, api_client, cv1_fixture
+    ):
+        """Test that removing projects costs a constant number of queries."""
+        url = reverse('main:cv-api-detail', kwargs={'pk': cv1_fixture.pk})
+
+        def count_queries(size):
+            Project.objects.bulk_create([
+                Project(cv=cv1_fixture, name=f"Project {i}")
+                for i in range(size)
+            ])
+            with CaptureQueriesContext(connection) as queries:
+                response = api_client.patch(
+                    url, {"projects": []}, format='json'
+                )
+            assert response.status_code == status.HTTP_200_OK
+            assert not cv1_fixture.projects.exists()
+            return len(queries)
+
+        assert count_queries(2) == count_queries(20)
+
+    def test_api_update_rejects_foreign_project_id(
+        self, api_client, cv1_fixture, cv2_fixture
+    ):
+        """Test that another CV's project cannot be updated."""
+        foreign = cv2_fixture.projects.get()
+        url = reverse('main:cv-api-detail', kwargs={'pk': cv1_fixture.pk})
+        patch_data = {
+            "bio": "Should not be saved.",
+            "projects": [
+                {"id": foreign.id, "name": "Stolen", "description": "No."}
+            ]
+        }
+        response = api_client.patch(url, patch_data, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'projects' in response.data
+        foreign.refresh_from_db()
+        assert foreign.name != "Stolen"
+        cv1_fixture.refresh_from_db()
+        assert cv1_fixture.bio != "Should not be saved."
+
+    def test_api_create_cv_with_skill_names(
+        self, api_client, skill_python
+    ):
+        """Test that skill names resolve to existing or new skills."""
+        url = reverse('main:cv-api-list')
+        payload = {
+            "firstname": "Ann",
+            "lastname": "Lee",
+            "skills": [skill_python.id, "Python", "Rust", " Go "],
+        }
+        response = api_client.post(url, payload, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        cv = CV.objects.get(pk=response.data['id'])
+        assert set(cv.skills.values_list('name', flat=True)) == {
+            "Python", "Rust", "Go"
+        }
+        assert Skill.objects.filter(name="Python").count() == 1
+
+    def test_api_skill_queries_do_not_grow_with_skills(self, api_client):
+        """Test that skill handling costs a constant number of queries."""
+        url = reverse('main:cv-api-list')
+        skills = Skill.objects.bulk_create(
+            [Skill(name=f"Skill {i}") for i in range(30)]
+        )
+
+        def count_queries(size):
+            payload = {
+                "firstname": "Ann",
+                "lastname": "Lee",
+                "skills": (
+                    [skill.id for skill in skills[:size]]
+                    + [f"New {size}-{i}" for i in range(size)]
+                ),
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = api_client.post(url, payload, format='json')
+            assert response.status_code == status.HTTP_201_CREATED
+            return len(queries)
+
+        assert count_queries(2) == count_queries(30)
+
+    def test_api_create_cv_unknown_skill_id(self, api_client, skill_python):
+        """Test that unknown skill ids are reported without saving."""
+        url = reverse('main:cv-api-list')
+        payload = {
+            "firstname": "Ann",
+            "lastname": "Lee",
+            "skills": [skill_python.id, 9998, 9999],
+        }
+        response = api_client.post(url, payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert len(response.data['skills']) == 2
+        assert not CV.objects.filter(firstname="Ann").exists()
+
     def test_api_delete_cv(self, api_client, cv1_fixture):
         """Test deleting a CV via API."""
         assert CV.objects.filter(pk=cv1_fixture.pk).exists()
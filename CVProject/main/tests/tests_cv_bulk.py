@@ -0,0 +1,179 @@
+from django.test.utils import CaptureQueriesContext
+from main.models import CV, Skill, Project
+from rest_framework.test import APIClient
+from main.services.pdf_cache import (
+    cv_pdf_fingerprint,
+    get_cached_pdf,
+    store_pdf,
+)
+from rest_framework import status
+from django.db import connection
+from django.urls import reverse
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+BULK_URL = 'main:cv-api-bulk'
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def skills():
+    """Fixture to create the Python and Django skills."""
+    return [
+        Skill.objects.create(name="Python"),
+        Skill.objects.create(name="Django"),
+    ]
+
+
+@pytest.fixture
+def existing_cv(skills):
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(firstname="John", lastname="Doe", bio="Old bio.")
+    cv.skills.add(skills[0])
+    Project.objects.create(cv=cv, name="Old Project", description="Old.")
+    return cv
+
+
+def make_item(index, skills, **extra):
+    return {
+        'firstname': f"First{index}",
+        'lastname': f"Last{index}",
+        'bio': f"Bio {index}.",
+        'contacts': {'email': f"user{index}@example.com"},
+        'skills': [skill.id for skill in skills],
+        'projects': [
+            {'name': f"Project {index}-{n}", 'description': "Desc."}
+            for n in range(2)
+        ],
+        **extra,
+    }
+
+
+def test_bulk_create(api_client, skills):
+    """Test that a list of CVs is created with skills and projects."""
+    payload = [make_item(i, skills) for i in range(3)]
+
+    response = api_client.post(reverse(BULK_URL), payload, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['created'] == 3
+    assert [r['status'] for r in response.data['results']] == ['created'] * 3
+    cv = CV.objects.get(pk=response.data['results'][1]['id'])
+    assert cv.firstname == "First1"
+    assert set(cv.skills.values_list('name', flat=True)) == {
+        "Python", "Django"
+    }
+    assert cv.projects.count() == 2
+
+
+def test_bulk_query_count_does_not_grow_with_items(api_client, skills):
+    """Test that the number of queries is bounded, not per item."""
+    def count_queries(size):
+        payload = [make_item(i, skills) for i in range(size)]
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(
+                reverse(BULK_URL), payload, format='json'
+            )
+        assert response.status_code == status.HTTP_200_OK
+        return len(queries)
+
+    assert count_queries(2) == count_queries(40)
+
+
+def test_bulk_update_replaces_skills_and_projects(
+    api_client, skills, existing_cv
+):
+    """Test that an item with an id updates that CV in place."""
+    payload = [
+        make_item(0, skills[1:], id=existing_cv.id),
+        make_item(1, skills),
+    ]
+
+    response = api_client.post(reverse(BULK_URL), payload, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['updated'] == 1
+    assert response.data['created'] == 1
+    existing_cv.refresh_from_db()
+    assert existing_cv.firstname == "First0"
+    assert list(existing_cv.skills.values_list('name', flat=True)) == [
+        "Django"
+    ]
+    assert sorted(existing_cv.projects.values_list('name', flat=True)) == [
+        "Project 0-0", "Project 0-1"
+    ]
+
+
+def test_bulk_resolves_skill_names(api_client, skills):
+    """Test that skill names are shared and created once per request."""
+    payload = [
+        {**make_item(i, skills), 'skills': [skills[0].id, "Rust"]}
+        for i in range(3)
+    ]
+
+    response = api_client.post(reverse(BULK_URL), payload, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert Skill.objects.filter(name="Rust").count() == 1
+    for result in response.data['results']:
+        cv = CV.objects.get(pk=result['id'])
+        assert set(cv.skills.values_list('name', flat=True)) == {
+            "Python", "Rust"
+        }
+
+
+def test_bulk_reports_invalid_items(api_client, skills, existing_cv):
+    """Test that invalid items are reported while valid ones are saved."""
+    payload = [
+        make_item(0, skills),
+        {'lastname': "No firstname"},
+        {**make_item(2, skills), 'skills': [9999]},
+        make_item(3, skills, id=existing_cv.id + 1000),
+    ]
+
+    response = api_client.post(reverse(BULK_URL), payload, format='json')
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    results = response.data['results']
+    assert results[0]['status'] == 'created'
+    assert 'firstname' in results[1]['errors']
+    assert 'skills' in results[2]['errors']
+    assert 'id' in results[3]['errors']
+    assert response.data['failed'] == 3
+    assert CV.objects.count() == 2
+
+
+def test_bulk_update_invalidates_cached_pdf(api_client, skills, existing_cv):
+    """Test that updated CVs lose their cached PDF."""
+    fingerprint = cv_pdf_fingerprint(existing_cv)
+    store_pdf(fingerprint, b'%PDF-cached', cv_id=existing_cv.id)
+
+    api_client.post(
+        reverse(BULK_URL),
+        [make_item(0, skills, id=existing_cv.id)],
+        format='json'
+    )
+
+    assert get_cached_pdf(fingerprint) is None
+
+
+def test_bulk_rejects_non_list_and_oversized_payloads(
+    api_client, settings
+):
+    """Test that the payload must be a list within the size limit."""
+    response = api_client.post(
+        reverse(BULK_URL), {'firstname': "John"}, format='json'
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    settings.CV_BULK_MAX_ITEMS = 1
+    response = api_client.post(
+        reverse(BULK_URL), [{}, {}], format='json'
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,220 @@
+from main.services import translation_cache, translation_memory
+from main.services.cv_document import update_cv_documents
+from main.services.cv_utils import serialize_cv_instance
+from django.test.utils import CaptureQueriesContext
+from django.core.management import call_command
+from main.models import CV, Skill, Project
+from rest_framework.test import APIClient
+from django.db import connection
+from django.urls import reverse
+from io import StringIO
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with two skills and two projects."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(
+        Skill.objects.create(name="Python"),
+        Skill.objects.create(name="Django"),
+    )
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project.",
+        link="https://example.com/alpha"
+    )
+    Project.objects.create(
+        cv=cv, name="Project Beta", description="Second test project."
+    )
+    return cv
+
+
+def stored_document(cv):
+    return CV.objects.values_list('document', flat=True).get(pk=cv.pk)
+
+
+def cv_queries(queries):
+    """Returns the captured SQL, leaving out the request log insert."""
+    return [
+        query['sql'] for query in queries.captured_queries
+        if 'audit_requestlog' not in query['sql']
+    ]
+
+
+def test_document_holds_skills_and_projects(cv):
+    """Test the stored snapshot and its consistency with the instance."""
+    document = stored_document(cv)
+    assert document == cv.document
+    assert [skill['name'] for skill in document['skills']] == [
+        "Python", "Django"
+    ]
+    assert document['projects'][0] == {
+        'id': cv.projects.order_by('id').first().id,
+        'name': "Project Alpha",
+        'description': "First test project.",
+        'link': "https://example.com/alpha",
+    }
+    assert document['projects'][1]['link'] is None
+
+
+def test_document_follows_related_changes(cv):
+    """Test that every kind of related change rebuilds the document."""
+    python = Skill.objects.get(name="Python")
+    python.name = "Python 3"
+    python.save()
+    assert stored_document(cv)['skills'][0]['name'] == "Python 3"
+
+    cv.skills.remove(python)
+    Skill.objects.get(name="Django").delete()
+    assert stored_document(cv)['skills'] == []
+
+    project = cv.projects.order_by('id').first()
+    project.description = "Rewritten."
+    project.save()
+    Project.objects.filter(name="Project Beta").get().delete()
+    assert [
+        p['description'] for p in stored_document(cv)['projects']
+    ] == ["Rewritten."]
+
+
+def test_bulk_upsert_builds_documents(api_client, cv):
+    """Test that CVs written in bulk get their document too."""
+    response = api_client.post(
+        reverse('main:cv-api-bulk'),
+        [{
+            'firstname': "Bulk",
+            'lastname': "Created",
+            'skills': ["Python", "Rust"],
+            'projects': [{'name': "Gamma", 'description': "Third."}],
+        }],
+        format='json'
+    )
+    assert response.status_code == 200
+
+    created = CV.objects.get(pk=response.data['results'][0]['id'])
+    assert [s['name'] for s in created.document['skills']] == [
+        "Python", "Rust"
+    ]
+    assert created.document['projects'][0]['name'] == "Gamma"
+
+
+def test_api_create_and_patch_are_read_back(api_client, cv):
+    """Test that projects written through the API show up in reads."""
+    response = api_client.post(
+        reverse('main:cv-api-list'),
+        {
+            'firstname': "Api",
+            'lastname': "Created",
+            'projects': [{'name': "Gamma", 'description': "Third."}],
+        },
+        format='json'
+    )
+    assert response.status_code == 201
+    url = reverse('main:cv-api-detail', kwargs={'pk': response.data['id']})
+    assert [p['name'] for p in api_client.get(url).data['projects']] == [
+        "Gamma"
+    ]
+
+    alpha, beta = cv.projects.order_by('id')
+    url = reverse('main:cv-api-detail', kwargs={'pk': cv.pk})
+    etag = api_client.get(url)['ETag']
+    response = api_client.patch(
+        url,
+        {'projects': [
+            {'id': alpha.pk, 'name': "Project Alpha v2"},
+            {'name': "Project Delta"},
+        ]},
+        format='json'
+    )
+    assert response.status_code == 200
+
+    response = api_client.get(url)
+    assert response['ETag'] != etag
+    assert [p['name'] for p in response.data['projects']] == [
+        "Project Alpha v2", "Project Delta"
+    ]
+    assert stored_document(cv)['projects'][0]['name'] == "Project Alpha v2"
+
+
+def test_update_cv_documents_repairs_stale_rows(cv):
+    """Test that documents can be rebuilt from the related tables."""
+    expected = stored_document(cv)
+    CV.objects.update(document={})
+    assert update_cv_documents() == 1
+    assert stored_document(cv) == expected
+    assert update_cv_documents([]) == 0
+
+
+def test_rebuild_command_covers_loaded_fixtures(cv):
+    """Test the command run after `loaddata`, which skips m2m signals."""
+    CV.objects.update(document={}, skill_ids=[])
+    out = StringIO()
+    call_command('rebuild_cv_documents', '--batch-size', '1', stdout=out)
+
+    rebuilt = CV.objects.get(pk=cv.pk)
+    assert [s['name'] for s in rebuilt.document['skills']] == [
+        "Python", "Django"
+    ]
+    assert len(rebuilt.skill_ids) == 2
+    assert "1 CV(s)" in out.getvalue()
+
+
+def test_serialize_cv_instance_runs_no_query(cv):
+    """Test that PDF and translation data come from the loaded row."""
+    loaded = CV.objects.get(pk=cv.pk)
+    with CaptureQueriesContext(connection) as queries:
+        data = serialize_cv_instance(loaded)
+
+    assert len(queries) == 0
+    assert data['skills'] == ["Python", "Django"]
+    assert data['projects'][1] == {
+        'name': "Project Beta",
+        'description': "Second test project.",
+        'link': None,
+    }
+
+
+def test_translation_reads_document(cv, monkeypatch):
+    """Test that translation is fed from the document snapshot."""
+    seen = []
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments',
+        lambda segments, language: seen.extend(segments) or segments
+    )
+    translation_cache.translate_cv(CV.objects.get(pk=cv.pk), 'Breton')
+    assert seen == [
+        "Developer from Testland.", "Python", "Django", "Project Alpha",
+        "First test project.", "Project Beta", "Second test project.",
+    ]
+
+
+@pytest.mark.parametrize('url_name, kwargs', [
+    ('main:cv_list', {}),
+    ('main:cv_detail', {'cv_id': None}),
+])
+def test_html_views_read_cvs_in_one_query(client, cv, url_name, kwargs):
+    """Test that the pages read CVs, skills and projects in one query."""
+    if 'cv_id' in kwargs:
+        kwargs['cv_id'] = cv.pk
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse(url_name, kwargs=kwargs))
+
+    assert response.status_code == 200
+    assert b"Project Beta" in response.content
+    assert b"Django" in response.content
+    sql = ' '.join(cv_queries(queries))
+    assert 'main_project' not in sql
+    assert 'main_skill' not in sql
@@ -0,0 +1,159 @@
+from main.api.fast_serializers import CV_VALUE_FIELDS, serialize_cv_rows
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from main.api.serializers import CVSerializer
+from rest_framework.request import Request
+from main.models import CV, Skill, Project
+from rest_framework.test import APIClient
+from django.db import connection
+from main.views import CVViewSet
+from django.urls import reverse
+from main.api import renderers
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def cvs():
+    """Fixture to create CVs with unordered skills and tricky text."""
+    skills = [Skill.objects.create(name=name) for name in ("Go", "Python")]
+    first = CV.objects.create(
+        firstname="Ірина",
+        lastname="O'Neil \"Q\"",
+        bio="Line one line two </script> \x1f",
+        contacts={"email": "i@example.com", "rating": 4.5, "tags": [1, None]}
+    )
+    first.skills.add(skills[1], skills[0])
+    Project.objects.create(
+        cv=first, name="B", description="Second.", link="https://b.example"
+    )
+    Project.objects.create(cv=first, name="A", description="First.")
+    second = CV.objects.create(firstname="Bare", lastname="Minimum")
+    return [first, second]
+
+
+def cv_queries(queries):
+    """Returns the captured SQL, leaving out the request log insert."""
+    return [
+        query['sql'] for query in queries.captured_queries
+        if 'audit_requestlog' not in query['sql']
+    ]
+
+
+def render_with_serializer(data):
+    return JSONRenderer().render(data)
+
+
+def test_rows_match_cv_serializer(cvs):
+    """Test that the fast path builds the same dicts as CVSerializer."""
+    rows = CV.objects.order_by('id').values(*CV_VALUE_FIELDS)
+    expected = CVSerializer(CVViewSet.queryset.all(), many=True).data
+    assert serialize_cv_rows(rows) == [dict(item) for item in expected]
+
+
+def test_list_response_is_byte_compatible(api_client, cvs):
+    """Test that the list body equals the CVSerializer rendering."""
+    response = api_client.get(reverse('main:cv-api-list'))
+
+    expected = render_with_serializer({
+        'next': None,
+        'previous': None,
+        'results': CVSerializer(CVViewSet.queryset.all(), many=True).data,
+    })
+    assert response.status_code == 200
+    assert response.content == expected
+
+
+def test_retrieve_response_is_byte_compatible(api_client, cvs):
+    """Test that the detail body equals the CVSerializer rendering."""
+    cv = CVViewSet.queryset.get(pk=cvs[0].pk)
+    response = api_client.get(
+        reverse('main:cv-api-detail', kwargs={'pk': cv.pk})
+    )
+    assert response.status_code == 200
+    assert response.content == render_with_serializer(CVSerializer(cv).data)
+
+
+def test_retrieve_invalid_pk_is_not_found(api_client):
+    """Test that a non-numeric pk gives a 404 rather than an error."""
+    response = api_client.get(
+        reverse('main:cv-api-detail', kwargs={'pk': 'abc'})
+    )
+    assert response.status_code == 404
+
+
+def test_renderer_falls_back_without_orjson(monkeypatch, cvs):
+    """Test that the renderer works when orjson is not installed."""
+    data = CVSerializer(CVViewSet.queryset.all(), many=True).data
+    fast = renderers.FastJSONRenderer().render(data)
+
+    monkeypatch.setattr(renderers, 'orjson', None)
+    assert renderers.FastJSONRenderer().render(data) == fast
+    assert b'\\u2028' in fast
+
+
+def test_fields_parameter_trims_response_and_queries(api_client, cvs):
+    """Test that narrow field sets skip the related queries."""
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            reverse('main:cv-api-list'), {'fields': 'id,firstname'}
+        )
+
+    assert response.status_code == 200
+    assert [list(item) for item in response.data['results']] == [
+        ['id', 'firstname'], ['id', 'firstname']
+    ]
+    assert len(cv_queries(queries)) == 1
+    assert '"bio"' not in cv_queries(queries)[0]
+
+
+def test_exclude_parameter_drops_fields(api_client, cvs):
+    """Test that excluded fields are left out of a one-query response."""
+    url = reverse('main:cv-api-detail', kwargs={'pk': cvs[0].pk})
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url, {'exclude': 'projects,bio'})
+
+    assert response.status_code == 200
+    assert list(response.data) == [
+        'id', 'firstname', 'lastname', 'skills', 'contacts'
+    ]
+    assert len(cv_queries(queries)) == 1
+
+
+def test_fields_and_exclude_combine(api_client, cvs):
+    """Test that exclude is applied after fields."""
+    response = api_client.get(
+        reverse('main:cv-api-list'),
+        {'fields': 'id,lastname,skills', 'exclude': 'id'}
+    )
+    assert list(response.data['results'][0]) == ['lastname', 'skills']
+
+
+def test_unknown_field_is_rejected(api_client, cvs):
+    """Test that unknown field names are a client error."""
+    response = api_client.get(
+        reverse('main:cv-api-list'), {'fields': 'id,salary'}
+    )
+    assert response.status_code == 400
+    assert 'fields' in response.data
+
+
+def test_narrow_queryset_uses_only_and_skips_prefetch(rf):
+    """Test that the planned queryset matches the requested fields."""
+    view = CVViewSet()
+    view.action = 'list'
+    view.request = Request(rf.get('/', {'fields': 'firstname,skills'}))
+    queryset = view.get_queryset()
+
+    deferred, _ = queryset.query.deferred_loading
+    assert set(deferred) == {
+        'id', 'firstname', 'document', 'version', 'updated_at'
+    }
+    assert queryset._prefetch_related_lookups == ()
@@ -0,0 +1,138 @@
+from main.services.search import update_search_vectors
+from django.core.management import call_command
+from main.models import CV, Skill, Project
+from rest_framework.test import APIClient
+from django.urls import reverse
+from io import StringIO
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+SEARCH_URL = 'main:cv-api-search'
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def cvs():
+    """Fixture to create three CVs with different strengths."""
+    python = Skill.objects.create(name="Python")
+    django_skill = Skill.objects.create(name="Django")
+
+    pythonista = CV.objects.create(
+        firstname="Paula", lastname="Python",
+        bio="Writes Python every day."
+    )
+    pythonista.skills.add(python)
+
+    backend = CV.objects.create(
+        firstname="Bob", lastname="Backend", bio="Builds web services."
+    )
+    backend.skills.add(django_skill)
+    Project.objects.create(
+        cv=backend, name="Billing", description="Payments written in Python."
+    )
+
+    designer = CV.objects.create(
+        firstname="Dana", lastname="Design", bio="Figma and typography."
+    )
+    return {'pythonista': pythonista, 'backend': backend, 'designer': designer}
+
+
+def search(api_client, **params):
+    return api_client.get(reverse(SEARCH_URL), params)
+
+
+def test_search_ranks_best_matches_first(api_client, cvs):
+    """Test that name and skill matches outrank description matches."""
+    response = search(api_client, q='python')
+
+    assert response.status_code == 200
+    ids = [item['id'] for item in response.data['results']]
+    assert ids == [cvs['pythonista'].id, cvs['backend'].id]
+    ranks = [item['rank'] for item in response.data['results']]
+    assert ranks == sorted(ranks, reverse=True)
+    assert response.data['count'] == 2
+
+
+def test_search_sees_related_changes(api_client, cvs):
+    """Test that the index follows skill and project changes."""
+    designer = cvs['designer']
+    designer.skills.add(Skill.objects.create(name="Kubernetes"))
+    assert [
+        item['id'] for item in search(api_client, q='kubernetes').data[
+            'results'
+        ]
+    ] == [designer.id]
+
+    Project.objects.create(
+        cv=designer, name="Observatory", description="Telescope control."
+    )
+    assert search(api_client, q='telescope').data['count'] == 1
+
+    Skill.objects.get(name="Kubernetes").cv_set.clear()
+    assert search(api_client, q='kubernetes').data['count'] == 0
+
+
+def test_search_web_syntax_and_fields(api_client, cvs):
+    """Test exclusion syntax and sparse fieldsets on search results."""
+    response = search(api_client, q='python -billing', fields='id')
+    assert response.data['results'] == [
+        {'id': cvs['pythonista'].id, 'rank': response.data['results'][0][
+            'rank'
+        ]}
+    ]
+
+
+def test_search_requires_query(api_client, cvs):
+    """Test that the search action needs a non-blank `q`."""
+    assert search(api_client).status_code == 400
+    assert search(api_client, q='  ').status_code == 400
+
+
+def test_search_sees_api_project_writes(api_client, cvs):
+    """Test that projects created or renamed through the API are found."""
+    response = api_client.post(
+        reverse('main:cv-api-list'),
+        {
+            'firstname': "Api", 'lastname': "Created",
+            'projects': [{'name': "Lighthouse", 'description': "Beacons."}],
+        },
+        format='json'
+    )
+    assert response.status_code == 201
+    assert search(api_client, q='lighthouse').data['count'] == 1
+
+    project = cvs['backend'].projects.get()
+    response = api_client.patch(
+        reverse('main:cv-api-detail', kwargs={'pk': cvs['backend'].pk}),
+        {'projects': [{'id': project.pk, 'name': "Invoicing"}]},
+        format='json'
+    )
+    assert response.status_code == 200
+    assert search(api_client, q='invoicing').data['count'] == 1
+    assert search(api_client, q='billing').data['count'] == 0
+
+
+def test_list_filter_backend(api_client, cvs):
+    """Test that `?q=` also filters the regular list in id order."""
+    response = api_client.get(reverse('main:cv-api-list'), {'q': 'python'})
+    assert [item['id'] for item in response.data['results']] == sorted(
+        [cvs['pythonista'].id, cvs['backend'].id]
+    )
+
+
+def test_rebuild_command_restores_vectors(cvs):
+    """Test that the rebuild command reindexes every CV."""
+    CV.objects.update(search_vector=None)
+    call_command('rebuild_cv_search', stdout=StringIO())
+    assert not CV.objects.filter(search_vector=None).exists()
+
+
+def test_update_search_vectors_ignores_empty_ids():
+    """Test that an empty id list issues no update."""
+    assert update_search_vectors([]) == 0
@@ -0,0 +1,114 @@
+from main.services.search import update_skill_ids
+from django.test.utils import CaptureQueriesContext
+from main.models import CV, Skill
+from rest_framework.test import APIClient
+from django.db import connection
+from django.urls import reverse
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def skills():
+    """Fixture to create the Python, Django and Go skills."""
+    return {
+        name: Skill.objects.create(name=name)
+        for name in ("Python", "Django", "Go")
+    }
+
+
+@pytest.fixture
+def cvs(skills):
+    """Fixture to create CVs with overlapping skill sets."""
+    full_stack = CV.objects.create(firstname="Full", lastname="Stack")
+    full_stack.skills.add(skills["Python"], skills["Django"])
+    pythonista = CV.objects.create(firstname="Py", lastname="Only")
+    pythonista.skills.add(skills["Python"])
+    gopher = CV.objects.create(firstname="Go", lastname="Pher")
+    gopher.skills.add(skills["Go"])
+    return {'full_stack': full_stack, 'pythonista': pythonista,
+            'gopher': gopher}
+
+
+def listed_ids(api_client, **params):
+    response = api_client.get(reverse('main:cv-api-list'), params)
+    assert response.status_code == 200
+    return [item['id'] for item in response.data['results']]
+
+
+def test_skill_ids_follow_m2m_changes(cvs, skills):
+    """Test that the denormalized array tracks every kind of change."""
+    cv = cvs['full_stack']
+    assert CV.objects.get(pk=cv.pk).skill_ids == sorted(
+        [skills["Python"].id, skills["Django"].id]
+    )
+
+    cv.skills.remove(skills["Django"])
+    assert CV.objects.get(pk=cv.pk).skill_ids == [skills["Python"].id]
+
+    skills["Python"].cv_set.clear()
+    assert CV.objects.get(pk=cv.pk).skill_ids == []
+
+    cvs['gopher'].skills.set([skills["Django"], skills["Go"]])
+    skills["Go"].delete()
+    assert CV.objects.get(pk=cvs['gopher'].pk).skill_ids == [
+        skills["Django"].id
+    ]
+
+
+def test_skills_all_requires_every_skill(api_client, cvs, skills):
+    """Test the all-of filter with ids and names."""
+    ids = listed_ids(
+        api_client, skills_all=f"{skills['Python'].id},Django"
+    )
+    assert ids == [cvs['full_stack'].id]
+    assert listed_ids(api_client, skills_all="Python,Rust") == []
+
+
+def test_skills_any_matches_one_skill(api_client, cvs, skills):
+    """Test the any-of filter, ignoring unknown names."""
+    ids = listed_ids(api_client, skills_any="Django,Go,Rust")
+    assert ids == [cvs['full_stack'].id, cvs['gopher'].id]
+
+
+@pytest.mark.parametrize('params', [
+    {'skills_any': '\u00b2'},
+    {'skills_all': '99999999999'},
+])
+def test_invalid_skill_ids_are_rejected(api_client, cvs, params):
+    """Test that ids that are not int4 numbers give a 400."""
+    response = api_client.get(reverse('main:cv-api-list'), params)
+    assert response.status_code == 400
+    assert set(response.data) == set(params)
+
+
+def test_filters_combine(api_client, cvs):
+    """Test that all-of and any-of filters can be combined."""
+    ids = listed_ids(api_client, skills_all="Python", skills_any="Django,Go")
+    assert ids == [cvs['full_stack'].id]
+
+
+def test_skill_filter_uses_array_not_join(api_client, cvs, skills):
+    """Test that filtering queries the array instead of the m2m table."""
+    with CaptureQueriesContext(connection) as queries:
+        listed_ids(
+            api_client, skills_all=f"{skills['Python'].id}", fields='id'
+        )
+    cv_query = next(
+        q['sql'] for q in queries.captured_queries
+        if q['sql'].startswith('SELECT') and 'FROM "main_cv"' in q['sql']
+    )
+    assert '@>' in cv_query
+    assert 'main_cv_skills' not in cv_query
+
+
+def test_update_skill_ids_ignores_empty_ids():
+    """Test that an empty id list issues no update."""
+    assert update_skill_ids([]) == 0
@@ -82,6 +82,28 @@ def test_cv_list_view_displays_cvs(client, cv1, cv2, skill_python):
     assert "Project Alpha" in content
 
 
+def test_cv_list_view_is_paginated(client, cv1, cv2):
+    """Test that the CV list view pages through CVs by id."""
+    response = client.get(reverse('main:cv_list'), {'page_size': 1})
+    assert list(response.context['cvs']) == [cv1]
+    assert response.context['previous_url'] is None
+    assert response.context['next_url'] == f"?page_size=1&after={cv1.pk}"
+
+    response = client.get(
+        reverse('main:cv_list') + response.context['next_url']
+    )
+    assert list(response.context['cvs']) == [cv2]
+    assert response.context['next_url'] is None
+    assert response.context['previous_url'] == (
+        f"?page_size=1&before={cv2.pk}"
+    )
+
+    response = client.get(
+        reverse('main:cv_list') + response.context['previous_url']
+    )
+    assert list(response.context['cvs']) == [cv1]
+
+
 def test_cv_list_view_empty_state(client):
     """Test that the CV list view shows 'No CVs found' when no CVs exist."""
     CV.objects.all().delete()
@@ -0,0 +1,93 @@
+from main.services.cv_utils import generate_cv_pdf_content
+from main.services.pdf_cache import pdf_cache_stats
+from main.models import CV, Skill, Project
+from django.core.cache import caches
+from django.urls import reverse
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_pdf_cache():
+    """Fixture to start every test with an empty PDF cache."""
+    caches['pdf'].clear()
+
+
+@pytest.fixture
+def render_counter(monkeypatch):
+    """Fixture counting how many times pisa is actually invoked."""
+    from main.services import cv_utils
+
+    calls = []
+    original = cv_utils._render_pdf
+
+    def counting_render(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cv_utils, '_render_pdf', counting_render)
+    return calls
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project."
+    )
+    return cv
+
+
+def test_repeated_render_is_served_from_cache(cv, render_counter):
+    """Test that an unchanged CV is rendered by pisa only once."""
+    before = pdf_cache_stats()
+
+    first = generate_cv_pdf_content(cv)
+    second = generate_cv_pdf_content(cv)
+
+    after = pdf_cache_stats()
+    assert first and first == second
+    assert len(render_counter) == 1
+    assert after['hits'] - before['hits'] == 1
+    assert after['misses'] - before['misses'] == 1
+
+
+def test_cv_save_invalidates_cache(cv, render_counter):
+    """Test that saving the CV forces a fresh render."""
+    generate_cv_pdf_content(cv)
+    cv.bio = "Changed bio."
+    cv.save()
+    generate_cv_pdf_content(cv)
+    assert len(render_counter) == 2
+
+
+def test_project_save_invalidates_cache(cv, render_counter):
+    """Test that adding a project forces a fresh render."""
+    generate_cv_pdf_content(cv)
+    Project.objects.create(cv=cv, name="Project Beta", description="New.")
+    generate_cv_pdf_content(CV.objects.get(pk=cv.pk))
+    assert len(render_counter) == 2
+
+
+def test_skills_change_invalidates_cache(cv, render_counter):
+    """Test that changing the skills m2m drops the cached PDF."""
+    generate_cv_pdf_content(cv)
+    cv.skills.add(Skill.objects.create(name="Django"))
+    assert caches['pdf'].get(f'cv:{cv.pk}') is None
+    generate_cv_pdf_content(CV.objects.get(pk=cv.pk))
+    assert len(render_counter) == 2
+
+
+def test_pdf_cache_stats_view(client):
+    """Test that the stats endpoint exposes hit/miss counters."""
+    response = client.get(reverse('main:pdf_cache_stats'))
+    assert response.status_code == 200
+    assert {'hits', 'misses', 'hit_rate'} <= set(response.json())
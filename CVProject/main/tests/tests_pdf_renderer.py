@@ -0,0 +1,84 @@
+from main.services.pdf_renderer import (
+    PDFRenderer,
+    RenderTimeout,
+    RendererBusy,
+    RendererUnavailable,
+    render_html_to_pdf,
+)
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+import time
+import os
+
+HTML = "<html><body><h1>John Doe</h1><p>Developer.</p></body></html>"
+
+
+@pytest.fixture
+def pool_renderer():
+    """Fixture providing a one-worker renderer, shut down afterwards."""
+    renderer = PDFRenderer(workers=1, max_queue=1, timeout=60)
+    yield renderer
+    renderer.shutdown()
+
+
+def test_inline_renderer_produces_pdf():
+    """Test that a renderer without workers renders in-process."""
+    renderer = PDFRenderer(workers=0, max_queue=0, timeout=5)
+    pdf_content, error_code, log_lines = renderer.render(HTML)
+
+    assert renderer.inline
+    assert error_code == 0
+    assert pdf_content.startswith(b'%PDF')
+
+
+def test_pool_renderer_matches_inline_output(pool_renderer):
+    """Test that worker processes render the same document size."""
+    pool_renderer.start()
+    pdf_content, error_code, _ = pool_renderer.render(HTML)
+
+    assert error_code == 0
+    assert pdf_content.startswith(b'%PDF')
+    assert len(pdf_content) == len(render_html_to_pdf(HTML)[0])
+
+
+def test_full_queue_raises_busy():
+    """Test that callers are turned away once every slot is taken."""
+    renderer = PDFRenderer(workers=1, max_queue=0, timeout=0.01)
+    assert renderer._slots.acquire(blocking=False)
+
+    with pytest.raises(RendererBusy):
+        renderer.render(HTML)
+
+
+def test_dead_worker_is_replaced(pool_renderer):
+    """Test that a pool broken by a dying worker is rebuilt."""
+    with pytest.raises(RendererUnavailable):
+        pool_renderer.run(os._exit, 1)
+    assert pool_renderer.render(HTML)[1] == 0
+
+    # A worker dying between renders surfaces on the next submit.
+    executor = pool_renderer._get_executor()
+    with pytest.raises(BrokenProcessPool):
+        executor.submit(os._exit, 1).result()
+    with pytest.raises(RendererUnavailable):
+        pool_renderer.render(HTML)
+    assert pool_renderer._executor is None
+    assert pool_renderer.render(HTML)[1] == 0
+
+
+def test_hung_render_does_not_keep_its_slot():
+    """Test that a timed out render's worker is killed and its slot freed."""
+    renderer = PDFRenderer(workers=1, max_queue=0, timeout=60)
+    try:
+        renderer.start()
+        renderer.timeout = 0.5
+        with pytest.raises(RenderTimeout):
+            renderer.run(time.sleep, 60)
+
+        # The only slot is free again and a fresh worker takes the render.
+        renderer.timeout = 60
+        started = time.monotonic()
+        assert renderer.render(HTML)[1] == 0
+        assert time.monotonic() - started < 30
+    finally:
+        renderer.shutdown()
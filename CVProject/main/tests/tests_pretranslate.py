@@ -0,0 +1,147 @@
+from main.services.translation_batch import RateLimiter, pack_segments
+from main.services import translation_batch, translation_memory
+from django.core.management import call_command, CommandError
+from main.services.translation_cache import translate_cv
+from main.models import CV, CVTranslation, Skill
+from io import StringIO
+import pytest
+import json
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cvs():
+    """Fixture to create three CVs sharing a skill and a sentence."""
+    python = Skill.objects.create(name="Python")
+    cvs = []
+    for index in range(3):
+        cv = CV.objects.create(
+            firstname=f"Dev{index}",
+            lastname="Doe",
+            bio=f"Team player. Person number {index}.",
+        )
+        cv.skills.add(python)
+        cvs.append(cv)
+    return cvs
+
+
+class ModelCalls(list):
+    def __init__(self):
+        super().__init__()
+        self.failing = set()
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    """Fixture replacing the batched Gemini call with a recorder.
+
+    Batches containing a segment added to `calls.failing` fail.
+    """
+    calls = ModelCalls()
+    failing = calls.failing
+
+    def fake_translate_segments(segments, language):
+        calls.append((language, list(segments)))
+        if failing.intersection(segments):
+            return {"error": "Quota exceeded."}
+        return [f"[{language}] {segment}" for segment in segments]
+
+    monkeypatch.setattr(
+        translation_batch, 'translate_segments', fake_translate_segments
+    )
+    return calls
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    """Fixture providing a checkpoint path in a temporary directory."""
+    return tmp_path / 'checkpoint.json'
+
+
+def pretranslate(checkpoint, *args):
+    out = StringIO()
+    call_command(
+        'pretranslate_cvs', *args, '--checkpoint', str(checkpoint),
+        '--rate-limit', '0', stdout=out
+    )
+    return out.getvalue()
+
+
+def test_pack_segments_respects_token_budget():
+    """Test that batches stay within the estimated token budget."""
+    # "x" * 40 is estimated at 10 + 3 tokens.
+    segments = ["x" * 40] * 5 + ["y" * 400]
+    assert [len(batch) for batch in pack_segments(segments, 40)] == [
+        3, 2, 1
+    ]
+
+
+def test_rate_limiter_spaces_calls():
+    """Test that calls beyond the rate wait for their slot."""
+    now = [100.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(120, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == [0.5, 0.5]
+
+
+def test_command_translates_corpus_for_later_requests(cvs, model_calls,
+                                                      checkpoint,
+                                                      monkeypatch):
+    """Test that shared text is sent once and results are reused."""
+    output = pretranslate(
+        checkpoint, 'Breton', 'Cornish', '--chunk-size', '2'
+    )
+
+    assert "Pre-translated 3 CV(s) into Breton, Cornish" in output
+    assert "fewer than the previous whole-CV prompts" in output
+    assert not checkpoint.exists()
+    breton = [segments for lang, segments in model_calls if lang == 'Breton']
+    assert breton == [
+        ["Team player.", "Person number 0.", "Python", "Person number 1."],
+        ["Person number 2."],
+    ]
+    assert CVTranslation.objects.count() == 6
+
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments',
+        lambda *args: pytest.fail("model called")
+    )
+    assert translate_cv(cvs[2], 'Cornish')['bio'] == (
+        "[Cornish] Team player. [Cornish] Person number 2."
+    )
+
+
+def test_interrupted_run_resumes_from_checkpoint(cvs, model_calls,
+                                                 checkpoint):
+    """Test that a failed chunk is retried by the next run."""
+    model_calls.failing.add("Person number 1.")
+    output = pretranslate(checkpoint, 'Breton', '--chunk-size', '1')
+
+    assert "1 failed" in output
+    assert json.loads(checkpoint.read_text()) == {
+        'languages': ['Breton'], 'after': cvs[0].pk
+    }
+
+    model_calls.failing.clear()
+    model_calls.clear()
+    output = pretranslate(checkpoint, 'Breton', '--chunk-size', '1')
+
+    assert f"Resuming after CV {cvs[0].pk}." in output
+    assert model_calls == [('Breton', ["Person number 1."])]
+    assert CVTranslation.objects.count() == 3
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_for_other_languages_is_refused(cvs, checkpoint):
+    """Test that a checkpoint is only resumed for the same languages."""
+    checkpoint.write_text(json.dumps({'languages': ['Welsh'], 'after': 1}))
+    with pytest.raises(CommandError, match="--restart"):
+        pretranslate(checkpoint, 'Breton')
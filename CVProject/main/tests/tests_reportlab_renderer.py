@@ -0,0 +1,107 @@
+from main.services.reportlab_renderer import render_cv_data_to_pdf
+from main.services.cv_utils import (
+    generate_cv_pdf_content,
+    serialize_cv_instance,
+)
+from django.core.management import call_command
+from main.models import CV, Skill, Project
+from django.core.cache import caches
+from django.urls import reverse
+from io import StringIO
+import pytest
+import json
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_pdf_cache():
+    """Fixture to start every test with an empty PDF cache."""
+    caches['pdf'].clear()
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with markup-like text and a project link."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Loves <b>bold</b> claims & ampersands.\nSecond line.",
+        contacts={
+            "email": "john.doe@example.com",
+            "github": "https://github.com/johndoe",
+        }
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project.",
+        link="https://example.com/alpha"
+    )
+    return cv
+
+
+def test_renders_serialized_cv(cv):
+    """Test that serialized CV data is drawn to a PDF without errors."""
+    pdf_content, error_code, log_lines = render_cv_data_to_pdf(
+        serialize_cv_instance(cv)
+    )
+    assert error_code == 0
+    assert log_lines == []
+    assert pdf_content.startswith(b'%PDF')
+
+
+def test_renders_minimal_data():
+    """Test that missing optional sections do not break the layout."""
+    pdf_content, error_code, _ = render_cv_data_to_pdf(
+        {'firstname': 'Jane', 'lastname': 'Roe'}
+    )
+    assert error_code == 0
+    assert pdf_content.startswith(b'%PDF')
+
+
+def test_backend_is_part_of_cache_key(cv, settings):
+    """Test that each backend caches its own PDF for the same CV."""
+    pisa = generate_cv_pdf_content(cv, backend='pisa')
+    reportlab = generate_cv_pdf_content(cv, backend='reportlab')
+    assert pisa.startswith(b'%PDF') and reportlab.startswith(b'%PDF')
+    assert pisa != reportlab
+
+    settings.CV_PDF_BACKEND = 'reportlab'
+    assert generate_cv_pdf_content(cv) == reportlab
+
+
+def test_unknown_backend_raises(cv):
+    """Test that an unsupported backend name is rejected."""
+    with pytest.raises(ValueError):
+        generate_cv_pdf_content(cv, backend='latex')
+
+
+def test_pdf_view_accepts_renderer_parameter(client, cv):
+    """Test that the PDF view renders with the requested backend."""
+    url = reverse('main:cv_pdf', kwargs={'cv_id': cv.id})
+    response = client.get(url, {'renderer': 'reportlab'})
+    assert response.status_code == 200
+    assert response.content == generate_cv_pdf_content(
+        cv, backend='reportlab'
+    )
+
+
+def test_pdf_view_rejects_unknown_renderer(client, cv):
+    """Test that an unknown renderer is a client error."""
+    url = reverse('main:cv_pdf', kwargs={'cv_id': cv.id})
+    response = client.get(url, {'renderer': 'latex'})
+    assert response.status_code == 400
+
+
+def test_benchmark_command_reports_both_backends(cv):
+    """Test that the benchmark command measures every backend."""
+    out = StringIO()
+    call_command(
+        'benchmark_pdf_renderers', '--iterations', '1', '--json', stdout=out
+    )
+    results = json.loads(out.getvalue())
+    assert set(results) == {'pisa', 'reportlab'}
+    for result in results.values():
+        assert result['renders'] == 1
+        assert result['failures'] == 0
+        assert result['avg_bytes'] > 0
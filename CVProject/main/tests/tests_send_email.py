@@ -0,0 +1,71 @@
+from main.tasks import send_cv_pdf_email_task
+from main.models import CV, Skill, Project
+from django.urls import reverse
+import pytest
+import json
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project."
+    )
+    return cv
+
+
+@pytest.fixture
+def delayed_calls(monkeypatch):
+    """Fixture capturing arguments passed to the task's `delay`."""
+    calls = []
+    monkeypatch.setattr(
+        send_cv_pdf_email_task, 'delay', lambda *args: calls.append(args)
+    )
+    return calls
+
+
+def test_view_enqueues_only_ids(client, cv, delayed_calls, monkeypatch):
+    """Test that the view does not render a PDF and sends JSON-safe args."""
+    from main.services import cv_utils
+
+    monkeypatch.setattr(
+        cv_utils, '_render_pdf',
+        lambda *args: pytest.fail("PDF rendered in the web request")
+    )
+    url = reverse('main:send_cv_email', args=[cv.pk])
+    response = client.post(
+        url, {'recipient_email': 'a@example.com, b@example.com'}
+    )
+
+    assert response.status_code == 302
+    assert delayed_calls == [(cv.pk, ['a@example.com', 'b@example.com'])]
+    json.dumps(delayed_calls[0])
+
+
+def test_view_rejects_invalid_email(client, cv, delayed_calls):
+    """Test that an invalid address is not enqueued."""
+    url = reverse('main:send_cv_email', args=[cv.pk])
+    client.post(url, {'recipient_email': 'not-an-email'})
+    assert delayed_calls == []
+
+
+def test_task_renders_and_sends_pdf(cv, mailoutbox):
+    """Test that the task renders the PDF itself and attaches it."""
+    send_cv_pdf_email_task.apply(args=(cv.pk, 'a@example.com'))
+
+    assert len(mailoutbox) == 1
+    message = mailoutbox[0]
+    assert message.to == ['a@example.com']
+    filename, content, mimetype = message.attachments[0]
+    assert filename == "John_Doe_CV.pdf"
+    assert mimetype == 'application/pdf'
+    assert content.startswith(b'%PDF')
@@ -0,0 +1,207 @@
+from main.services.skill_match import match_cvs, skill_match_index
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from main.models import CV, Skill
+from django.utils import timezone
+from django.db import connection
+from django.urls import reverse
+import datetime
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    """Fixture to start every test from an empty skill match index."""
+    skill_match_index.reset()
+    monkeypatch.setattr(skill_match_index, 'sync_interval', 3600)
+    yield skill_match_index
+    skill_match_index.reset()
+
+
+@pytest.fixture
+def api_client():
+    """Fixture to provide an API client instance."""
+    return APIClient()
+
+
+@pytest.fixture
+def skills():
+    """Fixture to create the Python, Django, Go and SQL skills."""
+    return {
+        name: Skill.objects.create(name=name)
+        for name in ("Python", "Django", "Go", "SQL")
+    }
+
+
+@pytest.fixture
+def cvs(skills):
+    """Fixture to create CVs with overlapping skill sets."""
+    def create(name, *skill_names):
+        cv = CV.objects.create(firstname=name, lastname="Doe")
+        cv.skills.add(*[skills[skill] for skill in skill_names])
+        return cv
+
+    return {
+        'django_dev': create("Dj", "Python", "Django"),
+        'full_stack': create("Full", "Python", "Django", "SQL"),
+        'gopher': create("Go", "Go", "SQL"),
+        'nobody': create("No"),
+    }
+
+
+def ids(skills, *names):
+    return [skills[name].id for name in names]
+
+
+def delete_elsewhere(cv):
+    """Deletes a CV without signals, as another process would."""
+    for queryset in (
+        CV.skills.through.objects.filter(cv_id=cv.pk),
+        CV.objects.filter(pk=cv.pk),
+    ):
+        queryset._raw_delete(queryset.db)
+
+
+def test_match_ranks_by_weighted_overlap(cvs, skills):
+    """Test that required skills outweigh nice-to-have ones."""
+    matches = match_cvs(
+        ids(skills, "Python", "Django"), ids(skills, "SQL"), limit=10
+    )
+    assert [cv_id for cv_id, _, _ in matches] == [
+        cvs['full_stack'].id, cvs['django_dev'].id, cvs['gopher'].id
+    ]
+    assert [score for _, score, _ in matches] == [1.0, 0.8, 0.2]
+    assert matches[2][2] == ids(skills, "SQL")
+
+
+def test_match_limit_keeps_best_and_breaks_ties_by_id(cvs, skills):
+    """Test top-K selection with equal scores."""
+    matches = match_cvs(ids(skills, "Python"), limit=1)
+    assert matches == [(cvs['django_dev'].id, 1.0, ids(skills, "Python"))]
+
+
+def test_index_follows_m2m_changes_incrementally(cvs, skills, monkeypatch):
+    """Test that changed CVs are reloaded without rebuilding the index."""
+    match_cvs(ids(skills, "Go"), limit=10)
+    monkeypatch.setattr(
+        skill_match_index, '_load',
+        lambda: pytest.fail("index was rebuilt")
+    )
+
+    cvs['nobody'].skills.add(skills["Go"])
+    cvs['gopher'].skills.remove(skills["Go"])
+    matches = match_cvs(ids(skills, "Go"), limit=10)
+    assert [cv_id for cv_id, _, _ in matches] == [cvs['nobody'].id]
+
+    cvs['nobody'].delete()
+    assert match_cvs(ids(skills, "Go"), limit=10) == []
+
+
+def test_index_picks_up_changes_made_elsewhere(cvs, skills, monkeypatch):
+    """Test that CVs updated without signals are found by `updated_at`."""
+    match_cvs(ids(skills, "Go"), limit=10)
+    monkeypatch.setattr(skill_match_index, 'sync_interval', 0)
+
+    # A queryset update sends no signals, as in another process.
+    CV.objects.filter(pk=cvs['nobody'].pk).update(
+        skill_ids=ids(skills, "Go"), updated_at=timezone.now()
+    )
+    matches = match_cvs(ids(skills, "Go"), limit=10)
+    assert cvs['nobody'].id in [cv_id for cv_id, _, _ in matches]
+
+
+def test_index_notices_deletes_hidden_by_creates(cvs, skills,
+                                                 monkeypatch):
+    """Test that a delete and a create elsewhere still trigger a reload."""
+    match_cvs(ids(skills, "Go"), limit=10)
+    monkeypatch.setattr(skill_match_index, 'sync_interval', 0)
+
+    # Neither sends signals, and the new CV is too old for the updated_at
+    # check, so the CV counts still agree.
+    delete_elsewhere(cvs['gopher'])
+    new = CV.objects.bulk_create([CV(firstname="New", lastname="Doe")])
+    CV.objects.filter(pk=new[0].pk).update(
+        updated_at=timezone.now() - datetime.timedelta(days=1)
+    )
+
+    assert match_cvs(ids(skills, "Go"), limit=10) == []
+
+
+def test_index_queries_run_outside_the_lock(cvs, skills, monkeypatch):
+    """Test that loading and syncing never query while scoring is locked."""
+    def check_unlocked(execute, sql, params, many, context):
+        assert not skill_match_index._lock.locked()
+        return execute(sql, params, many, context)
+
+    monkeypatch.setattr(skill_match_index, 'sync_interval', 0)
+    with connection.execute_wrapper(check_unlocked):
+        match_cvs(ids(skills, "Go"), limit=10)
+        cvs['nobody'].skills.add(skills["Go"])
+        matches = match_cvs(ids(skills, "Go"), limit=10)
+    assert len(matches) == 2
+
+
+def test_scoring_a_warm_index_runs_no_query(cvs, skills):
+    """Test that matching reads the in-memory index only."""
+    match_cvs(ids(skills, "Python"), limit=10)
+    with CaptureQueriesContext(connection) as queries:
+        match_cvs(ids(skills, "Python", "SQL"), limit=10)
+    assert len(queries) == 0
+
+
+def test_match_endpoint(api_client, cvs, skills):
+    """Test the ranked results, sparse fields and matched skills."""
+    response = api_client.get(reverse('main:cv-api-match'), {
+        'required': 'Python,Django',
+        'nice': f"{skills['SQL'].id}",
+        'limit': 2,
+        'fields': 'id,firstname',
+    })
+
+    assert response.status_code == 200
+    assert response.data['count'] == 2
+    assert response.data['results'] == [
+        {
+            'id': cvs['full_stack'].id,
+            'firstname': "Full",
+            'score': 1.0,
+            'matched_skills': sorted(ids(skills, "Python", "Django", "SQL")),
+        },
+        {
+            'id': cvs['django_dev'].id,
+            'firstname': "Dj",
+            'score': 0.8,
+            'matched_skills': sorted(ids(skills, "Python", "Django")),
+        },
+    ]
+
+
+def test_match_endpoint_refills_deleted_cvs(api_client, cvs, skills):
+    """Test that CVs deleted elsewhere are replaced by the next best."""
+    match_cvs(ids(skills, "Python"), limit=10)
+    delete_elsewhere(cvs['django_dev'])
+
+    response = api_client.get(reverse('main:cv-api-match'), {
+        'required': 'Python', 'limit': 1, 'fields': 'id',
+    })
+    assert [item['id'] for item in response.data['results']] == [
+        cvs['full_stack'].id
+    ]
+
+
+@pytest.mark.parametrize('params, field', [
+    ({}, 'required'),
+    ({'required': 'Python,Cobol'}, 'required'),
+    ({'required': 'Python', 'nice': '\u00b2'}, 'nice'),
+    ({'required': '99999999999'}, 'required'),
+    ({'required': 'Python', 'limit': '0'}, 'limit'),
+    ({'nice': 'Python', 'limit': 'many'}, 'limit'),
+])
+def test_match_endpoint_rejects_bad_params(api_client, skills, params,
+                                           field):
+    """Test the 400 responses of the match endpoint."""
+    response = api_client.get(reverse('main:cv-api-match'), params)
+    assert response.status_code == 400
+    assert field in response.data
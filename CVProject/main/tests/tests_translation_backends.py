@@ -0,0 +1,157 @@
+from main.services.translation_backends import (
+    FakeBackend,
+    build_translation_backend,
+    get_translation_backend,
+    use_translation_backend,
+)
+from main.services.translation_memory import translate_cv_data
+from google.api_core import exceptions as google_exceptions
+from django.core.exceptions import ImproperlyConfigured
+from main.services import gemini_translate
+from main.models import TranslationSegment
+from types import SimpleNamespace
+import threading
+import pytest
+import json
+
+pytestmark = pytest.mark.django_db
+
+
+class FakeModel:
+    """Stands in for `genai.GenerativeModel`, answering from a script.
+
+    Script items are answer strings, or exceptions to raise instead.
+    """
+    created = 0
+
+    def __init__(self, name):
+        FakeModel.created += 1
+        self.script = []
+        self.calls = []
+
+    def generate_content(self, prompt, request_options=None):
+        self.calls.append(request_options)
+        answer = self.script.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return SimpleNamespace(text=answer)
+
+
+@pytest.fixture
+def gemini(monkeypatch):
+    """Fixture to create a Gemini backend that records its sleeps."""
+    monkeypatch.setattr(gemini_translate.genai, 'GenerativeModel', FakeModel)
+    sleeps = []
+    backend = gemini_translate.GeminiBackend(
+        'key', 'gemini-test', timeout=5, max_retries=2, retry_backoff=0.5,
+        sleep=sleeps.append
+    )
+    backend.sleeps = sleeps
+    return backend
+
+
+def test_fake_backend_is_deterministic():
+    """Test the fake backend's answers and simulated latency."""
+    sleeps = []
+    backend = FakeBackend(latency=0.2, sleep=sleeps.append)
+
+    assert backend.translate_segments(["One", "Two"], 'French') == [
+        "[French] One", "[French] Two"
+    ]
+    assert sleeps == [0.2]
+
+
+def test_gemini_backend_reuses_its_model(gemini):
+    """Test that requests share one model and carry the timeout."""
+    created = FakeModel.created
+    gemini._model.script = [json.dumps({"0": "Un"}), json.dumps({"0": "Deux"})]
+
+    assert gemini.translate_segments(["One"], 'French') == ["Un"]
+    assert gemini.translate_segments(["Two"], 'French') == ["Deux"]
+    assert FakeModel.created == created
+    assert gemini._model.calls == [{'timeout': 5}, {'timeout': 5}]
+
+
+def test_gemini_backend_retries_transient_errors(gemini):
+    """Test exponential backoff on transient errors."""
+    gemini._model.script = [
+        google_exceptions.ServiceUnavailable("down"),
+        google_exceptions.ResourceExhausted("quota"),
+        json.dumps({"0": "Un"}),
+    ]
+
+    assert gemini.translate_segments(["One"], 'French') == ["Un"]
+    assert gemini.sleeps == [0.5, 1.0]
+
+
+def test_gemini_backend_gives_up(gemini):
+    """Test that errors are reported once retries run out, and that
+    permanent errors are not retried."""
+    gemini._model.script = [TimeoutError("slow")] * 3
+    assert 'error' in gemini.translate_segments(["One"], 'French')
+    assert gemini.sleeps == [0.5, 1.0]
+
+    gemini._model.script = [google_exceptions.PermissionDenied("bad key")]
+    assert 'error' in gemini.translate_segments(["One"], 'French')
+    assert gemini.sleeps == [0.5, 1.0]
+
+
+def test_gemini_backend_limits_concurrency(monkeypatch):
+    """Test that no more than `max_concurrency` requests run at once."""
+    monkeypatch.setattr(gemini_translate.genai, 'GenerativeModel', FakeModel)
+    backend = gemini_translate.GeminiBackend(
+        'key', 'gemini-test', max_concurrency=2
+    )
+    running = []
+    peak = []
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def generate_content(prompt, request_options=None):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        release.wait(timeout=5)
+        with lock:
+            running.pop()
+        return SimpleNamespace(text=json.dumps({"0": "Un"}))
+
+    backend._model.generate_content = generate_content
+    threads = [
+        threading.Thread(
+            target=backend.translate_segments, args=(["One"], 'French')
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) <= 2
+
+
+def test_backend_selected_by_settings(settings):
+    """Test building backends from TRANSLATION_BACKEND."""
+    settings.TRANSLATION_FAKE_LATENCY = 0.1
+    backend = build_translation_backend('fake')
+    assert isinstance(backend, FakeBackend)
+    assert backend.latency == 0.1
+
+    settings.TRANSLATION_BACKEND = 'babelfish'
+    with pytest.raises(ImproperlyConfigured):
+        build_translation_backend()
+
+
+def test_translation_memory_keyed_by_backend():
+    """Test that translations are stored under the backend's model."""
+    cv_data = {"bio": "Hello there.", "skills": [], "projects": []}
+
+    with use_translation_backend(FakeBackend()) as backend:
+        assert get_translation_backend() is backend
+        translated = translate_cv_data(cv_data, 'French')
+
+    assert translated["bio"] == "[French] Hello there."
+    assert TranslationSegment.objects.get().model_name == 'fake'
+    assert get_translation_backend() is not backend
@@ -0,0 +1,109 @@
+from main.models import (
+    CV,
+    CVTranslation,
+    Project,
+    Skill,
+    TranslationSegment,
+)
+from main.services import translation_cache, translation_memory
+from django.utils import timezone
+from django.urls import reverse
+from datetime import timedelta
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project."
+    )
+    return cv
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    """Fixture replacing the Gemini call with a recording stand-in."""
+    calls = []
+
+    def fake_translate_segments(segments, target_language):
+        calls.append((segments, target_language))
+        return [f"[{target_language}] {segment}" for segment in segments]
+
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments', fake_translate_segments
+    )
+    return calls
+
+
+def test_repeat_translation_is_served_from_cache(cv, model_calls):
+    """Test that the model is called once per CV content and language."""
+    first = translation_cache.translate_cv(cv, 'Breton')
+    second = translation_cache.translate_cv(cv, 'Breton')
+
+    assert first == second
+    assert first['bio'] == "[Breton] Developer from Testland."
+    assert len(model_calls) == 1
+
+    translation_cache.translate_cv(cv, 'Cornish')
+    assert len(model_calls) == 2
+
+
+def test_cv_change_invalidates_translation(cv, model_calls):
+    """Test that editing the CV drops its cached translations."""
+    translation_cache.translate_cv(cv, 'Breton')
+    assert CVTranslation.objects.filter(cv=cv).exists()
+
+    cv.bio = "Changed bio."
+    cv.save()
+
+    assert not CVTranslation.objects.filter(cv=cv).exists()
+    translated = translation_cache.translate_cv(cv, 'Breton')
+    assert translated['bio'] == "[Breton] Changed bio."
+    assert len(model_calls) == 2
+
+
+def test_expired_translation_is_rebuilt(cv, model_calls, settings):
+    """Test that entries older than the TTL are rebuilt from segments."""
+    settings.TRANSLATION_CACHE_TTL = 60
+    translation_cache.translate_cv(cv, 'Breton')
+    CVTranslation.objects.update(
+        updated_at=timezone.now() - timedelta(seconds=120)
+    )
+
+    translated = translation_cache.translate_cv(cv, 'Breton')
+    assert translated['bio'] == "[Breton] Developer from Testland."
+    assert CVTranslation.objects.get().updated_at > (
+        timezone.now() - timedelta(seconds=60)
+    )
+    assert len(model_calls) == 1
+
+
+def test_errors_are_not_cached(cv, monkeypatch):
+    """Test that a failed translation is not stored."""
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments',
+        lambda segments, language: {"error": "invalid JSON"}
+    )
+    assert 'error' in translation_cache.translate_cv(cv, 'Breton')
+    assert not CVTranslation.objects.exists()
+    assert not TranslationSegment.objects.exists()
+
+
+def test_translate_view_uses_cache(client, cv, model_calls):
+    """Test that repeated translate requests reuse the cached result."""
+    url = reverse('main:translate_cv', args=[cv.pk])
+    for _ in range(2):
+        response = client.post(url, {'language': 'Breton'})
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/pdf'
+    assert len(model_calls) == 1
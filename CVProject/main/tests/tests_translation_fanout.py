@@ -0,0 +1,139 @@
+from main.services import translation_memory
+from main.models import CV, Skill, Project
+from django.urls import reverse
+import threading
+import zipfile
+import pytest
+import io
+
+# Pool threads use their own database connections, so the data must be
+# committed for them to see it.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project."
+    )
+    return cv
+
+
+def fake_model(monkeypatch, barrier=None, failing=()):
+    """Replaces the Gemini call; a barrier proves the calls overlap."""
+    def fake_translate_segments(segments, language):
+        if barrier is not None:
+            barrier.wait()
+        if language in failing:
+            return {"error": f"No {language} model."}
+        return [f"[{language}] {segment}" for segment in segments]
+
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments', fake_translate_segments
+    )
+
+
+def post(client, cv, languages, renderer='reportlab'):
+    return client.post(
+        reverse('main:translate_cv_zip', args=[cv.pk])
+        + f'?renderer={renderer}',
+        {'languages': languages}
+    )
+
+
+def read_zip(response):
+    return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+
+def test_languages_are_translated_concurrently(client, cv, monkeypatch):
+    """Test that every language is in flight at the same time."""
+    # Each call waits until all three have started; sequential calls
+    # would break the barrier after its timeout.
+    fake_model(monkeypatch, barrier=threading.Barrier(3, timeout=10))
+    response = post(client, cv, ['Breton', 'Cornish,Welsh', 'Breton'])
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/zip'
+    assert 'John_Doe_translations.zip' in response['Content-Disposition']
+    archive = read_zip(response)
+    # Entries are written in the order the languages finish.
+    assert sorted(archive.namelist()) == [
+        'John_Doe_Breton_CV.pdf',
+        'John_Doe_Cornish_CV.pdf',
+        'John_Doe_Welsh_CV.pdf',
+    ]
+    assert archive.read('John_Doe_Welsh_CV.pdf').startswith(b'%PDF')
+
+
+def test_failed_languages_are_reported_in_archive(client, cv, monkeypatch):
+    """Test that one failing language does not sink the others."""
+    fake_model(monkeypatch, failing={'Klingon'})
+    response = post(client, cv, 'Breton,Klingon')
+
+    assert response.status_code == 200
+    archive = read_zip(response)
+    assert archive.namelist() == ['John_Doe_Breton_CV.pdf', 'errors.txt']
+    assert archive.read('errors.txt') == b"Klingon: No Klingon model.\n"
+
+
+def test_entry_names_cannot_escape_the_archive(client, cv, monkeypatch):
+    """Test that path characters in languages and names are dropped."""
+    fake_model(monkeypatch)
+    cv.firstname = '"John/..'
+    cv.save()
+    response = post(client, cv, 'x/../../evil')
+
+    assert response.status_code == 200
+    assert 'filename="John.._Doe_translations.zip"' in (
+        response['Content-Disposition']
+    )
+    assert read_zip(response).namelist() == [
+        'John.._Doe_x....evil_CV.pdf'
+    ]
+
+
+def test_clashing_file_names_are_reported(client, cv, monkeypatch):
+    """Test that languages sanitized to the same name get one entry."""
+    fake_model(monkeypatch)
+    response = post(client, cv, 'pt/BR,ptBR')
+
+    assert response.status_code == 200
+    archive = read_zip(response)
+    assert archive.namelist() == ['John_Doe_ptBR_CV.pdf', 'errors.txt']
+    assert b"Same file name as another language" in archive.read(
+        'errors.txt'
+    )
+
+
+def test_all_languages_failing_is_an_error(client, cv, monkeypatch):
+    """Test that nothing to archive gives a 500."""
+    fake_model(monkeypatch, failing={'Klingon'})
+    response = post(client, cv, 'Klingon')
+    assert response.status_code == 500
+    assert b"No Klingon model." in response.content
+
+
+@pytest.mark.parametrize('languages, renderer', [
+    ('', 'reportlab'),
+    (','.join(f'Lang{i}' for i in range(11)), 'reportlab'),
+    ('Breton', 'latex'),
+])
+def test_bad_requests_are_rejected(client, cv, monkeypatch, languages,
+                                   renderer):
+    """Test the 400 responses of the ZIP endpoint."""
+    fake_model(monkeypatch)
+    assert post(client, cv, languages, renderer).status_code == 400
+
+
+def test_get_is_not_allowed(client, cv):
+    """Test that only POST is accepted."""
+    response = client.get(reverse('main:translate_cv_zip', args=[cv.pk]))
+    assert response.status_code == 405
@@ -0,0 +1,134 @@
+from main.tasks import prune_translation_jobs_task, translate_cv_pdf_task
+from main.models import CV, Skill, Project, TranslationJob
+from main.services import translation_memory
+from django.utils import timezone
+from django.urls import reverse
+import datetime
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cv():
+    """Fixture to create a CV with one skill and one project."""
+    cv = CV.objects.create(
+        firstname="John",
+        lastname="Doe",
+        bio="Developer from Testland.",
+        contacts={"email": "john.doe@example.com"}
+    )
+    cv.skills.add(Skill.objects.create(name="Python"))
+    Project.objects.create(
+        cv=cv, name="Project Alpha", description="First test project."
+    )
+    return cv
+
+
+@pytest.fixture
+def fake_translation(monkeypatch):
+    """Fixture replacing the Gemini call with a deterministic stand-in."""
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments',
+        lambda segments, language: [f"[{language}]" for _ in segments]
+    )
+
+
+@pytest.fixture
+def delayed_jobs(monkeypatch):
+    """Fixture capturing job ids passed to the task's `delay`."""
+    calls = []
+    monkeypatch.setattr(
+        translate_cv_pdf_task, 'delay', lambda job_id: calls.append(job_id)
+    )
+    return calls
+
+
+def test_post_returns_202_and_enqueues_job(
+    client, cv, delayed_jobs, django_capture_on_commit_callbacks
+):
+    """Test that the POST only creates and enqueues a job."""
+    url = reverse('main:translate_cv_job', args=[cv.pk])
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url, {'language': 'Breton'})
+
+    assert response.status_code == 202
+    data = response.json()
+    job = TranslationJob.objects.get(pk=data['job_id'])
+    assert job.status == TranslationJob.Status.PENDING
+    assert delayed_jobs == [data['job_id']]
+    assert response['Location'] == data['status_url']
+
+
+def test_job_requires_language(client, cv, delayed_jobs):
+    """Test that a job without a language is rejected."""
+    url = reverse('main:translate_cv_job', args=[cv.pk])
+    assert client.post(url).status_code == 400
+    assert client.get(url).status_code == 405
+    assert not TranslationJob.objects.exists()
+
+
+def test_finished_job_can_be_downloaded(client, cv, fake_translation):
+    """Test the status and download endpoints around a completed job."""
+    job = TranslationJob.objects.create(cv=cv, language='Breton')
+    status_url = reverse('main:translation_job_status', args=[job.id])
+    download_url = reverse('main:translation_job_download', args=[job.id])
+
+    assert client.get(status_url).json()['status'] == 'pending'
+    assert client.get(download_url).status_code == 409
+
+    translate_cv_pdf_task.apply(args=(str(job.id),))
+
+    status = client.get(status_url).json()
+    assert status['status'] == 'succeeded'
+    assert status['download_url'] == download_url
+
+    response = client.get(download_url)
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/pdf'
+    assert 'John_Doe_Breton_CV.pdf' in response['Content-Disposition']
+    assert response.content.startswith(b'%PDF')
+
+
+def test_failed_translation_marks_job_failed(client, cv, monkeypatch):
+    """Test that a model error is reported on the job."""
+    monkeypatch.setattr(
+        translation_memory, 'translate_segments',
+        lambda segments, language: {"error": "invalid JSON"}
+    )
+    job = TranslationJob.objects.create(cv=cv, language='Breton')
+    translate_cv_pdf_task.apply(args=(str(job.id),))
+
+    job.refresh_from_db()
+    assert job.status == TranslationJob.Status.FAILED
+    assert job.error == "invalid JSON"
+    assert job.finished_at is not None
+
+
+def test_prune_deletes_only_old_finished_jobs(cv, settings):
+    """Test that stored PDFs are deleted once their job has expired."""
+    settings.TRANSLATION_JOB_RETENTION_HOURS = 24
+    old = timezone.now() - datetime.timedelta(hours=25)
+    recent = timezone.now() - datetime.timedelta(hours=1)
+    Status = TranslationJob.Status
+    expired = [
+        TranslationJob.objects.create(
+            cv=cv, language='Breton', status=status, pdf=b'%PDF',
+            finished_at=old
+        )
+        for status in (Status.SUCCEEDED, Status.FAILED)
+    ]
+    kept = [
+        TranslationJob.objects.create(
+            cv=cv, language='Breton', status=Status.SUCCEEDED, pdf=b'%PDF',
+            finished_at=recent
+        ),
+        TranslationJob.objects.create(
+            cv=cv, language='Breton', status=Status.RUNNING
+        ),
+    ]
+
+    assert prune_translation_jobs_task() == len(expired)
+    assert set(TranslationJob.objects.values_list('pk', flat=True)) == {
+        job.pk for job in kept
+    }
@@ -17,6 +17,31 @@ urlpatterns = [
         views.translate_cv_view,
         name='translate_cv'
     ),
+    path(
+        'cv/<int:cv_id>/translate/zip/',
+        views.translate_cv_zip_view,
+        name='translate_cv_zip'
+    ),
+    path(
+        'cv/<int:cv_id>/translate/jobs/',
+        views.translate_cv_job_view,
+        name='translate_cv_job'
+    ),
+    path(
+        'translation-jobs/<uuid:job_id>/',
+        views.translation_job_status_view,
+        name='translation_job_status'
+    ),
+    path(
+        'translation-jobs/<uuid:job_id>/download/',
+        views.translation_job_download_view,
+        name='translation_job_download'
+    ),
+    path(
+        'pdf-cache/stats/',
+        views.pdf_cache_stats_view,
+        name='pdf_cache_stats'
+    ),
     path('api/', include('main.api.urls')),
 
 ]
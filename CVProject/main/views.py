@@ -1,33 +1,360 @@
 from main.services.cv_utils import (
     generate_cv_pdf_content,
-    serialize_cv_instance,
+    generate_translated_cv_pdf_content,
+    resolve_pdf_backend,
+    translated_cv_pdf_filename,
 )
+from main.services.conditional import (
+    conditional_response,
+    get_cv_version,
+    make_etag,
+)
+from main.api.fast_serializers import (
+    CV_API_FIELDS,
+    CV_VALUE_FIELDS,
+    DOCUMENT_FIELDS,
+    serialize_cv_rows,
+)
+from main.api.filters import (
+    CVSearchFilter,
+    CVSkillFilter,
+    resolve_skill_values,
+    skill_param_values,
+)
+from django.http import (
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from main.services.translation_fanout import (
+    ERRORS_FILENAME,
+    stream_zip,
+    translate_cv_pdfs,
+    translated_zip_files,
+)
+from rest_framework.generics import get_object_or_404 as get_row_or_404
+from main.api.pagination import CVCursorPagination, CVSearchPagination
+from main.services.pdf_cache import pdf_cache_stats, renderer_version
+from main.tasks import send_cv_pdf_email_task, translate_cv_pdf_task
+from main.services.skill_match import match_cvs, skill_match_index
 from django.shortcuts import render, get_object_or_404, redirect
-from main.services.gemini_translate import translate_text
-from django.template.loader import render_to_string
+from main.models import CV, Skill, Project, TranslationJob
+from rest_framework.renderers import BrowsableAPIRenderer
+from main.services.translation_cache import translate_cv
+from rest_framework import serializers, status, viewsets
+from main.services.pagination import keyset_paginate
+from django.core.exceptions import ValidationError
+from django.views.decorators.http import condition
+from main.services.cv_document import cv_documents
+from django.core.validators import validate_email
+from main.services.cv_bulk import bulk_upsert_cvs
+from django.utils.text import get_valid_filename
+from main.api.renderers import FastJSONRenderer
 from main.api.serializers import CVSerializer
-from main.tasks import send_cv_pdf_email_task
-from django.http import HttpResponse
-from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.db.models import Prefetch
 from django.contrib import messages
-from main.models import CV
+from django.db import transaction
+from django.conf import settings
+from django.urls import reverse
+import itertools
 
 
 class CVViewSet(viewsets.ModelViewSet):
     """
     API endpoint that allows CVs to be viewed or edited.
     """
+    prefetches = {
+        'skills': Prefetch('skills', queryset=Skill.objects.order_by('id')),
+        'projects': Prefetch(
+            'projects', queryset=Project.objects.order_by('id')
+        ),
+    }
     queryset = CV.objects.prefetch_related(
-        'skills', 'projects'
+        *prefetches.values()
     ).all().order_by('id')
     serializer_class = CVSerializer
+    pagination_class = CVCursorPagination
+    filter_backends = [CVSearchFilter, CVSkillFilter]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get_requested_fields(self):
+        """Returns the response fields picked by `?fields=` / `?exclude=`.
+
+        Both take comma-separated field names; `exclude` is applied after
+        `fields`. Without either, every field is returned.
+
+        Raises:
+            ValidationError: If a name is not a CV field.
+        """
+        params = self.request.query_params
+        requested = {}
+        for param in ('fields', 'exclude'):
+            names = [
+                name.strip() for name in params.get(param, '').split(',')
+                if name.strip()
+            ]
+            unknown = [name for name in names if name not in CV_API_FIELDS]
+            if unknown:
+                raise serializers.ValidationError({
+                    param: [
+                        f"Unknown field '{name}'. Choose from: "
+                        f"{', '.join(CV_API_FIELDS)}."
+                        for name in unknown
+                    ]
+                })
+            requested[param] = set(names)
+
+        fields = requested['fields'] or set(CV_API_FIELDS)
+        return fields - requested['exclude']
+
+    def get_queryset(self):
+        """Plans the read queryset around the requested fields.
+
+        The read actions load only the selected columns; skills and
+        projects come from the CV's `document`, so nothing is prefetched.
+        """
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'retrieve', 'search', 'match'):
+            return queryset
+
+        fields = self.get_requested_fields()
+        return queryset.prefetch_related(None).only(
+            *self._row_columns(fields)
+        )
+
+    def get_row_queryset(self, *extra):
+        """Returns the filtered CVs as `values()` rows for the read path.
+
+        `extra` names annotations, such as the search `rank`, to include.
+        """
+        return self.filter_queryset(self.get_queryset()).values(
+            *self._row_columns(self.get_requested_fields()), *extra
+        )
+
+    @staticmethod
+    def _row_columns(fields):
+        # The id is always read: pagination relies on it. The version
+        # columns back conditional requests.
+        wanted = {'id', *fields}
+        if wanted.intersection(DOCUMENT_FIELDS):
+            wanted.add('document')
+        return [
+            column for column in CV_VALUE_FIELDS if column in wanted
+        ] + ['version', 'updated_at']
+
+    def list(self, request, *args, **kwargs):
+        """Lists CVs without going through `CVSerializer`.
+
+        The response is built by `serialize_cv_rows` from `values()` rows
+        and has exactly the shape `CVSerializer` would give it, trimmed to
+        the fields picked by `?fields=` / `?exclude=`. The page's ETag
+        covers the ids and versions of its CVs, so `If-None-Match` is
+        answered with a 304 before skills and projects are read.
+        """
+        fields = self.get_requested_fields()
+        queryset = self.get_row_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(serialize_cv_rows(queryset, fields))
+
+        etag = make_etag(
+            'api-list',
+            [(row['id'], row['version']) for row in page],
+            sorted(fields),
+            request.accepted_renderer.format,
+            self.paginator.get_next_link(),
+            self.paginator.get_previous_link(),
+        )
+        return conditional_response(
+            request,
+            lambda: self.get_paginated_response(
+                serialize_cv_rows(page, fields)
+            ),
+            etag
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Returns one CV, built like the list response.
+
+        Sends ETag and Last-Modified from the CV's version and answers
+        matching conditional requests with a 304 before skills, projects
+        and rendering are touched.
+        """
+        fields = self.get_requested_fields()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_row_or_404(
+            self.get_row_queryset(),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        etag = make_etag(
+            'api', row['id'], row['version'], sorted(fields),
+            request.accepted_renderer.format
+        )
+        return conditional_response(
+            request,
+            lambda: Response(serialize_cv_rows([row], fields)[0]),
+            etag,
+            row['updated_at']
+        )
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Full-text search over CVs, best matches first.
+
+        `?q=` takes a web-search style query over names, bio, skills and
+        projects. Results have the list shape plus a `rank`, honour
+        `?fields=` / `?exclude=` and are paginated with `?page=`.
+
+        Returns:
+            Response: A page of ranked CVs, or status 400 without `q`.
+        """
+        # The filter ignores a blank query, which would leave no rank.
+        text = request.query_params.get(CVSearchFilter.search_param, '')
+        if not text.strip():
+            return Response(
+                {'q': ['This query parameter is required.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fields = self.get_requested_fields()
+        queryset = self.get_row_queryset('rank').order_by('-rank', 'id')
+        paginator = CVSearchPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        results = serialize_cv_rows(page, fields)
+        for result, row in zip(results, page):
+            result['rank'] = row['rank']
+        return paginator.get_paginated_response(results)
+
+    @action(detail=False, methods=['get'])
+    def match(self, request):
+        """Ranks CVs against a job's skills, best fit first.
+
+        `?required=` and `?nice=` take comma-separated skill ids or names;
+        `?limit=` caps the results (default `CV_PAGE_SIZE`, at most
+        `CV_MAX_PAGE_SIZE`). CVs are scored by `match_cvs` from the
+        in-memory skill index; results have the list shape plus the
+        `score` and the ids of the `matched_skills`, and honour
+        `?fields=` / `?exclude=`.
+
+        Returns:
+            Response: The ranked CVs, or status 400 when no skill is
+                given, a skill name is unknown or the limit is invalid.
+        """
+        errors = {}
+        skills = {}
+        for param in ('required', 'nice'):
+            try:
+                skill_ids, unknown_names = resolve_skill_values(
+                    skill_param_values(request, param)
+                )
+            except ValueError as e:
+                errors[param] = [str(e)]
+                skills[param] = set()
+                continue
+            skills[param] = skill_ids
+            if unknown_names:
+                errors[param] = [
+                    f"Unknown skills: {', '.join(sorted(unknown_names))}."
+                ]
+        if not errors and not (skills['required'] or skills['nice']):
+            errors['required'] = ['Give at least one skill to match.']
+        try:
+            limit = int(request.query_params.get(
+                'limit', settings.CV_PAGE_SIZE
+            ))
+            if not 1 <= limit <= settings.CV_MAX_PAGE_SIZE:
+                raise ValueError
+        except ValueError:
+            errors['limit'] = [
+                f'Must be a number from 1 to {settings.CV_MAX_PAGE_SIZE}.'
+            ]
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        fields = self.get_requested_fields()
+        columns = self._row_columns(fields)
+        for attempt in range(2):
+            matches = match_cvs(skills['required'], skills['nice'], limit)
+            rows = {
+                row['id']: row
+                for row in self.get_queryset().filter(
+                    pk__in=[cv_id for cv_id, _, _ in matches]
+                ).values(*columns)
+            }
+            missing = [cv_id for cv_id, _, _ in matches if cv_id not in rows]
+            if not missing:
+                break
+            # Deleted since the index last synced: drop them from the index
+            # and rank again, so the next best CVs fill their places.
+            skill_match_index.mark_stale(missing)
+        matches = [match for match in matches if match[0] in rows]
+        results = serialize_cv_rows(
+            [rows[cv_id] for cv_id, _, _ in matches], fields
+        )
+        for result, (_, score, matched) in zip(results, matches):
+            result['score'] = score
+            result['matched_skills'] = matched
+        return Response({'count': len(results), 'results': results})
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """Creates or updates a list of CVs in one request.
+
+        Items with an `id` update that CV, the others are created. Invalid
+        items are skipped and reported; the valid ones are still saved.
+
+        Returns:
+            Response: Per-item results with status 200 when every item was
+                saved, 207 when only some were, and 400 when none were or
+                the payload is not a list of at most `CV_BULK_MAX_ITEMS`.
+        """
+        items = request.data
+        if not isinstance(items, list):
+            return Response(
+                {'detail': 'Expected a list of CVs.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > settings.CV_BULK_MAX_ITEMS:
+            return Response(
+                {
+                    'detail': (
+                        f'At most {settings.CV_BULK_MAX_ITEMS} CVs can be '
+                        f'sent in one request.'
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = bulk_upsert_cvs(items)
+        counts = {
+            outcome: sum(r['status'] == outcome for r in results)
+            for outcome in ('created', 'updated', 'error')
+        }
+        if not counts['error']:
+            response_status = status.HTTP_200_OK
+        elif counts['error'] < len(results):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {
+                'created': counts['created'],
+                'updated': counts['updated'],
+                'failed': counts['error'],
+                'results': results,
+            },
+            status=response_status
+        )
 
 
 def cv_list_view(request):
-    """Renders the main page displaying a list of all CVs.
+    """Renders the main page displaying a page of CVs.
 
-    Retrieves all CV objects from the database, including their related
-    skills and projects, using prefetch_related for efficiency.
+    Retrieves one page of CVs ordered by id using keyset pagination
+    (`?after=<id>` / `?before=<id>`, `?page_size=`). Skills and projects
+    come from each CV's `document`, so the page is read with one query.
 
     Args:
         request: The HttpRequest object.
@@ -35,20 +362,63 @@ def cv_list_view(request):
     Returns:
         HttpResponse: The rendered HTML page displaying the list of CVs.
     """
-    cvs = CV.objects.prefetch_related('skills', 'projects').all()
+    page = keyset_paginate(cv_documents(), request)
     context = {
-        'cvs': cvs
+        'cvs': page['items'],
+        'next_url': page['next_url'],
+        'previous_url': page['previous_url'],
     }
     return render(request, 'main/cv_list.html', context)
 
 
+def _cv_detail_etag(request, cv_id):
+    # The page also shows flash messages, the user and a CSRF token, so
+    # pages with pending messages are never validated and the others vary
+    # with the user and CSRF cookie.
+    version = get_cv_version(request, cv_id)
+    if version is None or len(messages.get_messages(request)):
+        return None
+    return make_etag(
+        'detail', cv_id, version[0], request.user.pk,
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME)
+    )
+
+
+def _cv_detail_last_modified(request, cv_id):
+    if _cv_detail_etag(request, cv_id) is None:
+        return None
+    return get_cv_version(request, cv_id)[1]
+
+
+def _cv_pdf_etag(request, cv_id):
+    version = get_cv_version(request, cv_id)
+    try:
+        backend = resolve_pdf_backend(request.GET.get('renderer'))
+    except ValueError:
+        return None
+    if version is None:
+        return None
+    return make_etag('pdf', cv_id, version[0], renderer_version(backend))
+
+
+def _cv_last_modified(request, cv_id):
+    version = get_cv_version(request, cv_id)
+    return version[1] if version else None
+
+
+@condition(
+    etag_func=_cv_detail_etag, last_modified_func=_cv_detail_last_modified
+)
 def cv_detail_view(request, cv_id):
     """Renders the detail page for a single CV.
 
-    Retrieves a specific CV by its ID, including its related
-    skills and projects, using prefetch_related for efficiency.
+    Retrieves a specific CV by its ID together with its `document`, which
+    holds its skills and projects, in one query.
     If the CV is not found, a 404 error is raised.
 
+    Responses carry an ETag and Last-Modified derived from the CV's
+    version; matching conditional requests get a 304 without rendering.
+
     Args:
         request: The HttpRequest object.
         cv_id (int): The primary key of the CV to display.
@@ -57,10 +427,7 @@ def cv_detail_view(request, cv_id):
         HttpResponse: The rendered HTML page displaying the details of the CV.
                       Raises Http404 if the CV with the given id is not found.
     """
-    cv = get_object_or_404(
-        CV.objects.prefetch_related('skills', 'projects'),
-        pk=cv_id
-    )
+    cv = get_object_or_404(cv_documents(), pk=cv_id)
     context = {
         'cv': cv,
         'is_pdf_export': False
@@ -68,14 +435,19 @@ def cv_detail_view(request, cv_id):
     return render(request, 'main/cv_detail.html', context)
 
 
+@condition(etag_func=_cv_pdf_etag, last_modified_func=_cv_last_modified)
 def cv_pdf_view(request, cv_id):
     """Generates a PDF version of a CV and serves it for download.
 
-    This view retrieves a specific CV by its ID, fetches its related skills
-    and projects efficiently using `prefetch_related`. It then renders the
+    This view retrieves a specific CV by its ID along with its `document`
+    snapshot of skills and projects, in one query. It then renders the
     CV's details using a dedicated HTML template (`main/cv_detail_pdf.html`)
     designed for PDF output. The rendered HTML is converted to a PDF document
-    in memory using the `xhtml2pdf` library (pisa).
+    in memory using the `xhtml2pdf` library (pisa), or drawn directly with
+    ReportLab when that backend is selected by `CV_PDF_BACKEND` or the
+    `?renderer=` query parameter. The ETag covers the CV's version and the
+    renderer's layout, so unchanged PDFs are answered with a 304 without
+    being generated.
 
     Args:
         request: The HttpRequest object.
@@ -86,15 +458,18 @@ def cv_pdf_view(request, cv_id):
             containing the generated PDF data if successful. The
             `Content-Disposition` header is set to suggest a filename for
             download.
-            Returns an HttpResponse with status 500 if PDF generation fails.
+            Returns an HttpResponse with status 400 for an unknown renderer
+            and with status 500 if PDF generation fails.
             Raises Http404 if the CV with the given `cv_id` is not found.
     """
-    cv = get_object_or_404(
-        CV.objects.prefetch_related('skills', 'projects'),
-        pk=cv_id
-    )
+    try:
+        backend = resolve_pdf_backend(request.GET.get('renderer'))
+    except ValueError as e:
+        return HttpResponse(str(e), status=400)
+
+    cv = get_object_or_404(cv_documents(), pk=cv_id)
 
-    pdf_content = generate_cv_pdf_content(cv)
+    pdf_content = generate_cv_pdf_content(cv, backend=backend)
 
     if pdf_content:
         response = HttpResponse(
@@ -111,37 +486,57 @@ def cv_pdf_view(request, cv_id):
         )
 
 
+def pdf_cache_stats_view(request):
+    """Returns the PDF cache hit/miss counters of this process as JSON."""
+    return JsonResponse(pdf_cache_stats())
+
+
 def trigger_send_cv_email_view(request, cv_id):
+    """Queues an email with the CV's PDF attached.
+
+    The PDF is rendered by the Celery worker, so the request only validates
+    the recipient(s) and enqueues the CV id. Several addresses may be given
+    separated by commas.
+
+    Args:
+        request: The HttpRequest object.
+        cv_id (int): The primary key of the CV to send.
+
+    Returns:
+        HttpResponseRedirect: A redirect back to the CV detail page.
+            Raises Http404 if the CV with the given `cv_id` is not found.
+    """
     cv_instance = get_object_or_404(
-        CV.objects.prefetch_related('skills', 'projects'),
+        CV.objects.only('id', 'firstname', 'lastname'),
         pk=cv_id
     )
 
     if request.method == 'POST':
-        recipient_email = request.POST.get('recipient_email')
-        if recipient_email:
-            pdf_content = generate_cv_pdf_content(cv_instance)
-
-            if pdf_content:
+        recipient_emails = [
+            email.strip()
+            for email in request.POST.get('recipient_email', '').split(',')
+            if email.strip()
+        ]
+        if not recipient_emails:
+            messages.error(request, "Please enter recipient email.")
+        else:
+            try:
+                for email in recipient_emails:
+                    validate_email(email)
+            except ValidationError:
+                messages.error(request, "Please enter a valid email.")
+            else:
                 send_cv_pdf_email_task.delay(
-                    cv_instance.id, recipient_email, pdf_content
+                    cv_instance.id, recipient_emails
                 )
                 messages.success(
                     request,
                     (
                         f"{cv_instance.firstname} {cv_instance.lastname}'s CV"
-                        f" was sent to {recipient_email}."
+                        f" will be sent to {', '.join(recipient_emails)}."
                     )
                 )
-            else:
-                messages.error(
-                    request,
-                    "Failed to generate PDF for the CV. Email not sent."
-                )
-        else:
-            messages.error(request, "Please enter recipient email.")
 
-        return redirect('main:cv_detail', cv_id=cv_instance.id)
     return redirect('main:cv_detail', cv_id=cv_instance.id)
 
 
@@ -152,30 +547,192 @@ def translate_cv_view(request, cv_id):
     target_language = request.POST.get('language')
     if not target_language:
         return HttpResponse("No language selected.", status=400)
+    try:
+        backend = resolve_pdf_backend(request.GET.get('renderer'))
+    except ValueError as e:
+        return HttpResponse(str(e), status=400)
 
-    cv_instance = get_object_or_404(
-        CV.objects.prefetch_related('skills', 'projects'),
-        pk=cv_id
-    )
-
-    original_data = serialize_cv_instance(cv_instance)
+    cv_instance = get_object_or_404(cv_documents(), pk=cv_id)
 
-    translated_data = translate_text(original_data, target_language)
+    translated_data = translate_cv(cv_instance, target_language)
     if "error" in translated_data:
         return HttpResponse(translated_data["error"], status=500)
 
-    html = render_to_string(
-        'main/cv_translated_pdf.html', {'cv': translated_data}
+    pdf_content = generate_translated_cv_pdf_content(
+        translated_data, backend=backend
     )
-    pdf_content = generate_cv_pdf_content(html_string=html)
 
     if pdf_content:
-        filename = (
-            f"{translated_data['firstname']}_{translated_data['lastname']}"
-            f"_{target_language}_CV.pdf"
+        filename = translated_cv_pdf_filename(
+            translated_data, target_language
         )
         response = HttpResponse(pdf_content, content_type='application/pdf')
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
         return response
 
     return HttpResponse("Failed to generate PDF.", status=500)
+
+
+def translate_cv_zip_view(request, cv_id):
+    """Translates a CV into several languages and returns a ZIP of PDFs.
+
+    The languages are translated and rendered concurrently (see
+    `translate_cv_pdfs`), so the response takes about as long as the
+    slowest language, and each PDF is streamed as soon as its language is
+    done. Languages that fail, or whose file name clashes with another's,
+    are listed in an `errors.txt` inside the archive.
+
+    Args:
+        request: The HttpRequest object. Expects a POST with `languages`,
+            repeated or comma-separated; `?renderer=` picks the backend.
+        cv_id (int): The primary key of the CV to translate.
+
+    Returns:
+        StreamingHttpResponse: The ZIP archive. Status 405 for non-POST
+            requests, 400 for missing or too many languages or an unknown
+            renderer, and 500 when every language failed. Raises Http404
+            if the CV is not found.
+    """
+    if request.method != 'POST':
+        return HttpResponse("Method not allowed", status=405)
+
+    languages = list(dict.fromkeys(
+        language.strip()
+        for value in request.POST.getlist('languages')
+        for language in value.split(',')
+        if language.strip()
+    ))
+    if not languages:
+        return HttpResponse("No language selected.", status=400)
+    if len(languages) > settings.TRANSLATION_FANOUT_MAX_LANGUAGES:
+        return HttpResponse(
+            f"At most {settings.TRANSLATION_FANOUT_MAX_LANGUAGES} languages "
+            f"can be requested at once.",
+            status=400
+        )
+    try:
+        backend = resolve_pdf_backend(request.GET.get('renderer'))
+    except ValueError as e:
+        return HttpResponse(str(e), status=400)
+
+    cv = get_object_or_404(cv_documents(), pk=cv_id)
+    results = translate_cv_pdfs(
+        cv, languages, backend=backend,
+        workers=settings.TRANSLATION_FANOUT_WORKERS
+    )
+    # PDFs are streamed as their languages finish; only when the first
+    # entry is the error list did every language fail.
+    files = translated_zip_files(results)
+    first = next(files)
+    if first[0] == ERRORS_FILENAME:
+        return HttpResponse(
+            "Failed to translate the CV.\n" + first[1], status=500
+        )
+
+    response = StreamingHttpResponse(
+        stream_zip(itertools.chain([first], files)),
+        content_type='application/zip'
+    )
+    filename = get_valid_filename(
+        f"{cv.firstname}_{cv.lastname}_translations.zip"
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def translate_cv_job_view(request, cv_id):
+    """Queues a translation of a CV and returns the job id right away.
+
+    The translation and PDF rendering run in a Celery worker; clients poll
+    the status URL and fetch the PDF from the download URL once the job has
+    succeeded.
+
+    Args:
+        request: The HttpRequest object. Expects a POST with `language`.
+        cv_id (int): The primary key of the CV to translate.
+
+    Returns:
+        JsonResponse: Status 202 with `job_id`, `status_url` and
+            `download_url`. Status 405 for non-POST requests and 400 when
+            no language is given. Raises Http404 if the CV is not found.
+    """
+    if request.method != 'POST':
+        return HttpResponse("Method not allowed", status=405)
+
+    target_language = request.POST.get('language')
+    if not target_language:
+        return HttpResponse("No language selected.", status=400)
+
+    cv_instance = get_object_or_404(CV.objects.only('id'), pk=cv_id)
+    job = TranslationJob.objects.create(
+        cv=cv_instance, language=target_language
+    )
+    transaction.on_commit(
+        lambda: translate_cv_pdf_task.delay(str(job.id))
+    )
+
+    status_url = reverse('main:translation_job_status', args=[job.id])
+    response = JsonResponse(
+        {
+            'job_id': str(job.id),
+            'status': job.status,
+            'status_url': status_url,
+            'download_url': reverse(
+                'main:translation_job_download', args=[job.id]
+            ),
+        },
+        status=202
+    )
+    response['Location'] = status_url
+    return response
+
+
+def translation_job_status_view(request, job_id):
+    """Returns the state of a translation job as JSON.
+
+    Args:
+        request: The HttpRequest object.
+        job_id (uuid.UUID): The id returned by `translate_cv_job_view`.
+
+    Returns:
+        JsonResponse: The job's `status` and `error`, plus `download_url`
+            once the PDF is ready. Raises Http404 for unknown jobs.
+    """
+    job = get_object_or_404(TranslationJob.objects.defer('pdf'), pk=job_id)
+    data = {
+        'job_id': str(job.id),
+        'cv_id': job.cv_id,
+        'language': job.language,
+        'status': job.status,
+        'error': job.error,
+    }
+    if job.status == TranslationJob.Status.SUCCEEDED:
+        data['download_url'] = reverse(
+            'main:translation_job_download', args=[job.id]
+        )
+    return JsonResponse(data)
+
+
+def translation_job_download_view(request, job_id):
+    """Serves the PDF produced by a finished translation job.
+
+    Args:
+        request: The HttpRequest object.
+        job_id (uuid.UUID): The id returned by `translate_cv_job_view`.
+
+    Returns:
+        HttpResponse: The PDF as an attachment, or a JSON status 409 while
+            the job is still pending, running or has failed. Raises Http404
+            for unknown jobs.
+    """
+    job = get_object_or_404(TranslationJob, pk=job_id)
+    if job.status != TranslationJob.Status.SUCCEEDED:
+        return JsonResponse(
+            {'status': job.status, 'error': job.error}, status=409
+        )
+
+    response = HttpResponse(bytes(job.pdf), content_type='application/pdf')
+    response['Content-Disposition'] = (
+        f'attachment; filename="{job.filename}"'
+    )
+    return response
@@ -11,6 +11,9 @@ if [ "$SERVICE_TYPE" = "web" ]; then
 elif [ "$SERVICE_TYPE" = "celery_worker" ]; then
     echo "Dispatching to celery_setup.sh"
     exec /app/scripts/celery_setup.sh
+elif [ "$SERVICE_TYPE" = "celery_beat" ]; then
+    echo "Dispatching to celery_beat_setup.sh"
+    exec /app/scripts/celery_beat_setup.sh
 else
     echo "Unknown service type: $SERVICE_TYPE"
     echo "Executing command: $@"
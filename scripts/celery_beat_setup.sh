@@ -0,0 +1,5 @@
+#!/bin/bash
+set -e
+
+echo "Starting Celery beat scheduler..."
+exec celery -A CVProject beat --loglevel=info